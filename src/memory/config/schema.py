@@ -71,6 +71,7 @@ class EmbeddingConfig(BaseModel):
     model_name: str = "text-embedding-ada-002"
     api_key: str | None = None
     batch_size: int = Field(default=32, gt=0)
+    max_concurrent_batches: int = Field(default=4, gt=0, description="Embedding batches of one ingest call in flight at once")
     extra_params: dict[str, Any] = Field(default_factory=dict)
 
 
@@ -109,6 +110,7 @@ class VectorStoreConfig(BaseModel):
     connection_string: str | None = None
     collection_name: str = "memory"
     persist_directory: Path | None = None
+    insert_batch_size: int = Field(default=256, gt=0, description="Embeddings buffered across documents before a vector store write")
     extra_params: dict[str, Any] = Field(default_factory=dict)
     bm25: BM25Config = Field(default_factory=BM25Config)
     hybrid_search: HybridSearchConfig = Field(default_factory=HybridSearchConfig)
@@ -193,6 +195,8 @@ class AppConfig(BaseSettings):
     json_logs: bool = False
     data_dir: Path = Field(default=Path.home() / ".memory")
     default_repository: str = "default"
+    ingest_batch_size: int = Field(default=16, gt=0, description="Files whose chunks sync embeds and stores together")
+    ingest_concurrency: int = Field(default=4, gt=0, description="File batches sync ingests concurrently")
 
     # Component configurations
     embedding: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
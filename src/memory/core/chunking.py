@@ -18,6 +18,7 @@ from collections.abc import Iterator
 
 from memory.config.schema import ChunkingConfig
 from memory.core.logging import get_logger
+from memory.core.markdown_chunking import starts_with_h1
 from memory.entities import Chunk, Document, DocumentType
 
 logger = get_logger(__name__)
@@ -106,17 +107,32 @@ def create_chunks(document: Document, config: ChunkingConfig) -> list[Chunk]:
     Returns:
         List of chunks
     """
+    return list(iter_chunks(document, config))
+
+
+def iter_chunks(document: Document, config: ChunkingConfig) -> Iterator[Chunk]:
+    """Yield chunks from a document as they are produced.
+
+    Same strategies and output as create_chunks. Fixed-size chunks are built one
+    at a time as the caller consumes them; the Markdown strategies split the whole
+    document up front and yield from that list.
+
+    Args:
+        document: Document to chunk
+        config: Chunking configuration
+
+    Yields:
+        Chunks in document order
+    """
     # Use regex-based markdown chunking for Markdown documents
     # This provides better control over heading context preservation
     if document.doc_type == DocumentType.MARKDOWN:
         # If document has a title and content doesn't start with H1, prepend title as H1
         # This ensures search results include the filename context
         content = document.content
-        if document.title:
-            first_line = content.lstrip().split("\n")[0] if content else ""
-            if not first_line.startswith("# "):
-                content = f"# {document.title}\n\n{content}"
-                document.content = content
+        if document.title and not starts_with_h1(content):
+            content = f"# {document.title}\n\n{content}"
+            document.content = content
         # Use regex-based markdown chunking
         try:
             from memory.core.markdown_chunking import chunk_markdown_document
@@ -129,7 +145,8 @@ def create_chunks(document: Document, config: ChunkingConfig) -> list[Chunk]:
                     chunk_count=len(chunks),
                     avg_chunk_size=sum(len(c.content) for c in chunks) // len(chunks) if chunks else 0,
                 )
-                return chunks
+                yield from chunks
+                return
         except Exception as e:
             logger.warning(
                 "markdown_chunking_failed",
@@ -149,14 +166,14 @@ def create_chunks(document: Document, config: ChunkingConfig) -> list[Chunk]:
                     chunk_count=len(chunks),
                     avg_chunk_size=sum(len(c.content) for c in chunks) // len(chunks) if chunks else 0,
                 )
-                return chunks
+                yield from chunks
+                return
         except ImportError:
             logger.debug("tree_sitter_not_available")
 
     # Default: Use fixed-size chunking for non-Markdown documents
-
-    # Default: Use fixed-size chunking for non-Markdown documents
-    chunks = []
+    chunk_count = 0
+    total_size = 0
 
     for idx, (text_content, start_char, end_char) in enumerate(
         chunk_text(
@@ -166,7 +183,9 @@ def create_chunks(document: Document, config: ChunkingConfig) -> list[Chunk]:
             config.min_chunk_size,
         )
     ):
-        chunk = Chunk(
+        chunk_count += 1
+        total_size += len(text_content)
+        yield Chunk(
             repository_id=document.repository_id,
             document_id=document.id,
             content=text_content,
@@ -174,14 +193,11 @@ def create_chunks(document: Document, config: ChunkingConfig) -> list[Chunk]:
             start_char=start_char,
             end_char=end_char,
         )
-        chunks.append(chunk)
 
     logger.info(
         "document_chunked",
         document_id=str(document.id),
         document_type=document.doc_type.value if document.doc_type else "unknown",
-        chunk_count=len(chunks),
-        avg_chunk_size=sum(len(c.content) for c in chunks) // len(chunks) if chunks else 0,
+        chunk_count=chunk_count,
+        avg_chunk_size=total_size // chunk_count if chunk_count else 0,
     )
-
-    return chunks
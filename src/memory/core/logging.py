@@ -19,17 +19,22 @@ For audit logging:
     audit.record(command="memory ingest", args=["file.md"], exit_code=0, duration_ms=100)
 """
 
+import atexit
+import getpass
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Optional
 
 import structlog
-from structlog.types import EventDict, Processor
+from structlog.types import Processor
 
 from memory.config.schema import LoggingConfig
 
@@ -69,11 +74,17 @@ class FileLoggerFactory:
         """
         logger = logging.getLogger(name)
         logger.setLevel(self.level)
-        logger.addHandler(self._handler)
+        # logging.getLogger returns the same logger for a name; attach the handler only once
+        if not any(handler is self._handler for handler in logger.handlers):
+            logger.addHandler(self._handler)
         logger.propagate = False
         return logger
 
 
+# Seconds between scans for expired log files by a running handler
+CLEANUP_INTERVAL = 3600
+
+
 class TimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
     """Timed rotating file handler with automatic cleanup."""
 
@@ -87,10 +98,21 @@ class TimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
         """
         super().__init__(filename, when="midnight", interval=1, **kwargs)
         self.max_days = max_days
+        # Monotonic time of the next cleanup; the first emit always cleans up
+        self._next_cleanup = 0.0
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Emit a record and check for cleanup."""
+        """Emit a record, cleaning up old files at most once per CLEANUP_INTERVAL."""
         super().emit(record)
+        now = time.monotonic()
+        if now >= self._next_cleanup:
+            self._next_cleanup = now + CLEANUP_INTERVAL
+            self._cleanup_old_files()
+
+    def doRollover(self) -> None:  # noqa: N802 - overrides the stdlib name
+        """Rotate the log file, then remove rotated files that have expired."""
+        super().doRollover()
+        self._next_cleanup = time.monotonic() + CLEANUP_INTERVAL
         self._cleanup_old_files()
 
     def _cleanup_old_files(self) -> None:
@@ -106,22 +128,71 @@ class TimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
         base_name = os.path.basename(base_path)
 
         # Find and remove old log files
-        cutoff_time = datetime.now(UTC).timestamp() - (self.max_days * 86400)
-
-        for filename in os.listdir(base_dir):
-            if filename.startswith(base_name + "."):
-                file_path = os.path.join(base_dir, filename)
+        cutoff_time = time.time() - self.max_days * 86400
+
+        prefix = base_name + "."
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                # Match the name before touching the file's metadata
+                if not entry.name.startswith(prefix):
+                    continue
                 try:
-                    if os.path.getmtime(file_path) < cutoff_time:
-                        os.remove(file_path)
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.remove(entry.path)
                 except OSError:
                     pass
 
 
-def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add application context to log events."""
-    event_dict["app"] = "memory"
-    return event_dict
+# Arguments of the last configure_logging call, used to skip identical reconfiguration
+_CONFIGURED_KEY: tuple[str, bool, Path | None, int, bool, bool] | None = None
+
+# Name of the stdlib logger that carries audit entries
+AUDIT_LOGGER_NAME = "memory.audit"
+
+# Logging calls only enqueue records; one listener thread writes every log file
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_file_listener: logging.handlers.QueueListener | None = None
+
+# File handlers served by the listener, keyed by sink ("system" or "audit")
+_file_handlers: dict[str, logging.Handler] = {}
+
+
+def _is_system_record(record: logging.LogRecord) -> bool:
+    """Keep audit entries, which share the log queue, out of the system log."""
+    return record.name != AUDIT_LOGGER_NAME
+
+
+def _set_file_handler(sink: str, handler: logging.Handler) -> None:
+    """Install the file handler for a sink and restart the listener to serve it.
+
+    Records already queued are written out first, and the handler it replaces is closed.
+    """
+    global _file_listener
+
+    if _file_listener is not None:
+        _file_listener.stop()
+    previous = _file_handlers.get(sink)
+    if previous is not None:
+        previous.close()
+    _file_handlers[sink] = handler
+    _file_listener = logging.handlers.QueueListener(_log_queue, *_file_handlers.values(), respect_handler_level=True)
+    _file_listener.start()
+
+
+def _stop_file_listener() -> None:
+    """Write out queued records, then stop the log writer thread and close its files."""
+    global _file_listener
+
+    if _file_listener is None:
+        return
+    _file_listener.stop()
+    for handler in _file_handlers.values():
+        handler.close()
+    _file_handlers.clear()
+    _file_listener = None
+
+
+atexit.register(_stop_file_listener)
 
 
 def configure_logging(
@@ -141,24 +212,40 @@ def configure_logging(
         max_days: Number of days to retain log files
         enable_file: Whether to enable file logging
         enable_console: Whether to enable console output (default: False, file-only)
+
+    Raises:
+        ValueError: If level is not a known log level name
     """
+    global _CONFIGURED_KEY
+
+    key = (level.upper(), json_logs, log_dir, max_days, enable_file, enable_console)
+    if key == _CONFIGURED_KEY:
+        # Same settings as the running configuration; keep structlog's logger cache warm
+        return
+
+    log_level = logging.getLevelNamesMapping().get(level.upper())
+    if log_level is None:
+        raise ValueError(f"Invalid log level: {level}")
+
     # Configure standard library logging (console-only mode or file-only mode)
     if enable_console:
         logging.basicConfig(
             format="%(message)s",
             stream=sys.stdout,
-            level=getattr(logging, level.upper()),
+            level=log_level,
         )
 
     # Build processor chain
     processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
-        add_app_context,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
     ]
 
+    # Bind the application context once; merge_contextvars adds it to every event
+    structlog.contextvars.bind_contextvars(app="memory")
+
     if json_logs:
         processors.append(structlog.processors.JSONRenderer())
     else:
@@ -175,11 +262,11 @@ def configure_logging(
 
             # Get root logger and configure handlers
             root_logger = logging.getLogger()
-            root_logger.setLevel(getattr(logging, level.upper()))
+            root_logger.setLevel(log_level)
 
             # Remove existing file handlers to avoid duplicates
             for handler in root_logger.handlers[:]:
-                if isinstance(handler, logging.FileHandler):
+                if isinstance(handler, (logging.FileHandler, logging.handlers.QueueHandler)):
                     root_logger.removeHandler(handler)
 
             # Use rotating file handler for root logger
@@ -188,18 +275,20 @@ def configure_logging(
                 max_days=max_days,
                 encoding="utf-8",
             )
-            file_handler.setLevel(getattr(logging, level.upper()))
+            file_handler.setLevel(log_level)
+            file_handler.addFilter(_is_system_record)
 
-            # Add file handler to root logger
-            root_logger.addHandler(file_handler)
+            # Logging calls only enqueue records; the listener thread writes and rotates the file
+            queue_handler = logging.handlers.QueueHandler(_log_queue)
+            queue_handler.setLevel(log_level)
+            root_logger.addHandler(queue_handler)
+            _set_file_handler("system", file_handler)
 
             # Use standard library logger factory
             logger_factory = structlog.stdlib.LoggerFactory()
 
             # Update wrapper class to use standard library logging
-            wrapper_class = structlog.make_filtering_bound_logger(
-                getattr(logging, level.upper())
-            )
+            wrapper_class = structlog.make_filtering_bound_logger(log_level)
 
             structlog.configure(
                 processors=processors,
@@ -216,6 +305,7 @@ def configure_logging(
                     console_handler.setFormatter(logging.Formatter("%(message)s"))
                     root_logger.addHandler(console_handler)
 
+            _CONFIGURED_KEY = key
             return  # Early return after configuring
         except (OSError, PermissionError) as e:
             # Fallback to console-only if file logging fails
@@ -225,18 +315,20 @@ def configure_logging(
     # Console-only mode (default)
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, level.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
     )
+    _CONFIGURED_KEY = key
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a logger instance for a module.
 
+    Loggers are cached per name, so repeated calls return the same instance.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -262,16 +354,29 @@ class AuditLogger:
         """
         self.log_file = log_file
         self.max_days = max_days
+        # Resolved once; the user cannot change during the process
+        self._default_user = getpass.getuser()
+        # One compact encoder for every entry; default=str covers values JSON cannot represent
+        self._encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str).encode
 
         # Ensure directory exists
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create rotating handler
+        # Create rotating handler, written by the same listener thread as the system log
         self._handler = TimedRotatingFileHandler(
             str(self.log_file),
             max_days=max_days,
             encoding="utf-8",
         )
+        self._handler.addFilter(logging.Filter(AUDIT_LOGGER_NAME))
+        _set_file_handler("audit", self._handler)
+
+        # Entries go through a dedicated logger that only feeds the shared log queue
+        self._logger = logging.getLogger(AUDIT_LOGGER_NAME)
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        if not self._logger.handlers:
+            self._logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
     def record(
         self,
@@ -290,28 +395,18 @@ class AuditLogger:
             duration_ms: Duration in milliseconds (None for command start)
             user: Username
         """
-        import getpass
-
         entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="milliseconds"),
             "command": command,
             "args": args,
             "exit_code": exit_code,
             "duration_ms": duration_ms,
-            "user": user or getpass.getuser(),
+            "user": user or self._default_user,
         }
 
         # Write as JSON line
         try:
-            self._handler.emit(
-                logging.makeLogRecord(
-                    {
-                        "levelno": logging.INFO,
-                        "msg": json.dumps(entry),
-                        "name": "audit",
-                    }
-                )
-            )
+            self._logger.info(self._encode(entry))
         except Exception:
             # Silently fail - audit logging should not crash the app
             pass
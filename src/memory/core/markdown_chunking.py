@@ -18,6 +18,23 @@ from memory.entities import Chunk, Document
 
 logger = get_logger(__name__)
 
+# Leading level-1 heading, allowing a UTF-8 BOM and YAML front-matter before it
+_H1_RE = re.compile(r"\A\ufeff?(?:---\r?\n.*?\r?\n---\r?\n)?\s*# ", re.DOTALL)
+
+
+def starts_with_h1(content: str) -> bool:
+    """Check whether content opens with a level-1 Markdown heading.
+
+    A leading BOM, YAML front-matter block and whitespace are skipped.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        True if the first heading-bearing line is an H1
+    """
+    return _H1_RE.match(content) is not None
+
 
 class MarkdownChunk:
     """Represents a semantic chunk in a Markdown document."""
@@ -348,12 +365,9 @@ def chunk_markdown_document(document: Document, config: ChunkingConfig) -> list[
     """
     # If document has a title and content doesn't start with H1, prepend title as H1
     content = document.content
-    if document.title:
-        # Check if content already starts with a level 1 heading
-        first_line = content.lstrip().split("\n")[0] if content else ""
-        if not first_line.startswith("# "):
-            # Prepend title as H1
-            content = f"# {document.title}\n\n{content}"
+    if document.title and not starts_with_h1(content):
+        # Prepend title as H1
+        content = f"# {document.title}\n\n{content}"
 
     # Parse into semantic sections
     semantic_chunks = parse_markdown_sections(content)
@@ -3,22 +3,26 @@
 This module contains pure domain entities without business logic:
 - Repository: A logical container for organizing documents
 - Document: A source document (file, webpage, etc.)
+- DocumentSummary: A document's fields with a content preview instead of full text
 - Chunk: A segment of a document suitable for embedding
 - Embedding: A vector representation of a chunk
+- EmbeddingVectors: Raw vectors for several chunks, as lists or a 2-D array
 - SearchResult: A retrieved chunk with relevance score
 """
 
 from memory.entities.chunk import Chunk
-from memory.entities.document import Document, DocumentType
-from memory.entities.embedding import Embedding
+from memory.entities.document import Document, DocumentSummary, DocumentType
+from memory.entities.embedding import Embedding, EmbeddingVectors
 from memory.entities.repository import Repository
 from memory.entities.search_result import SearchResult
 
 __all__ = [
     "Chunk",
     "Document",
+    "DocumentSummary",
     "DocumentType",
     "Embedding",
+    "EmbeddingVectors",
     "Repository",
     "SearchResult",
 ]
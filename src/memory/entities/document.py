@@ -43,3 +43,78 @@ class Document(BaseModel):
         if not v or not v.strip():
             raise ValueError("Document content cannot be empty")
         return v
+
+    @property
+    def display_name(self) -> str:
+        """Name shown to users: the title, or the source path when untitled."""
+        return self.title or self.source_path
+
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "Document":
+        """Build a document from fields that already have the right types, skipping validation.
+
+        Meant for hot paths such as sync, where every field is produced by the
+        application itself. Defaults are still filled in and the non-empty content
+        check is kept; type coercion is not performed.
+
+        Args:
+            **fields: Document field values
+
+        Returns:
+            The constructed document
+
+        Raises:
+            ValueError: If the content is empty
+        """
+        content = fields.get("content")
+        if not content or not content.strip():
+            raise ValueError("Document content cannot be empty")
+        return cls.model_construct(**fields)
+
+
+class DocumentSummary(BaseModel):
+    """A document's descriptive fields with only a prefix of its content.
+
+    Used for listings and info views that do not need the full text.
+    """
+
+    id: UUID
+    repository_id: UUID
+    source_path: str
+    relative_path: str = ""
+    doc_type: DocumentType = DocumentType.UNKNOWN
+    title: str | None = None
+    content_length: int = Field(..., ge=0, description="Length of the full content in characters")
+    content_preview: str = Field(default="", description="Leading part of the content")
+    created_at: datetime
+    updated_at: datetime
+
+    @property
+    def display_name(self) -> str:
+        """Name shown to users: the title, or the source path when untitled."""
+        return self.title or self.source_path
+
+    @classmethod
+    def from_document(cls, document: Document, preview_chars: int | None = 500) -> "DocumentSummary":
+        """Summarize a loaded document.
+
+        Args:
+            document: Document to summarize
+            preview_chars: Number of leading characters to keep, or None for all
+
+        Returns:
+            DocumentSummary of the document
+        """
+        content = document.content
+        return cls(
+            id=document.id,
+            repository_id=document.repository_id,
+            source_path=document.source_path,
+            relative_path=document.relative_path,
+            doc_type=document.doc_type,
+            title=document.title,
+            content_length=len(content),
+            content_preview=content if preview_chars is None else content[:preview_chars],
+            created_at=document.created_at,
+            updated_at=document.updated_at,
+        )
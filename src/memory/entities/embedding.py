@@ -1,11 +1,19 @@
 """Embedding entity - represents a vector representation of a chunk."""
 
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeAlias
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Vectors as produced by embedding providers: one per text, as lists or the rows of a 2-D array
+EmbeddingVectors: TypeAlias = "Sequence[Sequence[float]] | NDArray[np.floating[Any]]"
+
 
 class Embedding(BaseModel):
     """A vector representation of a chunk.
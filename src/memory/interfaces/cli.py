@@ -12,53 +12,224 @@ Commands:
 
 import asyncio
 import atexit
+import codecs
 import datetime as dt
+import hashlib
+import io
 import json
+import os
 import sys
 import time
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from enum import StrEnum
-from functools import wraps
+from functools import cache, lru_cache, wraps
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
+from uuid import UUID, uuid4
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
-
-from memory.config.loader import get_default_config_path, load_config
-from memory.config.schema import AppConfig
-from memory.core.logging import (
-    configure_from_config,
-    get_audit_logger,
-    get_logger,
-)
-from memory.entities import SearchResult
+
+if TYPE_CHECKING:
+    # The config, entity and storage layers pull in pydantic and structlog, so they are
+    # imported by the commands that need them to keep `memory --help` fast
+    from memory.config.schema import AppConfig
+    from memory.entities import DocumentType, SearchResult
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = typer.Typer(
     name="memory",
     help="Personal knowledge base with semantic search and LLM-based QA",
     add_completion=False,
+    no_args_is_help=True,
 )
 
 console = Console()
-logger = get_logger(__name__)
+# For output of user data (document text, titles, table rows): no markup parsing or
+# highlighting, so brackets in content print literally and repeated lines are cheap
+plain_console = Console(markup=False, highlight=False)
+
+
+@lru_cache(maxsize=1)
+def _get_logger():
+    """Get the module logger, importing the logging stack on first use."""
+    from memory.core.logging import get_logger
+
+    return get_logger(__name__)
+
+
+# File extensions read as text by sync when a repository has no document types configured
+TEXT_EXTS = frozenset(
+    {
+        ".md",
+        ".markdown",
+        ".txt",
+        ".rst",
+        ".py",
+        ".js",
+        ".ts",
+        ".json",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".cfg",
+        ".ini",
+        ".csv",
+        ".html",
+        ".htm",
+        ".xml",
+    }
+)
+
+# Number of concurrent file readers feeding the sync ingest stage
+SYNC_READERS = 8
+
+# Block size used when sync reads, decodes and hashes a file
+READ_BLOCK_BYTES = 64 * 1024
+
+# Leading bytes of a file inspected to tell text from binary content
+SNIFF_BYTES = 8192
+
+# Control bytes that do not occur in text files (tab, newlines, form feed and escape are allowed)
+_BINARY_BYTES = bytes(set(range(32)) - {8, 9, 10, 12, 13, 27}) + b"\x7f"
+
+# Tables with more rows than this are streamed line by line instead of laid out as a Rich Table
+STREAM_TABLE_ROWS = 200
+
+# Format for timestamps shown in tables
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
 
 # Global config (loaded lazily)
-_config: AppConfig | None = None
+_config: "AppConfig | None" = None
 
 # Audit state
 _audit_state: dict = {}
 
 
-def get_config() -> AppConfig:
+class StoreBundle(NamedTuple):
+    """Initialized metadata and vector stores shared by commands in one process.
+
+    The vector store is None until a command that needs it has opened it.
+    """
+
+    metadata_store: Any
+    vector_store: Any | None
+
+    async def aclose(self) -> None:
+        """Close the opened stores concurrently, logging rather than raising errors."""
+        stores = [store for store in self if store is not None]
+        results = await asyncio.gather(*(store.close() for store in stores), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                _get_logger().warning("store_close_error", error=str(result))
+
+
+# Store bundles keyed by their (metadata_store, vector_store) storage configuration
+_store_cache: dict[tuple[str, str], StoreBundle] = {}
+
+
+def _get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return a faster event loop factory (uvloop/winloop) when one is installed."""
+    try:
+        if sys.platform == "win32":
+            import winloop
+
+            return winloop.new_event_loop
+        import uvloop
+
+        return uvloop.new_event_loop
+    except ImportError:
+        return None
+
+
+_loop_factory = _get_loop_factory()
+
+# Runner whose event loop is shared by every run_async call until _shutdown_runner
+_runner: asyncio.Runner | None = None
+
+
+def run_async(coro: Any) -> Any:
+    """Run a coroutine to completion on the shared event loop.
+
+    The loop (uvloop/winloop when available) is created on first use and reused,
+    so a command and the store cleanup after it run on the same loop.
+    """
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner(loop_factory=_loop_factory)
+    return _runner.run(coro)
+
+
+def _shutdown_runner() -> None:
+    """Close cached stores, then the shared event loop."""
+    global _runner
+    if _runner is None:
+        return
+    try:
+        if _store_cache:
+            _runner.run(close_cached_stores())
+    finally:
+        _runner.close()
+        _runner = None
+
+
+@app.callback()
+def main(ctx: typer.Context) -> None:
+    """Personal knowledge base with semantic search and LLM-based QA."""
+    # Stores are shared across commands, so close them once the command has run.
+    # This must happen before interpreter shutdown: aiosqlite runs a non-daemon
+    # worker thread that would otherwise block exit before atexit handlers run.
+    ctx.call_on_close(_shutdown_runner)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_json(data: dict[str, Any], stream_key: str | None = None, items: Iterable[Any] = ()) -> None:
+    """Write a JSON object to stdout.
+
+    When stream_key is given, items are encoded one at a time and written as the
+    array under that key after the other fields, so the whole list is never built.
+
+    Args:
+        data: Fields of the JSON object
+        stream_key: Optional key for the streamed array
+        items: Array elements written under stream_key
+    """
+    # Flush pending console output so it does not interleave with the raw writes
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    body = _dump_json(data)
+    if stream_key is None:
+        out.write(body + b"\n")
+        out.flush()
+        return
+
+    # Reopen the encoded object and append the array as its last field
+    out.write(body[:-2] + b",\n" if data else b"{\n")
+    out.write(b"  " + _dump_json(stream_key) + b": [")
+    separator = b"\n"
+    for item in items:
+        out.write(separator + b"\n".join(b"    " + line for line in _dump_json(item).split(b"\n")))
+        separator = b",\n"
+    out.write(b"\n  ]\n}\n" if separator == b",\n" else b"]\n}\n")
+    out.flush()
+
+
+def get_config() -> "AppConfig":
     """Get or create the global config instance."""
     global _config
     if _config is None:
-        _config = load_config()
-        # Configure logging from config
-        configure_from_config(_config.logging)
+        _config = _load_config(None)
     return _config
 
 
@@ -72,6 +243,8 @@ def _record_audit_start(command: str, args: list[str]) -> None:
         return  # Config not loaded yet
 
     try:
+        from memory.core.logging import get_audit_logger
+
         audit = get_audit_logger(
             log_dir=get_config().logging.log_dir,
             max_days=get_config().logging.max_days,
@@ -99,6 +272,8 @@ def _record_audit_end(exit_code: int) -> None:
     duration_ms = int((time.time() - _audit_state.get("start_time", time.time())) * 1000)
 
     try:
+        from memory.core.logging import get_audit_logger
+
         audit = get_audit_logger(
             log_dir=get_config().logging.log_dir,
             max_days=get_config().logging.max_days,
@@ -126,7 +301,6 @@ def audit_hook(func):
     command_name = func.__name__.replace("_async", "")
 
     # Check if it's an async function
-    import asyncio
     if asyncio.iscoroutinefunction(func):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
@@ -171,9 +345,6 @@ def audit_hook(func):
                 _record_audit_end(1)
                 raise
         return wrapper
-        return async_wrapper
-
-    return wrapper
 
 
 def audit_command(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -191,6 +362,8 @@ def audit_command(func: Callable[..., Any]) -> Callable[..., Any]:
 
         # Get audit logger
         config = get_config()
+        from memory.core.logging import get_audit_logger
+
         audit = get_audit_logger(
             log_dir=config.logging.log_dir,
             max_days=config.logging.max_days,
@@ -233,7 +406,41 @@ class OutputFormat(StrEnum):
     MARKDOWN = "markdown"
 
 
-def render_search_results_json(results: list[SearchResult], query: str) -> str:
+def _print_table(title: str, columns: list[dict[str, Any]], rows: Iterable[tuple[str, ...]], row_count: int) -> None:
+    """Print rows as a Rich table, or stream them as plain lines when there are many.
+
+    Rich lays out a whole Table before printing it. Above STREAM_TABLE_ROWS rows,
+    a header is printed and each row is written as soon as it is produced.
+
+    Args:
+        title: Table title
+        columns: Keyword arguments for Table.add_column, one dict per column
+        rows: Cell values for each row
+        row_count: Number of rows, used to pick the output mode
+    """
+    if row_count > STREAM_TABLE_ROWS:
+        console.rule(title)
+        plain_console.print(" | ".join(column["header"] for column in columns), style="bold")
+        for row in rows:
+            plain_console.print(" | ".join(cell.replace("\n", " ") for cell in row))
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title)
+    for column in columns:
+        table.add_column(**column)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def _preview(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking truncation with "..."."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def render_search_results_json(results: list["SearchResult"], query: str) -> str:
     """Render search results as JSON.
 
     Args:
@@ -261,7 +468,7 @@ def render_search_results_json(results: list[SearchResult], query: str) -> str:
     return json.dumps(output, ensure_ascii=False, indent=2)
 
 
-def render_search_results_markdown(results: list[SearchResult], query: str) -> str:
+def render_search_results_markdown(results: list["SearchResult"], query: str) -> str:
     """Render search results as Markdown table.
 
     Args:
@@ -283,9 +490,7 @@ def render_search_results_markdown(results: list[SearchResult], query: str) -> s
 
     for i, result in enumerate(results, 1):
         doc_title = result.document.title if result.document else "Unknown"
-        content = result.chunk.content[:100].replace("\n", " ")
-        if len(result.chunk.content) > 100:
-            content += "..."
+        content = _preview(result.chunk.content, 100).replace("\n", " ")
         lines.append(f"| {i} | {result.score:.4f} | {doc_title} | {content} |")
 
     lines.extend(["", "## Sources", ""])
@@ -298,7 +503,7 @@ def render_search_results_markdown(results: list[SearchResult], query: str) -> s
     return "\n".join(lines)
 
 
-def render_search_results_text(results: list[SearchResult], query: str) -> str:
+def render_search_results_text(results: list["SearchResult"], query: str) -> str:
     """Render search results as plain text.
 
     Args:
@@ -315,9 +520,7 @@ def render_search_results_text(results: list[SearchResult], query: str) -> str:
 
     for i, result in enumerate(results, 1):
         doc_title = result.document.title if result.document else "Unknown"
-        content = result.chunk.content[:200].replace("\n", " ")
-        if len(result.chunk.content) > 200:
-            content += "..."
+        content = _preview(result.chunk.content, 200).replace("\n", " ")
         lines.append(f"{i}. Score: {result.score:.4f}")
         lines.append(f"   Document: {doc_title}")
         lines.append(f"   Content: {content}")
@@ -326,7 +529,58 @@ def render_search_results_text(results: list[SearchResult], query: str) -> str:
     return "\n".join(lines)
 
 
-async def _ensure_default_repository(config: AppConfig, require_default_repo: bool = True):
+async def _get_stores(config: "AppConfig", need_vector: bool = True) -> StoreBundle:
+    """Get initialized metadata and vector stores for a configuration.
+
+    Stores are opened once per storage configuration and reused by every later
+    command in the same process. They are closed by close_cached_stores, which
+    the CLI runs when the invoked command finishes.
+
+    Args:
+        config: Application configuration
+        need_vector: If False, the vector store is not opened unless an earlier
+            command already opened it
+
+    Returns:
+        StoreBundle, which unpacks as (metadata_store, vector_store)
+    """
+    from memory.storage import create_metadata_store, create_vector_store
+
+    key = (config.metadata_store.model_dump_json(), config.vector_store.model_dump_json())
+    stores = _store_cache.get(key) or StoreBundle(None, None)
+
+    opening = {}
+    if stores.metadata_store is None:
+        opening["metadata_store"] = create_metadata_store(config.metadata_store)
+    if need_vector and stores.vector_store is None:
+        opening["vector_store"] = create_vector_store(config.vector_store)
+    if not opening:
+        return stores
+
+    # The backends are independent, so initialize them concurrently
+    results = await asyncio.gather(*(store.initialize() for store in opening.values()), return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        # Close whatever did open so a failed command does not leak it
+        await asyncio.gather(
+            *(store.close() for store, result in zip(opening.values(), results) if not isinstance(result, BaseException)),
+            return_exceptions=True,
+        )
+        raise errors[0]
+
+    stores = _store_cache[key] = stores._replace(**opening)
+    _get_logger().debug("stores_opened", stores=list(opening), cached=len(_store_cache))
+    return stores
+
+
+async def close_cached_stores() -> None:
+    """Close and forget all stores opened by _get_stores."""
+    bundles = list(_store_cache.values())
+    _store_cache.clear()
+    await asyncio.gather(*(bundle.aclose() for bundle in bundles))
+
+
+async def _ensure_default_repository(config: "AppConfig", require_default_repo: bool = True, *, need_vector: bool = True):
     """Ensure default repository exists.
 
     This function initializes the metadata and vector stores,
@@ -335,60 +589,200 @@ async def _ensure_default_repository(config: AppConfig, require_default_repo: bo
     Args:
         config: Application configuration
         require_default_repo: If True, require default repository to exist. If False, allow None.
+        need_vector: If False, skip opening the vector store for commands that only
+            read metadata; the returned vector store may then be None
 
     Returns:
         Tuple of (metadata_store, vector_store, repository)
     """
-    from memory.service import RepositoryManager
-    from memory.storage import create_metadata_store, create_vector_store
-
-    # Create stores using factory functions
     try:
-        metadata_store = create_metadata_store(config.metadata_store)
-        vector_store = create_vector_store(config.vector_store)
-
-        await metadata_store.initialize()
-        await vector_store.initialize()
-
+        metadata_store, vector_store = await _get_stores(config, need_vector=need_vector)
     except Exception as e:
         console.print(f"[red]Error initializing stores: {str(e)}[/red]")
         raise typer.Exit(1)
 
+    from memory.service import RepositoryManager
+
     # Ensure default repository exists
     repo_manager = RepositoryManager(metadata_store, vector_store)
 
     if require_default_repo:
         repository = await repo_manager.ensure_default_repository(config.default_repository)
-        logger.info("default_repository_ensured", repository_name=repository.name)
+        _get_logger().info("default_repository_ensured", repository_name=repository.name)
     else:
         # Try to get default repository, don't create if not exists
         repository = await repo_manager.get_repository_by_name(config.default_repository)
         if repository:
-            logger.info("default_repository_found", repository_name=repository.name)
+            _get_logger().info("default_repository_found", repository_name=repository.name)
         else:
-            logger.info("default_repository_not_required", reason="sync command doesn't require default repo")
+            _get_logger().info("default_repository_not_required", reason="sync command doesn't require default repo")
 
     return metadata_store, vector_store, repository
 
 
+def _default_or_named_repository(default_repo: Any, config: "AppConfig", repo_name: str) -> Any:
+    """Return the already-fetched default repository when it is the one requested.
+
+    Saves a repository lookup for commands that fall back to the default repository.
+    Returns None when the caller still has to look the repository up by name.
+    """
+    if default_repo is not None and repo_name == config.default_repository:
+        return default_repo
+    return None
+
+
+def _fmt_local(ts: dt.datetime | None) -> str:
+    """Format a stored UTC timestamp in local time, or "-" when missing."""
+    if ts is None:
+        return "-"
+    # astimezone() without an argument picks the local offset for ts itself, so DST is respected
+    return ts.replace(tzinfo=dt.UTC).astimezone().strftime(_TS_FMT)
+
+
+def _sum_min_max(values: Iterable[int]) -> tuple[int, int, int]:
+    """Compute sum, minimum and maximum of non-empty values in a single pass."""
+    it = iter(values)
+    total = lo = hi = next(it)
+    for value in it:
+        total += value
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    return total, lo, hi
+
+
+def _chunk_size_stats(chunks: list) -> tuple[int, int, int]:
+    """Compute total, minimum and maximum content length of chunks.
+
+    Uses a single NumPy reduction pass when NumPy is installed.
+
+    Args:
+        chunks: Chunks to measure
+
+    Returns:
+        Tuple of (total_size, min_size, max_size), all 0 for no chunks
+    """
+    if not chunks:
+        return 0, 0, 0
+    try:
+        import numpy as np
+    except ImportError:
+        return _sum_min_max(len(chunk.content) for chunk in chunks)
+
+    sizes = np.fromiter((len(chunk.content) for chunk in chunks), dtype=np.int64, count=len(chunks))
+    return int(sizes.sum()), int(sizes.min()), int(sizes.max())
+
+
+def _prepare_ingest_content(path: Path, raw_text: str) -> tuple[str, "DocumentType", str]:
+    """Normalize file text the way sync stores it.
+
+    The filename is injected as an H1 heading for better embeddings, the
+    document type is derived from the extension, and the result is hashed.
+
+    Args:
+        path: Source file path
+        raw_text: File content as read from disk
+
+    Returns:
+        Tuple of (content, doc_type, content_md5)
+    """
+    from memory.entities import DocumentType
+
+    content = f"# {path.stem}\n\n{raw_text}"
+    doc_type = DocumentType.MARKDOWN if path.suffix.lower() in (".md", ".markdown") else DocumentType.TEXT
+    content_md5 = hashlib.md5(content.encode("utf-8")).hexdigest()
+    return content, doc_type, content_md5
+
+
+def _iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield directory entries for all files under root, recursively.
+
+    Uses os.scandir so file/directory checks come from the directory listing
+    instead of a stat call per path. Symlinked directories are not followed,
+    and directories that cannot be read are skipped.
+    """
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except PermissionError:
+            continue
+
+
+def _is_probably_text(data: bytes) -> bool:
+    """Guess whether a file's leading bytes are text rather than binary content.
+
+    Data with a NUL byte, or with more than 30% control bytes, is treated as binary.
+    Bytes above 0x7f count as text so UTF-8 content in any language passes.
+    """
+    if b"\x00" in data:
+        return False
+    return len(data.translate(None, _BINARY_BYTES)) >= len(data) * 0.7
+
+
+def _read_ingest_file(path: Path, block_size: int = READ_BLOCK_BYTES) -> tuple[str, "DocumentType", str]:
+    """Read a file and normalize it like _prepare_ingest_content, one block at a time.
+
+    Blocks are decoded (with universal newlines, as read_text does) and hashed as
+    they are read, so neither the raw file bytes nor a re-encoded copy of the
+    whole content is held in memory alongside the text.
+
+    Args:
+        path: Source file path
+        block_size: Bytes read per block
+
+    Returns:
+        Tuple of (content, doc_type, content_md5)
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8 or its first block looks binary
+    """
+    from memory.entities import DocumentType
+
+    header = f"# {path.stem}\n\n"
+    digest = hashlib.md5(header.encode("utf-8"))
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    parts = [header]
+
+    with open(path, "rb") as f:
+        block = f.read(block_size)
+        # Reject binary files on their first block instead of decoding them in full
+        if not _is_probably_text(block[:SNIFF_BYTES]):
+            raise UnicodeDecodeError("utf-8", block[:SNIFF_BYTES], 0, 1, "binary content")
+        while block:
+            text = decoder.decode(block)
+            digest.update(text.encode("utf-8"))
+            parts.append(text)
+            block = f.read(block_size)
+    text = decoder.decode(b"", final=True)
+    digest.update(text.encode("utf-8"))
+    parts.append(text)
+
+    doc_type = DocumentType.MARKDOWN if path.suffix.lower() in (".md", ".markdown") else DocumentType.TEXT
+    return "".join(parts), doc_type, digest.hexdigest()
+
 
 @app.command()
 def sync(
     repository: str = typer.Option(..., "--repository", "-r", help="Repository name (required)"),
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
     force: bool = typer.Option(False, "--force", "-f", help="Force reimport of all files"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress per-file output and only print the summary"),
 ):
     """Sync documents from repository root directory into the knowledge base."""
     # Record audit start
     _record_audit_start("sync", [repository])
-    asyncio.run(_sync_async(repository, config_file, force))
+    run_async(_sync_async(repository, config_file, force, quiet))
 
 
-async def _sync_async(repository: str, config_file: Path | None, force: bool):
+async def _sync_async(repository: str, config_file: Path | None, force: bool, quiet: bool = False):
     """Async implementation of sync command."""
-    # Import DocumentType at function level to avoid scope issues
-    from memory.entities import Document, DocumentType
-
     # Load configuration
     config = _load_config(config_file)
 
@@ -399,10 +793,11 @@ async def _sync_async(repository: str, config_file: Path | None, force: bool):
     # Ensure default repository exists
     metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
 
-    # Get the repository object
     from memory.service import RepositoryManager
+
+    # Get the repository object
     repo_manager = RepositoryManager(metadata_store, vector_store)
-    repo = await repo_manager.get_repository_by_name(repository)
+    repo = _default_or_named_repository(default_repo, config, repository) or await repo_manager.get_repository_by_name(repository)
 
     if not repo:
         console.print(f"[red]Repository '{repository}' not found[/red]")
@@ -432,6 +827,7 @@ async def _sync_async(repository: str, config_file: Path | None, force: bool):
         return
 
     # Initialize ingestion pipeline
+    from memory.entities import Document
     from memory.pipelines.ingestion import IngestionPipeline
 
     try:
@@ -441,39 +837,48 @@ async def _sync_async(repository: str, config_file: Path | None, force: bool):
             vector_store=vector_store,
             metadata_store=metadata_store,
             repository_id=repo.id,
+            buffer_embeddings=True,
         )
 
         # Get existing documents for this repository
         existing_docs = await metadata_store.list_documents(repository_id=repo.id, limit=10000)
         existing_by_relative_path = {doc.relative_path: doc for doc in existing_docs}
 
-        # Collect files to sync from repository root
-        files_to_sync = []
-
         # Use document_types for filtering (e.g., ["md", "json"] means only import .md and .json files)
         # Default to ["md"] if not specified
         document_types = repo.document_types or ["md"]
 
-        def match_document_types(file_path: Path) -> bool:
-            """Check if file matches the document types."""
-            if not document_types:
-                return True
-            # Match by file extension (e.g., .md, .json)
-            file_ext = file_path.suffix.lower().lstrip(".")
-            return file_ext in document_types
-
-        # Scan root_path recursively
-        for file_path in repo.root_path.rglob("*"):
-            if file_path.is_file() and match_document_types(file_path):
-                files_to_sync.append(file_path)
+        def match_document_types(file_ext: str) -> bool:
+            """Check if a lower-cased file extension matches the document types."""
+            if document_types:
+                # Configured types are honored as given; binary files among them are
+                # rejected when read, see _read_ingest_file
+                return file_ext.lstrip(".") in document_types
+            # Skip binary files up front instead of reading them and failing on decode
+            return file_ext in TEXT_EXTS
+
+        def scan_files() -> dict[Path, int]:
+            """Collect matching files under root_path with their sizes."""
+            sizes = {}
+            for entry in _iter_files(repo.root_path):
+                if match_document_types(os.path.splitext(entry.name)[1].lower()):
+                    sizes[Path(entry.path)] = entry.stat().st_size
+            return sizes
+
+        # Scan root_path recursively off the event loop, caching each file's size
+        file_sizes = await asyncio.to_thread(scan_files)
+        files_to_sync = list(file_sizes)
 
         if not files_to_sync:
             console.print(f"[yellow]No files found in repository root: {repo.root_path}[/yellow]")
             return
 
+        # Process largest files first so the long tail of small files finishes last
+        files_to_sync.sort(key=file_sizes.__getitem__, reverse=True)
+
         total_files = len(files_to_sync)
-        console.print(f"[cyan]Syncing {total_files} file(s) from repository '{repository}' root: {repo.root_path}[/cyan]")
-        console.print()
+        if not quiet:
+            console.print(f"[cyan]Syncing {total_files} file(s) from repository '{repository}' root: {repo.root_path}[/cyan]\n")
 
         # Track file states
         added_count = 0
@@ -482,179 +887,171 @@ async def _sync_async(repository: str, config_file: Path | None, force: bool):
         deleted_count = 0
         error_count = 0
 
-        # Process files
-        files_processed = set()
-
-        # Use progress bar for multiple files
-        if total_files > 1:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console,
-            ) as progress:
-                main_task = progress.add_task(
-                    f"Processing {total_files} files...",
-                    total=total_files,
-                )
-
-                for file_path in files_to_sync:
-                    progress.update(main_task, description=f"Processing: {file_path.name}")
-
-                    try:
-                        # Calculate relative path
-                        rel_path = str(file_path.relative_to(repo.root_path))
-                        files_processed.add(rel_path)
-
-                        # Read file content
-                        content = file_path.read_text(encoding="utf-8")
-
-                        # Inject filename as heading into content for better embedding
-                        filename_title = file_path.stem
-                        file_ext = file_path.suffix.lower()
-
-                        # Detect document type and inject filename as heading
-                        if file_ext in (".md", ".markdown"):
-                            content = f"# {filename_title}\n\n{content}"
-                            doc_type = DocumentType.MARKDOWN
-                        else:
-                            content = f"# {filename_title}\n\n{content}"
-                            doc_type = DocumentType.TEXT
-
-                        # Calculate MD5 hash
-                        import hashlib
-                        content_md5 = hashlib.md5(content.encode("utf-8")).hexdigest()
-
-                        # Check if document exists
-                        existing_doc = existing_by_relative_path.get(rel_path)
-
-                        if existing_doc:
-                            # Check if content changed
-                            if existing_doc.content_md5 == content_md5 and not force:
-                                # Content unchanged, skip
-                                skipped_count += 1
-                                continue
-
-                            # Content changed or force flag, update document
-                            # Delete old document first
-                            await pipeline.delete_document(existing_doc.id)
-
-                            # Create new document
-                            document = Document(
-                                repository_id=repo.id,
-                                source_path=str(file_path),
-                                relative_path=rel_path,
-                                doc_type=doc_type,
-                                title=filename_title,
-                                content=content,
-                                content_md5=content_md5,
-                                metadata={"file_size": file_path.stat().st_size},
-                            )
-
-                            result = await pipeline.ingest_document(document, force=True)
-                            updated_count += 1
-
-                        else:
-                            # New document
-                            document = Document(
-                                repository_id=repo.id,
-                                source_path=str(file_path),
-                                relative_path=rel_path,
-                                doc_type=doc_type,
-                                title=filename_title,
-                                content=content,
-                                content_md5=content_md5,
-                                metadata={"file_size": file_path.stat().st_size},
-                            )
-
-                            result = await pipeline.ingest_document(document, force=True)
-                            added_count += 1
-
-                    except UnicodeDecodeError:
-                        error_count += 1
-                    except Exception as e:
-                        error_count += 1
-                        logger.error("sync_error", file=str(file_path), error=str(e))
-
-                    progress.advance(main_task)
-
-        else:
-            # Single file
-            file_path = files_to_sync[0]
-            try:
-                console.print(f"  Processing: {file_path}")
-
-                # Calculate relative path
-                rel_path = str(file_path.relative_to(repo.root_path))
-                files_processed.add(rel_path)
-
-                # Read file content
-                content = file_path.read_text(encoding="utf-8")
-
-                # Inject filename as heading
-                filename_title = file_path.stem
-                file_ext = file_path.suffix.lower()
-
-                if file_ext in (".md", ".markdown"):
-                    content = f"# {filename_title}\n\n{content}"
-                    doc_type = DocumentType.MARKDOWN
-                else:
-                    content = f"# {filename_title}\n\n{content}"
-                    doc_type = DocumentType.TEXT
+        # Every scanned file counts as processed, so a failed read never deletes its stored document
+        files_processed = {str(file_path.relative_to(repo.root_path)) for file_path in files_to_sync}
+        # Per-file status lines are buffered and rendered in a single print
+        status_lines: list[str] = []
+        # A single-file sync reports its result; larger syncs show a progress bar instead
+        report_files = total_files == 1
+
+        # Files flow through two stages: readers load and normalize files off the
+        # event loop while up to ingest_concurrency workers embed and store batches
+        path_queue: asyncio.Queue[Path] = asyncio.Queue()
+        for file_path in files_to_sync:
+            path_queue.put_nowait(file_path)
+        reader_count = min(SYNC_READERS, total_files)
+        worker_count = min(config.ingest_concurrency, total_files)
+        prepared_queue: asyncio.Queue = asyncio.Queue(maxsize=max(2 * reader_count, config.ingest_batch_size * worker_count))
+
+        async def read_files() -> None:
+            """Reader stage: read and normalize files until no paths remain."""
+            while not path_queue.empty():
+                file_path = path_queue.get_nowait()
+                try:
+                    prepared = await asyncio.to_thread(_read_ingest_file, file_path)
+                    await prepared_queue.put((file_path, prepared, None))
+                except Exception as e:
+                    await prepared_queue.put((file_path, None, e))
+
+        async def read_all_files() -> None:
+            """Run the readers, then tell every ingest worker that no more files are coming."""
+            async with asyncio.TaskGroup() as reader_group:
+                for _ in range(reader_count):
+                    reader_group.create_task(read_files())
+            for _ in range(worker_count):
+                await prepared_queue.put(None)
+
+        def record_error(file_path: Path, error: Exception) -> None:
+            """Count a failed file and report it."""
+            nonlocal error_count
+            error_count += 1
+            if isinstance(error, UnicodeDecodeError):
+                if report_files:
+                    status_lines.append(f"  [yellow]⚠[/yellow] Skipped (not a text file): {file_path.name}")
+                return
+            _get_logger().error("sync_error", file=str(file_path), error=str(error))
+            if report_files:
+                status_lines.append(f"  [red]✗[/red] Error: {file_path.name} - {str(error)}")
+
+        def record_ingested(file_path: Path, existing_doc, chunk_count: int) -> None:
+            """Count an added or updated file and report it."""
+            nonlocal added_count, updated_count
+            if existing_doc:
+                updated_count += 1
+                action = "Updated"
+            else:
+                added_count += 1
+                action = "Added"
+            if report_files:
+                status_lines.append(f"  [green]✓[/green] {action}: {file_path.name} ({chunk_count} chunks)")
 
-                # Calculate MD5 hash
-                import hashlib
-                content_md5 = hashlib.md5(content.encode("utf-8")).hexdigest()
+        async def ingest_batch(items: list[tuple[Path, tuple[str, "DocumentType", str] | None, Exception | None]]) -> None:
+            """Ingest stage for a batch of files: skip unchanged content, (re)ingest the rest together."""
+            nonlocal skipped_count
 
-                # Check if document exists
-                existing_doc = existing_by_relative_path.get(rel_path)
+            pending = []
+            for file_path, prepared, read_error in items:
+                if report_files:
+                    status_lines.append(f"  Processing: {file_path}")
 
-                if existing_doc:
-                    if existing_doc.content_md5 == content_md5 and not force:
-                        console.print(f"  [dim]→[/dim] Skipped (unchanged): {file_path.name}")
-                        skipped_count += 1
-                    else:
-                        # Delete old and create new
-                        await pipeline.delete_document(existing_doc.id)
-
-                        document = Document(
-                            repository_id=repo.id,
-                            source_path=str(file_path),
-                            relative_path=rel_path,
-                            doc_type=doc_type,
-                            title=filename_title,
-                            content=content,
-                            content_md5=content_md5,
-                            metadata={"file_size": file_path.stat().st_size},
-                        )
+                try:
+                    if read_error:
+                        raise read_error
+                    content, doc_type, content_md5 = prepared
+
+                    rel_path = str(file_path.relative_to(repo.root_path))
+                    existing_doc = existing_by_relative_path.get(rel_path)
+
+                    if existing_doc:
+                        if existing_doc.content_md5 == content_md5 and not force:
+                            # Content unchanged, skip
+                            skipped_count += 1
+                            if report_files:
+                                status_lines.append(f"  [dim]→[/dim] Skipped (unchanged): {file_path.name}")
+                            continue
+
+                        # The pipeline replaces the old document by source path and keeps it
+                        # if ingestion fails; delete it here only if that path has changed
+                        if existing_doc.source_path != str(file_path):
+                            await pipeline.delete_document(existing_doc.id)
 
-                        result = await pipeline.ingest_document(document, force=True)
-                        console.print(f"  [green]✓[/green] Updated: {file_path.name} ({result.chunk_count} chunks)")
-                        updated_count += 1
-                else:
-                    document = Document(
+                    document = Document.from_trusted(
                         repository_id=repo.id,
                         source_path=str(file_path),
                         relative_path=rel_path,
                         doc_type=doc_type,
-                        title=filename_title,
+                        title=file_path.stem,
                         content=content,
                         content_md5=content_md5,
-                        metadata={"file_size": file_path.stat().st_size},
+                        metadata={"file_size": file_sizes[file_path]},
                     )
+                    pending.append((file_path, existing_doc, document))
+                except Exception as e:
+                    record_error(file_path, e)
 
-                    result = await pipeline.ingest_document(document, force=True)
-                    console.print(f"  [green]✓[/green] Added: {file_path.name} ({result.chunk_count} chunks)")
-                    added_count += 1
+            if not pending:
+                return
 
-            except UnicodeDecodeError:
-                console.print(f"  [yellow]⚠[/yellow] Skipped (not a text file): {file_path.name}")
-                error_count += 1
-            except Exception as e:
-                console.print(f"  [red]✗[/red] Error: {file_path.name} - {str(e)}")
-                error_count += 1
-                logger.error("sync_error", file=str(file_path), error=str(e))
+            try:
+                results = await pipeline.ingest_documents([document for _, _, document in pending], force=True)
+            except Exception:
+                # The failed batch was rolled back; retry file by file to isolate the failure
+                for file_path, existing_doc, document in pending:
+                    try:
+                        result = await pipeline.ingest_document(document, force=True)
+                    except Exception as e:
+                        record_error(file_path, e)
+                    else:
+                        record_ingested(file_path, existing_doc, result.chunk_count)
+                return
+
+            for (file_path, existing_doc, _), result in zip(pending, results):
+                record_ingested(file_path, existing_doc, result.chunk_count)
+
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            disable=quiet or report_files,
+        ) as progress:
+            main_task = progress.add_task(
+                f"Processing {total_files} files...",
+                total=total_files,
+            )
+
+            async def ingest_files() -> None:
+                """Ingest worker: consume prepared files in batches until told to stop."""
+                done = False
+                while not done:
+                    # Wait for one file, then take whatever else is ready, up to the batch size
+                    batch = []
+                    item = await prepared_queue.get()
+                    while True:
+                        if item is None:
+                            done = True
+                            break
+                        batch.append(item)
+                        if len(batch) >= config.ingest_batch_size or prepared_queue.empty():
+                            break
+                        item = prepared_queue.get_nowait()
+
+                    if not batch:
+                        continue
+                    progress.update(main_task, description=f"Processing: {batch[0][0].name}")
+                    await ingest_batch(batch)
+                    progress.advance(main_task, len(batch))
+
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(read_all_files())
+                for _ in range(worker_count):
+                    task_group.create_task(ingest_files())
+
+        if status_lines and not quiet:
+            console.print("\n".join(status_lines), highlight=False)
 
         # Handle deleted files (files in DB but not on disk)
         for rel_path, doc in existing_by_relative_path.items():
@@ -677,8 +1074,6 @@ async def _sync_async(repository: str, config_file: Path | None, force: bool):
     finally:
         # Cleanup - always execute
         await embedding_provider.close()
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @app.command()
@@ -698,7 +1093,7 @@ def search(
     """Perform semantic search."""
     # Record audit start
     _record_audit_start("search", [query])
-    asyncio.run(_search_async(query, top_k, config_file, repository, output, no_content))
+    run_async(_search_async(query, top_k, config_file, repository, output, no_content))
 
 
 async def _search_async(
@@ -712,9 +1107,6 @@ async def _search_async(
     """Async implementation of search command."""
     config = _load_config(config_file)
 
-    # Initialize stores
-    metadata_store = None
-    vector_store = None
     embedding_provider = None
 
     try:
@@ -724,10 +1116,11 @@ async def _search_async(
         # Use provided repository or fall back to default
         repo_name = repository or config.default_repository
 
-        # Get the repository object
         from memory.service import RepositoryManager
+
+        # Get the repository object
         repo_manager = RepositoryManager(metadata_store, vector_store)
-        repo = await repo_manager.get_repository_by_name(repo_name)
+        repo = _default_or_named_repository(default_repo, config, repo_name) or await repo_manager.get_repository_by_name(repo_name)
 
         if not repo:
             console.print(f"[red]Repository '{repo_name}' not found[/red]")
@@ -776,10 +1169,10 @@ async def _search_async(
                 repository_id=repo.id,
             )
 
-            # Enrich results with document metadata
+            # Enrich results with document metadata, fetching each distinct document once
+            documents = await metadata_store.get_documents([result.chunk.document_id for result in results])
             for result in results:
-                document = await metadata_store.get_document(result.chunk.document_id)
-                result.document = document
+                result.document = documents.get(result.chunk.document_id)
 
             # Render output based on format
             if output == OutputFormat.JSON:
@@ -794,23 +1187,19 @@ async def _search_async(
                     for i, result in enumerate(results, 1):
                         doc_title = result.document.title if result.document else "Unknown"
                         console.print(f"[bold cyan]{i}. Score: {result.score:.4f}[/bold cyan]")
-                        console.print(f"   Document: {doc_title}")
+                        plain_console.print(f"   Document: {doc_title}")
                         if not no_content:
-                            console.print(f"   Chunk: {result.chunk.content[:200]}...")
+                            plain_console.print(f"   Chunk: {_preview(result.chunk.content, 200)}")
                         console.print()
 
         except Exception as e:
             console.print(f"[red]Search error: {str(e)}[/red]")
-            logger.error("search_error", error=str(e))
+            _get_logger().error("search_error", error=str(e))
 
     finally:
         # Cleanup - always execute
         if embedding_provider:
             await embedding_provider.close()
-        if metadata_store:
-            await metadata_store.close()
-        if vector_store:
-            await vector_store.close()
 
 
 @app.command()
@@ -823,7 +1212,7 @@ def ask(
     """Ask a question and get an LLM-generated answer."""
     # Record audit start
     _record_audit_start("ask", [question])
-    asyncio.run(_ask_async(question, top_k, config_file, repository))
+    run_async(_ask_async(question, top_k, config_file, repository))
 
 
 async def _ask_async(question: str, top_k: int, config_file: Path | None, repository: str | None):
@@ -836,10 +1225,11 @@ async def _ask_async(question: str, top_k: int, config_file: Path | None, reposi
     # Use provided repository or fall back to default
     repo_name = repository or config.default_repository
 
-    # Get the repository object
     from memory.service import RepositoryManager
+
+    # Get the repository object
     repo_manager = RepositoryManager(metadata_store, vector_store)
-    repo = await repo_manager.get_repository_by_name(repo_name)
+    repo = _default_or_named_repository(default_repo, config, repo_name) or await repo_manager.get_repository_by_name(repo_name)
 
     if not repo:
         console.print(f"[red]Repository '{repo_name}' not found[/red]")
@@ -897,20 +1287,18 @@ async def _ask_async(question: str, top_k: int, config_file: Path | None, reposi
 
             for i, result in enumerate(results, 1):
                 console.print(f"[bold cyan]{i}. Relevance: {result.score:.4f}[/bold cyan]")
-                console.print(f"   {result.chunk.content}")
+                plain_console.print(f"   {result.chunk.content}")
                 console.print()
 
             console.print("[yellow]To get LLM-generated answers, implement an LLM provider.[/yellow]")
 
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
-        logger.error("ask_error", error=str(e))
+        _get_logger().error("ask_error", error=str(e))
         raise typer.Exit(1)
 
     # Cleanup
     await embedding_provider.close()
-    await metadata_store.close()
-    await vector_store.close()
 
 
 @app.command()
@@ -927,7 +1315,7 @@ def chunk(
     """Analyze and display document chunking results."""
     # Record audit start
     _record_audit_start("chunk", [source])
-    asyncio.run(_chunk_async(source, size, overlap, test_mode, json_output, verbose, repository, config_file))
+    run_async(_chunk_async(source, size, overlap, test_mode, json_output, verbose, repository, config_file))
 
 
 async def _chunk_async(
@@ -941,9 +1329,6 @@ async def _chunk_async(
     config_file: Path | None,
 ):
     """Async implementation of chunk command."""
-    from pathlib import Path
-    from uuid import UUID
-
     # Load configuration
     config = _load_config(config_file)
 
@@ -961,8 +1346,6 @@ async def _chunk_async(
         console.print("[cyan]Running in test mode - no changes will be saved[/cyan]\n")
 
     # Initialize variables
-    metadata_store = None
-    vector_store = None
     repository_obj = None
 
     try:
@@ -991,24 +1374,25 @@ async def _chunk_async(
                 console.print("[yellow]Document is empty, no chunks created[/yellow]")
                 raise typer.Exit(0)
 
-            # Create a mock document for chunking
-            document_type = "markdown" if source_path.suffix.lower() in ['.md', '.markdown'] else "text"
+            # Normalize the same way sync does so chunk boundaries match real ingestion
+            content, document_type, _ = _prepare_ingest_content(source_path, content)
             doc_metadata = {
                 "source_path": str(source_path),
                 "file_size": source_path.stat().st_size,
-                "document_type": document_type,
+                "document_type": document_type.value,
                 "title": source_path.stem,  # Use filename without extension as title
             }
 
         else:
             # Handle repository document input (UUID or name)
             # Ensure default repository exists and get stores
-            metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
+            metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False, need_vector=False)
 
-            # Get the repository object
             from memory.service import RepositoryManager
+
+            # Get the repository object
             repo_manager = RepositoryManager(metadata_store, vector_store)
-            repository_obj = await repo_manager.get_repository_by_name(repo_name)
+            repository_obj = _default_or_named_repository(default_repo, config, repo_name) or await repo_manager.get_repository_by_name(repo_name)
 
             if not repository_obj:
                 console.print(f"[red]Repository '{repo_name}' not found[/red]")
@@ -1025,8 +1409,8 @@ async def _chunk_async(
                     raise typer.Exit(1)
             except (ValueError, TypeError):
                 # Not a UUID, try as name
-                all_docs = await metadata_store.list_documents(repository_id=repository_obj.id)
-                matching_docs = [doc for doc in all_docs if (doc.title or doc.source_path) == source]
+                by_name = await metadata_store.get_documents_by_names(repository_obj.id, [source])
+                matching_docs = by_name.get(source, [])
 
                 if not matching_docs:
                     console.print(f"[red]Document '{source}' not found in repository '{repo_name}'[/red]")
@@ -1034,7 +1418,7 @@ async def _chunk_async(
                 elif len(matching_docs) > 1:
                     console.print(f"[red]Multiple documents match '{source}'. Please use UUID:[/red]")
                     for doc in matching_docs:
-                        console.print(f"  - {(doc.title or doc.source_path)}: {doc.id}")
+                        plain_console.print(f"  - {doc.display_name}: {doc.id}")
                     raise typer.Exit(1)
                 else:
                     document = matching_docs[0]
@@ -1054,14 +1438,9 @@ async def _chunk_async(
             console.print("[cyan]Chunking document...[/cyan]\n")
 
         # Create chunking config with overrides
-        from uuid import uuid4
-
         from memory.config.schema import ChunkingConfig
-        from memory.core.markdown_chunking import (
-            chunk_markdown_document,
-        )
-        from memory.entities import Document as DomainDocument
-        from memory.entities import DocumentType
+        from memory.core.markdown_chunking import chunk_markdown_document
+        from memory.entities import Document, DocumentType
 
         chunking_config = ChunkingConfig(
             chunk_size=size if size is not None else config.chunking.chunk_size,
@@ -1078,7 +1457,7 @@ async def _chunk_async(
                 temp_repo_id = repository_obj.id
 
             # Create a document object for chunking
-            domain_doc = DomainDocument(
+            domain_doc = Document(
                 repository_id=temp_repo_id,
                 source_path=doc_metadata.get("source_path", "unknown"),
                 doc_type=DocumentType.TEXT,
@@ -1095,7 +1474,7 @@ async def _chunk_async(
                 chunks = chunk_markdown_document(domain_doc, chunking_config)
         except Exception as e:
             console.print(f"[red]Error during chunking: {str(e)}[/red]")
-            logger.error("chunking_error", error=str(e))
+            _get_logger().error("chunking_error", error=str(e))
             raise typer.Exit(1)
 
         if not chunks:
@@ -1123,16 +1502,11 @@ async def _chunk_async(
         console.print()
 
         # Display statistics
-        chunk_sizes = [len(chunk.content) for chunk in chunks]
-        avg_size = sum(chunk_sizes) / len(chunk_sizes)
-        min_size = min(chunk_sizes)
-        max_size = max(chunk_sizes)
+        total_size, min_size, max_size = _chunk_size_stats(chunks)
+        avg_size = total_size / len(chunks)
 
         # Calculate chunk type distribution
-        type_counts = {}
-        for chunk in chunks:
-            chunk_type = chunk.metadata.get("chunk_type", "unknown")
-            type_counts[chunk_type] = type_counts.get(chunk_type, 0) + 1
+        type_counts = Counter(chunk.metadata.get("chunk_type", "unknown") for chunk in chunks)
 
         console.print("[bold]Statistics:[/bold]")
         console.print(f"  Total chunks: {len(chunks)}")
@@ -1150,7 +1524,6 @@ async def _chunk_async(
 
         # Display chunks
         if json_output:
-            import json
             result = {
                 "document": doc_metadata,
                 "config": {
@@ -1164,58 +1537,52 @@ async def _chunk_async(
                     "max_size": max_size,
                     "type_distribution": type_counts,
                 },
-                "chunks": [
+            }
+            _write_json(
+                result,
+                "chunks",
+                (
                     {
                         "index": idx,
                         "type": chunk.metadata.get("chunk_type", "unknown"),
-                        "content": chunk.content if verbose else chunk.content[:200] + "..." if len(chunk.content) > 200 else chunk.content,
+                        "content": chunk.content if verbose else _preview(chunk.content, 200),
                         "size": len(chunk.content),
                         "start_char": chunk.start_char,
                         "end_char": chunk.end_char,
                     }
                     for idx, chunk in enumerate(chunks)
-                ],
-            }
-            console.print(json.dumps(result, indent=2))
+                ),
+            )
         else:
-            # Table output
-            table = Table(title="Chunk Analysis Results")
-            table.add_column("Index", style="cyan", no_wrap=True)
-            table.add_column("Type", style="magenta", no_wrap=True)
-            table.add_column("Size", style="yellow", no_wrap=True)
-            table.add_column("Range", style="blue", no_wrap=True)
-            table.add_column("Content Preview", style="green")
-
-            for idx, chunk in enumerate(chunks):
-                chunk_type = chunk.metadata.get("chunk_type", "unknown")
-                if verbose:
-                    # Show more content in verbose mode
-                    preview = chunk.content if len(chunk.content) <= 500 else chunk.content[:500] + "..."
-                else:
-                    preview = chunk.content[:100] + "..." if len(chunk.content) > 100 else chunk.content
-
-                table.add_row(
-                    str(idx),
-                    chunk_type,
-                    f"{len(chunk.content)} chars",
-                    f"{chunk.start_char}-{chunk.end_char}",
-                    preview,
-                )
-
-            console.print(table)
+            # Table output; show more content in verbose mode
+            preview_chars = 500 if verbose else 100
+            _print_table(
+                "Chunk Analysis Results",
+                [
+                    {"header": "Index", "style": "cyan", "no_wrap": True},
+                    {"header": "Type", "style": "magenta", "no_wrap": True},
+                    {"header": "Size", "style": "yellow", "no_wrap": True},
+                    {"header": "Range", "style": "blue", "no_wrap": True},
+                    {"header": "Content Preview", "style": "green"},
+                ],
+                (
+                    (
+                        str(idx),
+                        chunk.metadata.get("chunk_type", "unknown"),
+                        f"{len(chunk.content)} chars",
+                        f"{chunk.start_char}-{chunk.end_char}",
+                        _preview(chunk.content, preview_chars),
+                    )
+                    for idx, chunk in enumerate(chunks)
+                ),
+                len(chunks),
+            )
 
     except Exception as e:
         console.print(f"\n[red]Error: {str(e)}[/red]")
-        logger.error("chunk_error", error=str(e))
+        _get_logger().error("chunk_error", error=str(e))
         raise typer.Exit(1)
 
-    finally:
-        # Cleanup
-        if metadata_store:
-            await metadata_store.close()
-        if vector_store:
-            await vector_store.close()
-
 
 # Repository management subcommand group
 repo_app = typer.Typer(help="Manage repositories")
@@ -1231,7 +1598,7 @@ def repo_create(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Create a new repository."""
-    asyncio.run(_repo_create_async(name, root_path, document_types, description, config_file))
+    run_async(_repo_create_async(name, root_path, document_types, description, config_file))
 
 
 async def _repo_create_async(
@@ -1245,10 +1612,11 @@ async def _repo_create_async(
     config = _load_config(config_file)
 
     # Ensure default repository exists and get stores
-    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
+    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False, need_vector=False)
 
-    # Create repository manager
     from memory.service import RepositoryManager
+
+    # Create repository manager
     repo_manager = RepositoryManager(metadata_store, vector_store)
 
     # Convert relative root_path to absolute path
@@ -1286,10 +1654,6 @@ async def _repo_create_async(
     except Exception as e:
         console.print(f"[red]Error creating repository: {str(e)}[/red]")
         return
-    finally:
-        # Cleanup - always execute
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @repo_app.command("list")
@@ -1297,7 +1661,7 @@ def repo_list(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """List all repositories."""
-    asyncio.run(_repo_list_async(config_file))
+    run_async(_repo_list_async(config_file))
 
 
 async def _repo_list_async(config_file: Path | None):
@@ -1305,10 +1669,11 @@ async def _repo_list_async(config_file: Path | None):
     config = _load_config(config_file)
 
     # Ensure default repository exists and get stores
-    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
+    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False, need_vector=False)
 
-    # Create repository manager
     from memory.service import RepositoryManager
+
+    # Create repository manager
     repo_manager = RepositoryManager(metadata_store, vector_store)
 
     try:
@@ -1318,38 +1683,37 @@ async def _repo_list_async(config_file: Path | None):
         if not repositories:
             console.print("[yellow]No repositories found[/yellow]")
         else:
-            table = Table(title="Repositories")
-            table.add_column("Name", style="cyan")
-            table.add_column("ID", style="dim")
-            table.add_column("Root Path", style="blue")
-            table.add_column("Doc Types", style="magenta")
-            table.add_column("Description", style="green")
-            table.add_column("Documents", style="yellow")
-
-            for repo in repositories:
-                # Count documents in this repository
-                docs = await metadata_store.list_documents(repository_id=repo.id)
-                doc_count = len(docs)
-
-                table.add_row(
-                    repo.name,
-                    str(repo.id),
-                    str(repo.root_path) if repo.root_path else "-",
-                    ",".join(repo.document_types),
-                    repo.description or "-",
-                    str(doc_count),
-                )
-
-            console.print(table)
+            # Count documents in all repositories with one aggregate query
+            doc_counts = await metadata_store.count_documents_by_repository()
+
+            _print_table(
+                "Repositories",
+                [
+                    {"header": "Name", "style": "cyan"},
+                    {"header": "ID", "style": "dim"},
+                    {"header": "Root Path", "style": "blue"},
+                    {"header": "Doc Types", "style": "magenta"},
+                    {"header": "Description", "style": "green"},
+                    {"header": "Documents", "style": "yellow"},
+                ],
+                (
+                    (
+                        repo.name,
+                        str(repo.id),
+                        str(repo.root_path) if repo.root_path else "-",
+                        ",".join(repo.document_types),
+                        repo.description or "-",
+                        str(doc_counts.get(repo.id, 0)),
+                    )
+                    for repo in repositories
+                ),
+                len(repositories),
+            )
 
     except Exception as e:
         console.print(f"[red]Error listing repositories: {str(e)}[/red]")
         # Don't raise again, just exit cleanly
         return
-    finally:
-        # Cleanup - always execute
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @repo_app.command("info")
@@ -1358,7 +1722,7 @@ def repo_info(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Show repository information."""
-    asyncio.run(_repo_info_async(name, config_file))
+    run_async(_repo_info_async(name, config_file))
 
 
 async def _repo_info_async(name: str, config_file: Path | None):
@@ -1366,10 +1730,11 @@ async def _repo_info_async(name: str, config_file: Path | None):
     config = _load_config(config_file)
 
     # Ensure default repository exists and get stores
-    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
+    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False, need_vector=False)
 
-    # Create repository manager
     from memory.service import RepositoryManager
+
+    # Create repository manager
     repo_manager = RepositoryManager(metadata_store, vector_store)
 
     try:
@@ -1380,12 +1745,15 @@ async def _repo_info_async(name: str, config_file: Path | None):
             console.print(f"[red]Repository '{name}' not found[/red]")
             return
 
-        # Get statistics
-        docs = await metadata_store.list_documents(repository_id=repository.id)
-        doc_count = len(docs)
-        embedding_count = await vector_store.count()
+        # Get statistics; every chunk has one embedding, so count them per repository
+        doc_count, embedding_count = await asyncio.gather(
+            metadata_store.count_documents(repository_id=repository.id),
+            metadata_store.count_chunks(repository.id),
+        )
 
         # Display info
+        from rich.table import Table
+
         table = Table(title=f"Repository: {repository.name}")
         table.add_column("Property", style="cyan")
         table.add_column("Value", style="green")
@@ -1396,25 +1764,17 @@ async def _repo_info_async(name: str, config_file: Path | None):
         table.add_row("Document Types", ",".join(repository.document_types) if repository.document_types else "-")
         table.add_row("Description", repository.description or "-")
         table.add_row("Documents", str(doc_count))
-        table.add_row("Total Embeddings", str(embedding_count))
+        table.add_row("Embeddings", str(embedding_count))
         # Convert UTC to local timezone for display
         # Assume stored time is UTC (no timezone info), convert to local
-        created_utc = repository.created_at.replace(tzinfo=dt.UTC)
-        updated_utc = repository.updated_at.replace(tzinfo=dt.UTC)
-        created_local = created_utc.astimezone()
-        updated_local = updated_utc.astimezone()
-        table.add_row("Created", created_local.strftime("%Y-%m-%d %H:%M:%S"))
-        table.add_row("Updated", updated_local.strftime("%Y-%m-%d %H:%M:%S"))
+        table.add_row("Created", _fmt_local(repository.created_at))
+        table.add_row("Updated", _fmt_local(repository.updated_at))
 
         console.print(table)
 
     except Exception as e:
         console.print(f"[red]Error getting repository info: {str(e)}[/red]")
         return
-    finally:
-        # Cleanup - always execute
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @repo_app.command("delete")
@@ -1424,7 +1784,7 @@ def repo_delete(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Delete a repository and all its data."""
-    asyncio.run(_repo_delete_async(name, force, config_file))
+    run_async(_repo_delete_async(name, force, config_file))
 
 
 async def _repo_delete_async(name: str, force: bool, config_file: Path | None):
@@ -1433,7 +1793,8 @@ async def _repo_delete_async(name: str, force: bool, config_file: Path | None):
 
     # Confirmation prompt unless --force is used
     if not force:
-        typer.confirm(
+        await asyncio.to_thread(
+            typer.confirm,
             f"Are you sure you want to delete repository '{name}' and all its data?",
             abort=True,
         )
@@ -1441,8 +1802,9 @@ async def _repo_delete_async(name: str, force: bool, config_file: Path | None):
     # Ensure default repository exists and get stores
     metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
 
-    # Create repository manager
     from memory.service import RepositoryManager
+
+    # Create repository manager
     repo_manager = RepositoryManager(metadata_store, vector_store)
 
     try:
@@ -1467,10 +1829,6 @@ async def _repo_delete_async(name: str, force: bool, config_file: Path | None):
         console.print(f"[red]Error deleting repository: {str(e)}[/red]")
         raise typer.Exit(1)
 
-    # Cleanup
-    await metadata_store.close()
-    await vector_store.close()
-
 
 @repo_app.command("clear")
 def repo_clear(
@@ -1480,7 +1838,7 @@ def repo_clear(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Clear all documents from a repository."""
-    asyncio.run(_repo_clear_async(name, dry_run, yes, config_file))
+    run_async(_repo_clear_async(name, dry_run, yes, config_file))
 
 
 async def _repo_clear_async(name: str, dry_run: bool, yes: bool, config_file: Path | None):
@@ -1490,8 +1848,9 @@ async def _repo_clear_async(name: str, dry_run: bool, yes: bool, config_file: Pa
     # Ensure default repository exists and get stores
     metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
 
-    # Create repository manager
     from memory.service import RepositoryManager
+
+    # Create repository manager
     repo_manager = RepositoryManager(metadata_store, vector_store)
 
     try:
@@ -1517,7 +1876,7 @@ async def _repo_clear_async(name: str, dry_run: bool, yes: bool, config_file: Pa
             console.print("\n[bold red]WARNING:[/bold red] This will permanently delete ALL documents")
             console.print(f"from repository '{name}'.\n")
 
-            typer.confirm("Are you sure you want to continue?", abort=True)
+            await asyncio.to_thread(typer.confirm, "Are you sure you want to continue?", abort=True)
 
         # Clear repository
         deleted_count = await repo_manager.clear_repository(repository.id)
@@ -1528,10 +1887,6 @@ async def _repo_clear_async(name: str, dry_run: bool, yes: bool, config_file: Pa
     except Exception as e:
         console.print(f"\n[red]✗ Error clearing repository: {str(e)}[/red]")
         raise typer.Exit(1)
-    finally:
-        # Cleanup - always execute
-        await metadata_store.close()
-        await vector_store.close()
 
 
 # Document management subcommand group
@@ -1551,7 +1906,7 @@ def doc_query(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Query and list documents with pagination and filtering."""
-    asyncio.run(_doc_query_async(page, page_size, search, repository, sort, desc, json_output, config_file))
+    run_async(_doc_query_async(page, page_size, search, repository, sort, desc, json_output, config_file))
 
 
 async def _doc_query_async(
@@ -1587,99 +1942,89 @@ async def _doc_query_async(
     repo_name = repository or config.default_repository
 
     # Ensure default repository exists and get stores
-    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
+    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False, need_vector=False)
 
     try:
-        # Get repository
         from memory.service import RepositoryManager
+
+        # Get repository
         repo_manager = RepositoryManager(metadata_store, vector_store)
-        repo = await repo_manager.get_repository_by_name(repo_name)
+        repo = _default_or_named_repository(default_repo, config, repo_name) or await repo_manager.get_repository_by_name(repo_name)
 
         if not repo:
             console.print(f"[red]Repository '{repo_name}' not found[/red]")
             raise typer.Exit(1)
 
-        # List documents with pagination
-        # Get all documents with a large limit (pagination in memory)
-        all_docs = await metadata_store.list_documents(limit=10000, repository_id=repo.id)
-
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            all_docs = [doc for doc in all_docs if search_lower in (doc.title or "").lower()]
-
-        # Sort documents
-        if sort == "created_at":
-            all_docs.sort(key=lambda d: d.created_at, reverse=desc)
-        elif sort == "updated_at":
-            all_docs.sort(key=lambda d: d.updated_at, reverse=desc)
-        elif sort == "name":
-            all_docs.sort(key=lambda d: (d.title or "").lower(), reverse=desc)
-
-        # Calculate pagination
-        total_docs = len(all_docs)
+        # Let the store filter, sort and paginate; only the requested page is loaded
+        page_docs, total_docs = await asyncio.gather(
+            metadata_store.list_document_summaries(
+                limit=page_size,
+                offset=(page - 1) * page_size,
+                repository_id=repo.id,
+                search=search,
+                sort=sort,
+                descending=desc,
+            ),
+            metadata_store.count_documents(repository_id=repo.id, search=search),
+        )
         total_pages = (total_docs + page_size - 1) // page_size
 
-        # Get documents for current page
-        start_idx = (page - 1) * page_size
-        end_idx = min(start_idx + page_size, total_docs)
-        page_docs = all_docs[start_idx:end_idx]
-
-        # Get chunk counts for each document
-        chunk_counts = {}
-        for doc in page_docs:
-            chunks = await metadata_store.get_chunks_by_document(doc.id)
-            chunk_counts[doc.id] = len(chunks)
+        # Get chunk counts for the whole page in one query
+        chunk_counts = await metadata_store.get_chunk_counts([doc.id for doc in page_docs])
 
         # Output results
         if json_output:
-            # JSON output
-            import json
-
+            # JSON output, streaming one document at a time
             result = {
                 "page": page,
                 "page_size": page_size,
                 "total_pages": total_pages,
                 "total_documents": total_docs,
                 "repository": repo_name,
-                "documents": [
+            }
+            _write_json(
+                result,
+                "documents",
+                (
                     {
                         "id": str(doc.id),
-                        "name": doc.title or doc.source_path,
+                        "name": doc.display_name,
                         "source_path": doc.source_path,
                         "chunk_count": chunk_counts.get(doc.id, 0),
                         "created_at": doc.created_at.isoformat() if doc.created_at else None,
                         "updated_at": doc.updated_at.isoformat() if doc.updated_at else None,
                     }
                     for doc in page_docs
-                ],
-            }
-
-            console.print(json.dumps(result, indent=2))
+                ),
+            )
         else:
             # Table output
             if not page_docs:
                 console.print(f"[yellow]No documents found{(' matching search criteria' if search else '')} in repository '{repo_name}'[/yellow]")
             else:
-                table = Table(title=f"Documents - Repository: {repo_name}")
-                table.add_column("ID", style="dim", no_wrap=True)
-                table.add_column("Name", style="cyan")
-                table.add_column("Source Path", style="green")
-                table.add_column("Chunks", style="yellow")
-                table.add_column("Created", style="blue")
-                table.add_column("Updated", style="magenta")
-
-                for doc in page_docs:
-                    table.add_row(
-                        str(doc.id),
-                        doc.title or doc.source_path,
-                        doc.source_path,
-                        str(chunk_counts.get(doc.id, 0)),
-                        doc.created_at.replace(tzinfo=dt.UTC).astimezone().strftime("%Y-%m-%d %H:%M:%S") if doc.created_at else "-",
-                        doc.updated_at.replace(tzinfo=dt.UTC).astimezone().strftime("%Y-%m-%d %H:%M:%S") if doc.updated_at else "-",
-                    )
-
-                console.print(table)
+                _print_table(
+                    f"Documents - Repository: {repo_name}",
+                    [
+                        {"header": "ID", "style": "dim", "no_wrap": True},
+                        {"header": "Name", "style": "cyan"},
+                        {"header": "Source Path", "style": "green"},
+                        {"header": "Chunks", "style": "yellow"},
+                        {"header": "Created", "style": "blue"},
+                        {"header": "Updated", "style": "magenta"},
+                    ],
+                    (
+                        (
+                            str(doc.id),
+                            doc.display_name,
+                            doc.source_path,
+                            str(chunk_counts.get(doc.id, 0)),
+                            _fmt_local(doc.created_at),
+                            _fmt_local(doc.updated_at),
+                        )
+                        for doc in page_docs
+                    ),
+                    len(page_docs),
+                )
 
                 # Show pagination info
                 if total_pages > 1:
@@ -1688,10 +2033,6 @@ async def _doc_query_async(
     except Exception as e:
         console.print(f"[red]Error querying documents: {str(e)}[/red]")
         raise typer.Exit(1)
-    finally:
-        # Cleanup
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @doc_app.command("info")
@@ -1703,7 +2044,7 @@ def doc_info(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Display detailed information about a specific document."""
-    asyncio.run(_doc_info_async(document_id, repository, full, json_output, config_file))
+    run_async(_doc_info_async(document_id, repository, full, json_output, config_file))
 
 
 async def _doc_info_async(
@@ -1721,29 +2062,31 @@ async def _doc_info_async(
     repo_name = repository or config.default_repository
 
     # Ensure default repository exists and get stores
-    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
+    metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False, need_vector=False)
 
     try:
-        # Get repository
         from memory.service import RepositoryManager
+
+        # Get repository
         repo_manager = RepositoryManager(metadata_store, vector_store)
-        repo = await repo_manager.get_repository_by_name(repo_name)
+        repo = _default_or_named_repository(default_repo, config, repo_name) or await repo_manager.get_repository_by_name(repo_name)
 
         if not repo:
             console.print(f"[red]Repository '{repo_name}' not found[/red]")
             raise typer.Exit(1)
 
-        # Try to resolve document ID (UUID or name)
-        from uuid import UUID
+        # Only the previewed part of the content is loaded unless --full is given
+        preview_chars = None if full else 500
 
+        # Try to resolve document ID (UUID or name)
         try:
             # Try as UUID first
             doc_uuid = UUID(document_id)
-            document = await metadata_store.get_document(doc_uuid)
+            document = await metadata_store.get_document_summary(doc_uuid, preview_chars)
         except (ValueError, TypeError):
             # Not a UUID, try as name
-            all_docs = await metadata_store.list_documents(repository_id=repo.id)
-            matching_docs = [doc for doc in all_docs if (doc.title or doc.source_path) == document_id]
+            by_name = await metadata_store.get_documents_by_names(repo.id, [document_id])
+            matching_docs = by_name.get(document_id, [])
 
             if not matching_docs:
                 console.print(f"[red]Document '{document_id}' not found in repository '{repo_name}'[/red]")
@@ -1751,38 +2094,39 @@ async def _doc_info_async(
             elif len(matching_docs) > 1:
                 console.print(f"[red]Multiple documents match '{document_id}'. Please use UUID:[/red]")
                 for doc in matching_docs:
-                    console.print(f"  - {(doc.title or doc.source_path)}: {doc.id}")
+                    plain_console.print(f"  - {doc.display_name}: {doc.id}")
                 raise typer.Exit(1)
             else:
-                document = matching_docs[0]
+                from memory.entities import DocumentSummary
+
+                document = DocumentSummary.from_document(matching_docs[0], preview_chars)
 
-        # Get document chunks for statistics
-        chunks = await metadata_store.get_chunks_by_document(document.id)
+        # Get chunk sizes for statistics without loading chunk content
+        chunk_sizes = await metadata_store.get_chunk_sizes(document.id)
 
         # Calculate chunk statistics
+        total_size = sum(chunk_sizes)
         chunk_stats = {
-            "count": len(chunks),
-            "avg_size": sum(len(c.content) for c in chunks) / len(chunks) if chunks else 0,
-            "total_size": sum(len(c.content) for c in chunks),
+            "count": len(chunk_sizes),
+            "avg_size": total_size / len(chunk_sizes) if chunk_sizes else 0,
+            "total_size": total_size,
         }
 
         # Output results
         if json_output:
             # JSON output
-            import json
-
             result = {
                 "id": str(document.id),
-                "name": document.title or document.source_path,
+                "name": document.display_name,
                 "type": document.doc_type.value if document.doc_type else None,
                 "source_path": document.source_path,
                 "repository_id": str(document.repository_id),
                 "repository_name": repo_name,
                 "created_at": document.created_at.isoformat() if document.created_at else None,
                 "updated_at": document.updated_at.isoformat() if document.updated_at else None,
-                "content_preview": document.content[:500] if not full else document.content,
-                "content_length": len(document.content),
-                "is_truncated": not full and len(document.content) > 500,
+                "content_preview": document.content_preview,
+                "content_length": document.content_length,
+                "is_truncated": document.content_length > len(document.content_preview),
                 "chunk_stats": {
                     "count": chunk_stats["count"],
                     "average_size": round(chunk_stats["avg_size"], 2),
@@ -1790,21 +2134,23 @@ async def _doc_info_async(
                 },
             }
 
-            console.print(json.dumps(result, indent=2))
+            _write_json(result)
         else:
             # Table output
-            table = Table(title=f"Document Information: {document.title or document.source_path}")
+            from rich.table import Table
+
+            table = Table(title=f"Document Information: {document.display_name}")
             table.add_column("Property", style="cyan", no_wrap=True)
             table.add_column("Value", style="green")
 
             table.add_row("ID", str(document.id))
-            table.add_row("Name", document.title or document.source_path)
+            table.add_row("Name", document.display_name)
             table.add_row("Type", document.doc_type.value if document.doc_type else "-")
             table.add_row("Source Path", document.source_path)
             table.add_row("Repository", repo_name)
-            table.add_row("Created", document.created_at.replace(tzinfo=dt.UTC).astimezone().strftime("%Y-%m-%d %H:%M:%S") if document.created_at else "-")
-            table.add_row("Updated", document.updated_at.replace(tzinfo=dt.UTC).astimezone().strftime("%Y-%m-%d %H:%M:%S") if document.updated_at else "-")
-            table.add_row("Content Length", f"{len(document.content)} characters")
+            table.add_row("Created", _fmt_local(document.created_at))
+            table.add_row("Updated", _fmt_local(document.updated_at))
+            table.add_row("Content Length", f"{document.content_length} characters")
             table.add_row("Total Chunks", str(chunk_stats["count"]))
             table.add_row("Avg Chunk Size", f"{chunk_stats['avg_size']:.2f} chars")
 
@@ -1812,18 +2158,14 @@ async def _doc_info_async(
 
             # Content preview
             console.print("\n[bold]Content Preview:[/bold]")
-            preview_content = document.content[:500] if not full else document.content
-            if len(document.content) > 500 and not full:
+            preview_content = document.content_preview
+            if document.content_length > len(preview_content):
                 preview_content += "\n... (truncated)"
             console.print(preview_content)
 
     except Exception as e:
         console.print(f"[red]Error getting document info: {str(e)}[/red]")
         raise typer.Exit(1)
-    finally:
-        # Cleanup
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @doc_app.command("delete")
@@ -1835,7 +2177,7 @@ def doc_delete(
     config_file: Path | None = typer.Option(None, "--config", "-c", help="Config file path"),
 ):
     """Delete one or more documents and all their associated data."""
-    asyncio.run(_doc_delete_async(document_ids, repository, force, dry_run, config_file))
+    run_async(_doc_delete_async(document_ids, repository, force, dry_run, config_file))
 
 
 async def _doc_delete_async(
@@ -1856,118 +2198,145 @@ async def _doc_delete_async(
     metadata_store, vector_store, default_repo = await _ensure_default_repository(config, require_default_repo=False)
 
     try:
-        # Get repository
         from memory.service import RepositoryManager
+
+        # Get repository
         repo_manager = RepositoryManager(metadata_store, vector_store)
-        repo = await repo_manager.get_repository_by_name(repo_name)
+        repo = _default_or_named_repository(default_repo, config, repo_name) or await repo_manager.get_repository_by_name(repo_name)
 
         if not repo:
             console.print(f"[red]Repository '{repo_name}' not found[/red]")
             raise typer.Exit(1)
 
-        # Resolve all document IDs
-        from uuid import UUID
+        # Resolve all document IDs: split UUIDs from names, then look both up in batch
+        doc_uuids: dict[str, UUID] = {}
+        names: list[str] = []
+        for doc_id in document_ids:
+            try:
+                doc_uuids[doc_id] = UUID(doc_id)
+            except (ValueError, TypeError):
+                names.append(doc_id)
 
+        # A failed lookup is reported against each argument it was resolving
+        by_uuid, by_name = await asyncio.gather(
+            metadata_store.get_documents(list(doc_uuids.values())),
+            metadata_store.get_documents_by_names(repo.id, names),
+            return_exceptions=True,
+        )
 
         documents_to_delete = []
         errors = []
 
         for doc_id in document_ids:
-            try:
-                # Try to resolve document ID (UUID or name)
-                try:
-                    # Try as UUID first
-                    doc_uuid = UUID(doc_id)
-                    document = await metadata_store.get_document(doc_uuid)
-                    if document:
-                        documents_to_delete.append(document)
-                except (ValueError, TypeError):
-                    # Not a UUID, try as name
-                    all_docs = await metadata_store.list_documents(repository_id=repo.id)
-                    matching_docs = [doc for doc in all_docs if (doc.title or doc.source_path) == doc_id]
-
-                    if not matching_docs:
-                        errors.append(f"Document '{doc_id}' not found in repository '{repo_name}'")
-                    elif len(matching_docs) > 1:
-                        errors.append(f"Multiple documents match '{doc_id}'. Please use UUID:")
-                        for doc in matching_docs:
-                            errors.append(f"  - {(doc.title or doc.source_path)}: {doc.id}")
-                    else:
-                        documents_to_delete.append(matching_docs[0])
-
-            except Exception as e:
-                errors.append(f"Error resolving document '{doc_id}': {str(e)}")
+            lookup = by_uuid if doc_id in doc_uuids else by_name
+            if isinstance(lookup, Exception):
+                errors.append(f"Error resolving document '{doc_id}': {str(lookup)}")
+                continue
+
+            if doc_id in doc_uuids:
+                document = by_uuid.get(doc_uuids[doc_id])
+                if document:
+                    documents_to_delete.append(document)
+                continue
+
+            matching_docs = by_name.get(doc_id, [])
+            if not matching_docs:
+                errors.append(f"Document '{doc_id}' not found in repository '{repo_name}'")
+            elif len(matching_docs) > 1:
+                errors.append(f"Multiple documents match '{doc_id}'. Please use UUID:")
+                for doc in matching_docs:
+                    errors.append(f"  - {doc.display_name}: {doc.id}")
+            else:
+                documents_to_delete.append(matching_docs[0])
 
         # Show errors if any
         if errors:
-            for error in errors:
-                console.print(f"[red]{error}[/red]")
+            plain_console.print("\n".join(errors), style="red")
             if not documents_to_delete:
                 raise typer.Exit(1)
 
+        # Count chunks for all documents in one query, overlapping the confirmation prompt
+        chunk_counts_task = asyncio.create_task(
+            metadata_store.get_chunk_counts([doc.id for doc in documents_to_delete])
+        )
+
         # Dry run mode
         if dry_run:
-            console.print("[yellow]Dry run mode - would delete:[/yellow]\n")
-            for doc in documents_to_delete:
-                # Get chunk count
-                chunks = await metadata_store.get_chunks_by_document(doc.id)
-                chunk_count = len(chunks)
-
-                # Get embedding count (approximate)
-                embedding_count = chunk_count  # Assume one embedding per chunk
-
-                console.print(f"Document: {doc.title or doc.source_path} ({doc.id})")
-                console.print(f"  - {chunk_count} chunks")
-                console.print(f"  - {embedding_count} embeddings")
-                console.print("")
-
+            chunk_counts = await chunk_counts_task
+            # Embedding counts are approximate: one embedding per chunk
+            _print_table(
+                "Dry run mode - would delete",
+                [
+                    {"header": "Document", "style": "cyan"},
+                    {"header": "ID", "style": "dim"},
+                    {"header": "Chunks", "style": "yellow", "justify": "right"},
+                    {"header": "Embeddings", "style": "yellow", "justify": "right"},
+                ],
+                (
+                    (doc.display_name, str(doc.id), str(chunk_counts.get(doc.id, 0)), str(chunk_counts.get(doc.id, 0)))
+                    for doc in documents_to_delete
+                ),
+                len(documents_to_delete),
+            )
             console.print("[dim]No changes made. Use --force to actually delete.[/dim]")
             return
 
         # Confirmation prompt if not forced
         if not force:
             if len(documents_to_delete) == 1:
-                doc_name = documents_to_delete[0].title or documents_to_delete[0].source_path
+                doc_name = documents_to_delete[0].display_name
                 confirm_msg = f"Are you sure you want to delete document '{doc_name}'? This will remove the document, all chunks, and all embeddings."
             else:
                 confirm_msg = f"Are you sure you want to delete {len(documents_to_delete)} documents? This cannot be undone."
 
-            typer.confirm(confirm_msg, abort=True)
+            try:
+                await asyncio.to_thread(typer.confirm, confirm_msg, abort=True)
+            except typer.Abort:
+                chunk_counts_task.cancel()
+                raise
+
+        chunk_counts = await chunk_counts_task
 
-        # Delete documents
-        deleted_count = 0
-        delete_errors = []
+        # Delete all documents with one batch call per store
+        doc_ids = [document.id for document in documents_to_delete]
 
-        for document in documents_to_delete:
+        # Documents without chunks have no embeddings, so only those with chunks hit the vector store
+        embedded_ids = [doc_id for doc_id in doc_ids if chunk_counts.get(doc_id, 0) > 0]
+        if embedded_ids:
             try:
-                # Get chunks for statistics
-                chunks = await metadata_store.get_chunks_by_document(document.id)
-                chunk_count = len(chunks)
+                await vector_store.delete_by_document_ids(embedded_ids)
+            except Exception as e:
+                _get_logger().warning("vector_store_delete_failed", document_count=len(embedded_ids), error=str(e))
 
-                # Delete from vector store first
-                try:
-                    await vector_store.delete_by_document_id(document.id)
-                except Exception as e:
-                    # Vector store delete might fail if no embeddings exist
-                    logger.warning("vector_store_delete_failed", document_id=str(document.id), error=str(e))
+        try:
+            deleted_ids = await metadata_store.delete_documents(doc_ids)
+            batch_error = None
+        except Exception as e:
+            deleted_ids = set()
+            batch_error = f"Failed to delete document metadata: {str(e)}"
 
-                # Delete from metadata store (document and chunks)
-                try:
-                    await metadata_store.delete_document(document.id)
-                except Exception as e:
-                    raise Exception(f"Failed to delete document metadata: {str(e)}")
+        results = [
+            None
+            if document.id in deleted_ids
+            else f"Failed to delete document '{document.display_name}': {batch_error or 'document not found'}"
+            for document in documents_to_delete
+        ]
 
-                console.print(f"[green]✓[/green] Deleted document: {document.title or document.source_path} ({chunk_count} chunks removed)")
+        # Report in argument order
+        deleted_count = 0
+        delete_errors = []
+        for document, error in zip(documents_to_delete, results):
+            if error:
+                delete_errors.append(error)
+            else:
+                chunk_count = chunk_counts.get(document.id, 0)
+                console.print(f"[green]✓[/green] Deleted document: {document.display_name} ({chunk_count} chunks removed)")
                 deleted_count += 1
 
-            except Exception as e:
-                delete_errors.append(f"Failed to delete document '{document.title or document.source_path}': {str(e)}")
-
         # Show summary
         if delete_errors:
             console.print("\n[yellow]Some deletions encountered errors:[/yellow]")
-            for error in delete_errors:
-                console.print(f"[red]{error}[/red]")
+            plain_console.print("\n".join(delete_errors), style="red")
 
         console.print(f"\n[green]Successfully deleted {deleted_count} document(s)[/green]")
 
@@ -1978,10 +2347,6 @@ async def _doc_delete_async(
     except Exception as e:
         console.print(f"[red]Error deleting documents: {str(e)}[/red]")
         raise typer.Exit(1)
-    finally:
-        # Cleanup
-        await metadata_store.close()
-        await vector_store.close()
 
 
 @app.command()
@@ -1994,30 +2359,65 @@ def info(
 
     config = _load_config(config_file)
 
-    table = Table(title="Memory System Information")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="green")
+    rows = [
+        ("Data Directory", str(config.data_dir)),
+        ("Default Repository", config.default_repository),
+        ("Log Level", str(config.log_level)),
+        ("Embedding Provider", config.embedding.provider),
+        ("Embedding Model", config.embedding.model_name),
+        ("LLM Provider", config.llm.provider),
+        ("LLM Model", config.llm.model_name),
+        ("Vector Store", str(config.vector_store.store_type)),
+        ("Metadata Store", str(config.metadata_store.store_type)),
+    ]
+    _print_table(
+        "Memory System Information",
+        [{"header": "Setting", "style": "cyan"}, {"header": "Value", "style": "green"}],
+        rows,
+        len(rows),
+    )
 
-    table.add_row("Data Directory", str(config.data_dir))
-    table.add_row("Default Repository", config.default_repository)
-    table.add_row("Log Level", config.log_level)
-    table.add_row("Embedding Provider", config.embedding.provider)
-    table.add_row("Embedding Model", config.embedding.model_name)
-    table.add_row("LLM Provider", config.llm.provider)
-    table.add_row("LLM Model", config.llm.model_name)
-    table.add_row("Vector Store", config.vector_store.store_type)
-    table.add_row("Metadata Store", config.metadata_store.store_type)
 
-    console.print(table)
+# Logging configuration currently installed by _load_config
+_logging_key: str | None = None
+
+
+@cache
+def _default_config_path() -> Path:
+    """Find and resolve the default config file once per process."""
+    from memory.config.loader import get_default_config_path
+
+    return get_default_config_path().resolve()
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(config_path: Path) -> "AppConfig":
+    """Parse a config file once per process."""
+    from memory.config.loader import load_config
+
+    return load_config(config_path)
+
+
+def _load_config(config_file: Path | None) -> "AppConfig":
+    """Load configuration and setup logging.
+
+    Configs are cached by resolved path, and logging is only reconfigured
+    when the logging section differs from the one already installed.
+    """
+    global _logging_key
+
+    from memory.core.logging import configure_from_config
 
+    config_path = _default_config_path() if config_file is None else config_file.resolve()
+    config = _load_config_file(config_path)
 
-def _load_config(config_file: Path | None) -> AppConfig:
-    """Load configuration and setup logging."""
-    if config_file is None:
-        config_file = get_default_config_path()
+    logging_key = config.logging.model_dump_json()
+    if logging_key != _logging_key:
+        configure_from_config(config.logging)
+        _logging_key = logging_key
 
-    config = load_config(config_file)
-    configure_from_config(config.logging)
+    cache_info = _load_config_file.cache_info()
+    _get_logger().debug("config_loaded", path=str(config_path), hits=cache_info.hits, misses=cache_info.misses)
 
     return config
 
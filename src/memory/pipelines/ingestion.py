@@ -10,21 +10,38 @@ How to use:
 
     pipeline = IngestionPipeline(config, embedding_provider, vector_store, metadata_store)
     await pipeline.ingest_document(document)
+    await pipeline.ingest_documents([first, second])  # chunks share embedding batches
 """
 
-from dataclasses import dataclass
+import asyncio
+import codecs
+import io
+import os
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from itertools import chain, islice
 from pathlib import Path
 from uuid import UUID
 
 from memory.config.schema import AppConfig
 from memory.core.chunking import create_chunks
 from memory.core.logging import get_logger
-from memory.entities import Document, DocumentType, Embedding
+from memory.entities import Chunk, Document, DocumentType, EmbeddingVectors
 from memory.providers.base import EmbeddingProvider
 from memory.storage.base import MetadataStore, VectorStore
 
 logger = get_logger(__name__)
 
+# Document type of each file suffix ingest_file recognizes
+_SUFFIX_TO_DOCTYPE: dict[str, DocumentType] = {
+    ".md": DocumentType.MARKDOWN,
+    ".markdown": DocumentType.MARKDOWN,
+    ".txt": DocumentType.TEXT,
+    ".pdf": DocumentType.PDF,
+    ".html": DocumentType.HTML,
+    ".htm": DocumentType.HTML,
+}
+
 
 @dataclass
 class IngestionResult:
@@ -35,6 +52,44 @@ class IngestionResult:
     document_id: UUID | None = None
 
 
+@dataclass
+class _PreparedDocument:
+    """A document whose metadata and chunks are stored but not yet embedded."""
+    document: Document
+    chunks: list[Chunk] = field(default_factory=list)
+    result: IngestionResult | None = None
+    stored: bool = False
+    original_document: Document | None = None
+    original_chunks: list[Chunk] = field(default_factory=list)
+
+    @property
+    def replaces_itself(self) -> bool:
+        """Whether the document replaces a stored copy with the same ID."""
+        return self.original_document is not None and self.original_document.id == self.document.id
+
+
+@dataclass
+class _PendingVectors:
+    """Vectors of one ingestion call waiting to be written, with their chunks."""
+    vectors: list[Sequence[float]] = field(default_factory=list)
+    chunks: list[Chunk] = field(default_factory=list)
+
+
+def _read_file(file_path: Path) -> tuple[str, int]:
+    """Read and decode a UTF-8 file with one open, stat and read.
+
+    Newlines are translated to "\\n", as ``read_text`` does.
+
+    Returns:
+        The file's text and its size in bytes
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        data = f.read()
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    return decoder.decode(data, final=True), size
+
+
 class IngestionPipeline:
     """Pipeline for ingesting documents into the knowledge base."""
 
@@ -45,6 +100,7 @@ class IngestionPipeline:
         vector_store: VectorStore,
         metadata_store: MetadataStore,
         repository_id: UUID | None = None,
+        buffer_embeddings: bool = False,
     ):
         """Initialize the ingestion pipeline.
 
@@ -54,12 +110,17 @@ class IngestionPipeline:
             vector_store: Storage for embeddings
             metadata_store: Storage for documents and chunks
             repository_id: Optional repository ID for document isolation
+            buffer_embeddings: If True, the embeddings of each ``ingest_documents``
+                call are written in batches of ``vector_store.insert_batch_size``
+                rather than one write per embedding batch; all are written before
+                the call returns
         """
         self.config = config
         self.embedding_provider = embedding_provider
         self.vector_store = vector_store
         self.metadata_store = metadata_store
         self.repository_id = repository_id
+        self.buffer_embeddings = buffer_embeddings
 
     async def ingest_document(self, document: Document, force: bool = False) -> IngestionResult:
         """Ingest a single document.
@@ -74,218 +135,360 @@ class IngestionPipeline:
         Raises:
             IngestionError: If ingestion fails
         """
-        logger.info("ingestion_started", document_id=str(document.id), source=document.source_path, force=force)
+        results = await self.ingest_documents([document], force=force)
+        return results[0]
+
+    async def ingest_documents(self, documents: list[Document], force: bool = False) -> list[IngestionResult]:
+        """Ingest several documents, embedding their chunks together.
+
+        Document metadata and chunks are stored one document at a time, then the
+        chunks of all documents are embedded in batches of ``embedding.batch_size``,
+        so small documents share embedding requests and vector store writes.
+        Chunks are batched in order of length to reduce padding in the embedder.
+
+        Metadata is committed before embedding starts. If any document fails, the
+        new documents of the call are deleted and the ones they replaced are
+        restored; replaced documents keep their vectors until the new vectors
+        are stored, so a restored document is still searchable.
+
+        Args:
+            documents: Documents to ingest
+            force: If True, re-import even if content hasn't changed
 
-        # Store original document for rollback if needed
-        original_document = None
-        original_chunks = None
+        Returns:
+            One IngestionResult per document, in input order
+
+        Raises:
+            IngestionError: If ingestion of any document fails
+        """
+        prepared: list[_PreparedDocument] = []
 
         try:
-            # Find existing document by source_path and repository_id
-            logger.info("finding_document_by_source_path", source_path=document.source_path, repository_id=str(document.repository_id))
-            existing_doc = await self._find_document_by_source_path(
-                document.source_path,
-                document.repository_id
+            # Replacing the batch's documents and storing their chunks is committed once
+            async with self.metadata_store.transaction():
+                existing = await self._find_existing_documents(documents)
+                for document in documents:
+                    item = _PreparedDocument(document)
+                    prepared.append(item)
+                    await self._prepare_document(item, force, existing)
+
+            # Batching chunks of similar length keeps embedders from padding short chunks to long ones
+            chunks = sorted(chain.from_iterable(item.chunks for item in prepared), key=lambda chunk: len(chunk.content))
+            await self._embed_chunks(chunks, len(chunks))
+
+        except asyncio.CancelledError:
+            # A cancelled batch (e.g. a failed sibling in ingest_files) must not leave partial documents
+            logger.warning("ingestion_cancelled", document_ids=[str(item.document.id) for item in prepared])
+            await self._rollback_all(prepared)
+            raise
+        except Exception as e:
+            logger.error(
+                "ingestion_failed",
+                document_ids=[str(item.document.id) for item in prepared],
+                error=str(e),
             )
+            await self._rollback_all(prepared)
+            raise IngestionError(f"Failed to ingest document: {e}") from e
 
-            # Initialize variables for document replacement tracking
-            original_document = None
-            content_changed = False
-
-            if existing_doc:
-                logger.info("existing_document_found", document_id=str(existing_doc.id), existing_md5=existing_doc.content_md5, new_md5=document.content_md5)
-                # Check if content has changed based on MD5
-                content_changed = (
-                    existing_doc.content_md5 != document.content_md5 or
-                    existing_doc.content_md5 is None or
-                    document.content_md5 is None
-                )
+        await self._delete_replaced_vectors(prepared)
 
-                if not content_changed and not force:
-                    # Content hasn't changed and not forcing, skip ingestion
-                    existing_chunks = await self.metadata_store.get_chunks_by_document(existing_doc.id)
-                    logger.info("content_unchanged",
-                               document_id=str(existing_doc.id),
-                               source=document.source_path)
-                    return IngestionResult(
-                        chunk_count=len(existing_chunks),
-                        updated=False,
-                        reason="content_unchanged",
-                        document_id=existing_doc.id
-                    )
-
-                # Content has changed or force is True
-                logger.info("content_changed_or_forced",
-                           document_id=str(document.id),
-                           source=document.source_path,
-                           content_changed=content_changed,
-                           force=force)
-
-                # Store for rollback
-                original_document = existing_doc
-                original_chunks = await self.metadata_store.get_chunks_by_document(existing_doc.id)
-
-                # Delete existing document and associated data
-                await self._delete_document_cascade(existing_doc.id)
-                logger.info("deleted_existing_document", original_id=str(existing_doc.id))
-            else:
-                logger.info("no_existing_document_found", source_path=document.source_path)
-
-            # Store document metadata
-            logger.info("storing_document_metadata", document_id=str(document.id))
-            await self.metadata_store.add_document(document)
-            logger.info("document_metadata_stored", document_id=str(document.id))
-
-            # Create chunks
-            logger.info("creating_chunks", document_id=str(document.id))
-            chunks = create_chunks(document, self.config.chunking)
-            logger.info("chunks_created", document_id=str(document.id), chunk_count=len(chunks))
-            if not chunks:
-                logger.warning("no_chunks_created", document_id=str(document.id))
-                return IngestionResult(
-                    chunk_count=0,
-                    updated=False,
-                    reason="no_chunks_created",
-                    document_id=document.id
+        for item in prepared:
+            if item.chunks:
+                logger.info(
+                    "ingestion_completed",
+                    document_id=str(item.document.id),
+                    chunk_count=len(item.chunks),
                 )
+        return [item.result for item in prepared]
 
-            # Store chunks
-            logger.info("storing_chunks", document_id=str(document.id), chunk_count=len(chunks))
-            for i, chunk in enumerate(chunks):
-                logger.debug(
-                    "storing_chunk",
-                    document_id=str(document.id),
-                    chunk_index=i,
-                    chunk_id=str(chunk.id),
-                )
-                await self.metadata_store.add_chunk(chunk)
-            logger.info("chunks_stored", document_id=str(document.id), chunk_count=len(chunks))
+    async def _prepare_document(
+        self, item: "_PreparedDocument", force: bool, existing: dict[tuple[UUID, str], Document]
+    ) -> None:
+        """Replace any existing copy of a document, then store it and its chunks.
 
-            # Generate embeddings in batches
-            batch_size = self.config.embedding.batch_size
-            logger.info(
-                "generating_embeddings",
-                document_id=str(document.id),
-                batch_size=batch_size,
-                total_chunks=len(chunks),
+        Fills in ``item`` as it goes, so a failure part-way can still be rolled back.
+        ``existing`` maps (repository_id, source_path) to the stored documents of
+        the batch and is updated as documents are stored.
+        """
+        document = item.document
+        # Formatted once for the log lines below
+        doc_id = str(document.id)
+        logger.info("ingestion_started", document_id=doc_id, source=document.source_path, force=force)
+
+        # Find existing document by source_path and repository_id
+        key = (document.repository_id, document.source_path)
+        existing_doc = existing.get(key)
+
+        content_changed = False
+
+        if existing_doc:
+            existing_id = str(existing_doc.id)
+            logger.info("existing_document_found", document_id=existing_id, existing_md5=existing_doc.content_md5, new_md5=document.content_md5)
+            # Check if content has changed based on MD5
+            content_changed = (
+                existing_doc.content_md5 != document.content_md5 or
+                existing_doc.content_md5 is None or
+                document.content_md5 is None
             )
-            for i in range(0, len(chunks), batch_size):
-                batch = chunks[i : i + batch_size]
-                batch_num = i // batch_size + 1
-                total_batches = (len(chunks) + batch_size - 1) // batch_size
-                texts = [chunk.content for chunk in batch]
 
-                logger.info(
-                    "processing_embedding_batch",
-                    document_id=str(document.id),
-                    batch_num=batch_num,
-                    total_batches=total_batches,
-                    batch_size=len(batch),
-                )
-                # Generate embeddings
-                vectors = await self.embedding_provider.embed_batch(texts)
-                logger.info(
-                    "embeddings_generated",
-                    document_id=str(document.id),
-                    batch_num=batch_num,
-                    vector_count=len(vectors),
+            if not content_changed and not force:
+                # Content hasn't changed and not forcing, skip ingestion
+                existing_chunks = await self.metadata_store.get_chunks_by_document(existing_doc.id)
+                logger.info("content_unchanged",
+                           document_id=existing_id,
+                           source=document.source_path)
+                item.result = IngestionResult(
+                    chunk_count=len(existing_chunks),
+                    updated=False,
+                    reason="content_unchanged",
+                    document_id=existing_doc.id
                 )
+                return
+
+            # Content has changed or force is True
+            logger.info("content_changed_or_forced",
+                       document_id=doc_id,
+                       source=document.source_path,
+                       content_changed=content_changed,
+                       force=force)
+
+            # Store for rollback
+            item.original_chunks = await self.metadata_store.get_chunks_by_document(existing_doc.id)
+            item.original_document = existing_doc
+
+            # Delete the existing document's metadata; its vectors are deleted
+            # only once the new ones are stored, see _delete_replaced_vectors
+            await self.metadata_store.delete_document(existing_doc.id)
+            logger.info("deleted_existing_document", original_id=existing_id)
+        else:
+            logger.info("no_existing_document_found", source_path=document.source_path)
+
+        # Store document metadata
+        logger.info("storing_document_metadata", document_id=doc_id)
+        item.stored = True
+        await self.metadata_store.add_document(document)
+        existing[key] = document
+        logger.info("document_metadata_stored", document_id=doc_id)
+
+        # Create chunks
+        logger.info("creating_chunks", document_id=doc_id)
+        chunks = create_chunks(document, self.config.chunking)
+        logger.info("chunks_created", document_id=doc_id, chunk_count=len(chunks))
+        if not chunks:
+            logger.warning("no_chunks_created", document_id=doc_id)
+            item.result = IngestionResult(
+                chunk_count=0,
+                updated=False,
+                reason="no_chunks_created",
+                document_id=document.id
+            )
+            return
+
+        # Store chunks
+        logger.info("storing_chunks", document_id=doc_id, chunk_count=len(chunks))
+        await self.metadata_store.add_chunks(chunks)
+        logger.info("chunks_stored", document_id=doc_id, chunk_count=len(chunks))
+        item.chunks = chunks
+
+        # Determine reason for update
+        if item.original_document:
+            reason = "content_changed" if content_changed else "forced"
+        else:
+            reason = "new_document"
+
+        item.result = IngestionResult(
+            chunk_count=len(chunks),
+            updated=item.original_document is not None or reason == "new_document",
+            reason=reason,
+            document_id=document.id
+        )
 
-                # Create embedding objects
-                embeddings = [
-                    Embedding(
-                        chunk_id=chunk.id,
-                        vector=vector,
-                        model=self.config.embedding.model_name,
-                        dimension=len(vector),
-                    )
-                    for chunk, vector in zip(batch, vectors)
-                ]
-
-                # Store embeddings
-                logger.info(
-                    "storing_embeddings",
-                    document_id=str(document.id),
-                    batch_num=batch_num,
-                    embedding_count=len(embeddings),
-                )
-                await self.vector_store.add_embeddings_batch(embeddings, batch)
-                logger.info("embeddings_stored", document_id=str(document.id), batch_num=batch_num)
+    async def _embed_chunks(self, chunks: Iterable[Chunk], chunk_count: int) -> None:
+        """Generate embeddings for chunks in batches and store them.
+
+        Batches are taken from ``chunks`` only when one of the
+        ``embedding.max_concurrent_batches`` slots is free, so at most that many
+        batches and their vectors are held at once. Vector store writes are
+        serialized but overlap with the embedding of later batches. With
+        ``buffer_embeddings`` they are grouped up to ``vector_store.insert_batch_size``
+        and the remainder is written before returning. The first failure cancels
+        the remaining batches.
+
+        Args:
+            chunks: Chunks to embed, consumed lazily
+            chunk_count: Number of chunks in ``chunks``, used for progress logging
+        """
+        if not chunk_count:
+            return
+
+        batch_size = self.config.embedding.batch_size
+        total_batches = (chunk_count + batch_size - 1) // batch_size
+        logger.info(
+            "generating_embeddings",
+            batch_size=batch_size,
+            total_chunks=chunk_count,
+        )
+        semaphore = asyncio.Semaphore(self.config.embedding.max_concurrent_batches)
+        store_lock = asyncio.Lock()
+        pending = _PendingVectors() if self.buffer_embeddings else None
+
+        async def process_batch(batch_num: int, batch: list[Chunk]) -> None:
+            try:
+                await self._embed_batch(batch_num, total_batches, batch, store_lock, pending)
+            finally:
+                semaphore.release()
+
+        chunk_iter = iter(chunks)
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for batch_num in range(1, total_batches + 1):
+                    await semaphore.acquire()
+                    task_group.create_task(process_batch(batch_num, list(islice(chunk_iter, batch_size))))
+        except ExceptionGroup as group:
+            # Report the first failure itself rather than the group wrapping it
+            raise group.exceptions[0] from None
+
+        if pending and pending.vectors:
+            await self._write_pending(pending)
+
+    async def _embed_batch(
+        self,
+        batch_num: int,
+        total_batches: int,
+        batch: list[Chunk],
+        store_lock: asyncio.Lock,
+        pending: _PendingVectors | None,
+    ) -> None:
+        """Embed one batch of chunks and store or buffer the embeddings."""
+        texts = [chunk.content for chunk in batch]
+
+        logger.info(
+            "processing_embedding_batch",
+            batch_num=batch_num,
+            total_batches=total_batches,
+            batch_size=len(batch),
+        )
+        # Generate embeddings
+        vectors = await self.embedding_provider.embed_batch(texts)
+        logger.info(
+            "embeddings_generated",
+            batch_num=batch_num,
+            vector_count=len(vectors),
+        )
 
+        # Store the vectors as they are, one batch at a time
+        async with store_lock:
             logger.info(
-                "ingestion_completed",
-                document_id=str(document.id),
-                chunk_count=len(chunks),
+                "storing_embeddings",
+                batch_num=batch_num,
+                embedding_count=len(vectors),
             )
-
-            # Determine reason for update
-            reason = None
-            if original_document:
-                if content_changed:
-                    reason = "content_changed"
-                else:
-                    reason = "forced"
-
-            return IngestionResult(
-                chunk_count=len(chunks),
-                updated=original_document is not None or reason == "new_document",
-                reason=reason if reason else "new_document",
-                document_id=document.id
+            await self._store_vectors(vectors, batch, pending)
+        logger.info("embeddings_stored", batch_num=batch_num)
+
+    async def _rollback_all(self, prepared: list["_PreparedDocument"]) -> None:
+        """Roll back every document of a failed batch in one metadata transaction."""
+        async with self.metadata_store.transaction():
+            for item in prepared:
+                await self._rollback(item)
+
+    async def _rollback(self, item: "_PreparedDocument") -> None:
+        """Remove a partially ingested document and restore the one it replaced."""
+        if not item.stored and not item.original_document:
+            return
+
+        doc_id = str(item.document.id)
+        logger.warning("attempting_rollback_after_failure",
+                     document_id=doc_id,
+                     original_id=str(item.original_document.id) if item.original_document else None)
+        try:
+            # Delete the new document we tried to create
+            if item.replaces_itself and item.stored:
+                # The original's vectors share the document ID, so only the new chunks' vectors go
+                await self._delete_chunk_vectors(item.chunks)
+                await self.metadata_store.delete_document(item.document.id)
+            elif item.stored:
+                await self._delete_document_cascade(item.document.id)
+
+            # Restore the original document, unless a store transaction already brought it back
+            if item.original_document and not await self.metadata_store.get_document(item.original_document.id):
+                await self.metadata_store.add_document(item.original_document)
+                await self.metadata_store.add_chunks(item.original_chunks)
+
+            logger.info("rollback_successful", document_id=doc_id)
+        except Exception as rollback_error:
+            logger.error(
+                "rollback_failed",
+                document_id=doc_id,
+                error=str(rollback_error),
             )
 
+    async def _delete_replaced_vectors(self, prepared: list["_PreparedDocument"]) -> None:
+        """Delete the vectors of the documents replaced by a successful batch."""
+        replaced = [(item, item.original_document) for item in prepared if item.original_document]
+        if not replaced:
+            return
+
+        try:
+            await self.vector_store.delete_by_document_ids(
+                [original.id for item, original in replaced if not item.replaces_itself]
+            )
+            for item, _ in replaced:
+                if item.replaces_itself:
+                    await self._delete_chunk_vectors(item.original_chunks)
+            logger.info("deleted_replaced_embeddings", document_count=len(replaced))
         except Exception as e:
-            logger.error(
-                "ingestion_failed",
-                document_id=str(document.id),
+            logger.warning(
+                "failed_to_delete_embeddings",
+                document_ids=[str(original.id) for _, original in replaced],
                 error=str(e),
             )
 
-            # Attempt rollback if we overwrote an existing document
-            if original_document:
-                logger.warning("attempting_rollback_after_failure",
-                             original_id=str(original_document.id))
-                try:
-                    # Delete the new document we tried to create
-                    await self._delete_document_cascade(document.id)
-
-                    # Restore the original document
-                    await self.metadata_store.add_document(original_document)
-                    for chunk in original_chunks:
-                        await self.metadata_store.add_chunk(chunk)
-
-                    logger.info("rollback_successful", original_id=str(original_document.id))
-                except Exception as rollback_error:
-                    logger.error(
-                        "rollback_failed",
-                        original_id=str(original_document.id),
-                        error=str(rollback_error),
-                    )
+    async def _delete_chunk_vectors(self, chunks: list[Chunk]) -> None:
+        """Delete the vectors of individual chunks."""
+        for chunk in chunks:
+            await self.vector_store.delete_by_chunk_id(chunk.id)
 
-            raise IngestionError(f"Failed to ingest document: {e}") from e
+    async def _store_vectors(
+        self, vectors: EmbeddingVectors, chunks: list[Chunk], pending: _PendingVectors | None
+    ) -> None:
+        """Write vectors to the vector store, or add them to ``pending`` when buffering."""
+        if pending is None:
+            await self.vector_store.add_vectors_batch(chunks, vectors, self.config.embedding.model_name)
+            return
+
+        pending.vectors.extend(vectors)
+        pending.chunks.extend(chunks)
+        if len(pending.vectors) >= self.config.vector_store.insert_batch_size:
+            await self._write_pending(pending)
+
+    async def _write_pending(self, pending: _PendingVectors) -> None:
+        """Write buffered vectors to the vector store, emptying the buffer once written."""
+        logger.info("flushing_embeddings", embedding_count=len(pending.vectors))
+        await self.vector_store.add_vectors_batch(pending.chunks, pending.vectors, self.config.embedding.model_name)
+        pending.vectors, pending.chunks = [], []
+
+    async def _find_existing_documents(self, documents: list[Document]) -> dict[tuple[UUID, str], Document]:
+        """Fetch the stored documents sharing a source path with any of ``documents``.
 
-    async def _find_document_by_source_path(self, source_path: str, repository_id: UUID) -> Document | None:
-        """Find a document by its source path and repository ID.
+        Issues one lookup per repository rather than one per document.
 
         Args:
-            source_path: Source path to search for
-            repository_id: Repository ID to search in
+            documents: Documents about to be ingested
 
         Returns:
-            Document if found, None otherwise
+            Mapping of (repository_id, source_path) to the stored document
         """
-        logger.debug("finding_document_by_source_path", source_path=source_path, repository_id=str(repository_id))
+        paths_by_repository: dict[UUID, list[str]] = {}
+        for document in documents:
+            paths_by_repository.setdefault(document.repository_id, []).append(document.source_path)
 
-        # List all documents in the repository
-        documents = await self.metadata_store.list_documents(repository_id=repository_id, limit=10000)
-
-        # Find document with matching source path
-        for doc in documents:
-            if doc.source_path == source_path:
-                logger.debug("found_existing_document", document_id=str(doc.id), source_path=source_path)
-                return doc
-
-        logger.debug("no_existing_document_found", source_path=source_path, repository_id=str(repository_id))
-        return None
+        existing: dict[tuple[UUID, str], Document] = {}
+        for repository_id, source_paths in paths_by_repository.items():
+            found = await self.metadata_store.get_documents_by_source_paths(repository_id, source_paths)
+            existing.update(((repository_id, path), doc) for path, doc in found.items())
+        logger.info("existing_documents_found", requested=len(documents), found=len(existing))
+        return existing
 
     async def _delete_document_cascade(self, document_id: UUID) -> None:
         """Delete a document and all its associated data (chunks and embeddings).
@@ -293,18 +496,19 @@ class IngestionPipeline:
         Args:
             document_id: ID of document to delete
         """
-        logger.info("cascade_delete_started", document_id=str(document_id))
+        doc_id = str(document_id)
+        logger.info("cascade_delete_started", document_id=doc_id)
 
         # Delete embeddings from vector store first
         try:
             await self.vector_store.delete_by_document_id(document_id)
-            logger.info("deleted_embeddings", document_id=str(document_id))
+            logger.info("deleted_embeddings", document_id=doc_id)
         except Exception as e:
-            logger.warning("failed_to_delete_embeddings", document_id=str(document_id), error=str(e))
+            logger.warning("failed_to_delete_embeddings", document_id=doc_id, error=str(e))
 
         # Delete document and chunks from metadata store
         await self.metadata_store.delete_document(document_id)
-        logger.info("cascade_delete_completed", document_id=str(document_id))
+        logger.info("cascade_delete_completed", document_id=doc_id)
 
     async def delete_document(self, document_id: UUID) -> None:
         """Delete a document and all its associated data.
@@ -314,7 +518,8 @@ class IngestionPipeline:
         Args:
             document_id: ID of document to delete
         """
-        await self._delete_document_cascade(document_id)
+        async with self.metadata_store.transaction():
+            await self._delete_document_cascade(document_id)
 
     async def ingest_file(self, file_path: Path, repository_id: UUID | None = None) -> UUID:
         """Ingest a file from the filesystem.
@@ -329,17 +534,16 @@ class IngestionPipeline:
         Raises:
             IngestionError: If file cannot be read or ingested
         """
-        if not file_path.exists():
-            raise IngestionError(f"File not found: {file_path}")
-
         # Use provided repository_id or fall back to pipeline default
         repo_id = repository_id or self.repository_id
         if not repo_id:
             raise IngestionError("repository_id is required but not provided")
 
-        # Read file content
+        # Read file content off the event loop so concurrent ingestions keep progressing
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content, file_size = await asyncio.to_thread(_read_file, file_path)
+        except FileNotFoundError as e:
+            raise IngestionError(f"File not found: {file_path}") from e
         except Exception as e:
             raise IngestionError(f"Failed to read file: {e}") from e
 
@@ -353,24 +557,45 @@ class IngestionPipeline:
             doc_type=doc_type,
             title=file_path.stem,
             content=content,
-            metadata={"file_size": file_path.stat().st_size},
+            metadata={"file_size": file_size},
         )
 
         await self.ingest_document(document)
         return document.id
 
-    def _detect_document_type(self, file_path: Path) -> DocumentType:
+    async def ingest_files(self, file_paths: list[Path], repository_id: UUID | None = None) -> list[UUID]:
+        """Ingest several files, up to ``ingest_concurrency`` at a time.
+
+        Reading one file overlaps with embedding and storing the others.
+
+        Args:
+            file_paths: Paths to files
+            repository_id: Optional repository ID (overrides pipeline default)
+
+        Returns:
+            Document IDs, in input order
+
+        Raises:
+            IngestionError: If any file cannot be read or ingested
+        """
+        semaphore = asyncio.Semaphore(self.config.ingest_concurrency)
+
+        async def ingest(file_path: Path) -> UUID:
+            async with semaphore:
+                return await self.ingest_file(file_path, repository_id)
+
+        # The first failure cancels the remaining files; each rolls back its own partial ingestion
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(ingest(file_path)) for file_path in file_paths]
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    def _detect_document_type(file_path: Path) -> DocumentType:
         """Detect document type from file extension."""
-        suffix = file_path.suffix.lower()
-        type_map = {
-            ".md": DocumentType.MARKDOWN,
-            ".markdown": DocumentType.MARKDOWN,
-            ".txt": DocumentType.TEXT,
-            ".pdf": DocumentType.PDF,
-            ".html": DocumentType.HTML,
-            ".htm": DocumentType.HTML,
-        }
-        return type_map.get(suffix, DocumentType.UNKNOWN)
+        return _SUFFIX_TO_DOCTYPE.get(file_path.suffix.lower(), DocumentType.UNKNOWN)
 
 
 class IngestionError(Exception):
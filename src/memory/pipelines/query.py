@@ -13,6 +13,7 @@ How to use:
     answer = await pipeline.answer(query)
 """
 
+from collections import OrderedDict
 from typing import Optional
 from uuid import UUID
 
@@ -24,6 +25,9 @@ from memory.storage.base import MetadataStore, VectorStore
 
 logger = get_logger(__name__)
 
+# Number of recent query embeddings a pipeline keeps
+QUERY_CACHE_SIZE = 256
+
 
 class QueryPipeline:
     """Pipeline for querying the knowledge base."""
@@ -53,6 +57,8 @@ class QueryPipeline:
         self.vector_store = vector_store
         self.metadata_store = metadata_store
         self.repository_id = repository_id
+        # Recent query vectors keyed by (model, query), least recently used first
+        self._query_vectors: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
 
     async def search(
         self,
@@ -85,7 +91,7 @@ class QueryPipeline:
             use_hybrid = self.config.vector_store.hybrid_search.enabled
 
         # Generate query embedding
-        query_vector = await self.embedding_provider.embed_text(query)
+        query_vector = await self._embed_query(query)
 
         # Search vector store with repository filtering
         if use_hybrid:
@@ -110,15 +116,37 @@ class QueryPipeline:
                 query_vector, top_k=top_k, repository_id=repo_id, filters=filters
             )
 
-        # Enrich results with document metadata
+        # Enrich results with document metadata, fetching each distinct document once
+        documents = await self.metadata_store.get_documents([result.chunk.document_id for result in results])
         for result in results:
-            document = await self.metadata_store.get_document(result.chunk.document_id)
-            result.document = document
+            result.document = documents.get(result.chunk.document_id)
 
         logger.info("search_completed", query=query, result_count=len(results))
 
         return results
 
+    async def _embed_query(self, query: str) -> list[float]:
+        """Embed a query, reusing the vector of a recent identical query.
+
+        Args:
+            query: Search query; surrounding whitespace is ignored
+
+        Returns:
+            Query embedding vector
+        """
+        text = query.strip()
+        key = (self.embedding_provider.config.model_name, text)
+        vector = self._query_vectors.get(key)
+        if vector is not None:
+            self._query_vectors.move_to_end(key)
+            return vector
+
+        vector = await self.embedding_provider.embed_text(text)
+        self._query_vectors[key] = vector
+        if len(self._query_vectors) > QUERY_CACHE_SIZE:
+            self._query_vectors.popitem(last=False)
+        return vector
+
     async def answer(
         self,
         query: str,
@@ -17,6 +17,8 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from memory.entities import EmbeddingVectors
+
 
 class ProviderConfig(BaseModel):
     """Base configuration for all providers."""
@@ -56,14 +58,14 @@ class EmbeddingProvider(ABC):
         pass
 
     @abstractmethod
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(self, texts: list[str]) -> EmbeddingVectors:
         """Generate embeddings for multiple texts.
 
         Args:
             texts: List of input texts
 
         Returns:
-            List of embedding vectors
+            One embedding vector per text, as lists or a 2-D array
 
         Raises:
             ProviderError: If embedding generation fails
@@ -3,8 +3,15 @@
 This provider runs embedding models locally on the machine.
 """
 
+import asyncio
+from typing import TYPE_CHECKING
+
 from memory.providers.base import EmbeddingProvider, ProviderConfig, ProviderError
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 # Model dimension mappings (for known models)
 MODEL_DIMENSIONS = {
     "bge-small-zh-v1.5": 512,
@@ -17,6 +24,12 @@ MODEL_DIMENSIONS = {
     "sentence-transformers/all-mpnet-base-v2": 768,
 }
 
+# Concurrent embed_text calls arriving within this many seconds share one encode call
+COALESCE_WINDOW = 0.003
+
+# Most texts a single coalesced encode call takes
+MAX_COALESCED_TEXTS = 64
+
 # Model max tokens (conservative estimates)
 MODEL_MAX_TOKENS = {
     "bge-small-zh-v1.5": 512,
@@ -28,6 +41,14 @@ MODEL_MAX_TOKENS = {
 }
 
 
+def _lookup_model_info(model_name: str, model_map: dict[str, int]) -> int | None:
+    """Look up a known model by its exact name, or by its name without the organization prefix."""
+    value = model_map.get(model_name)
+    if value is None:
+        value = model_map.get(model_name.rsplit("/", 1)[-1])
+    return value
+
+
 class LocalEmbeddingProvider(EmbeddingProvider):
     """Local embedding provider using sentence-transformers.
 
@@ -70,36 +91,46 @@ class LocalEmbeddingProvider(EmbeddingProvider):
 
         model_name = config.model_name
         self._model = SentenceTransformer(model_name)
+        # Inference only; keeps dropout and similar layers off
+        self._model.eval()
         self._dimension = self._get_dimension(model_name)
         self._max_tokens = self._get_max_tokens(model_name)
 
+        # embed_text requests waiting to be encoded together
+        self._pending: list[tuple[str, asyncio.Future[NDArray[np.float32]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Loop the waiting requests and their flush timer belong to
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
     def _get_dimension(self, model_name: str) -> int:
         """Get embedding dimension for model."""
-        dim = self._lookup_model_info(model_name, MODEL_DIMENSIONS, 768)
+        dim = _lookup_model_info(model_name, MODEL_DIMENSIONS)
         if dim is not None:
             return dim
         # Try to get from model
         try:
-            return self._model.get_sentence_embedding_dimension()
+            return self._model.get_sentence_embedding_dimension() or 768
         except Exception:
             return 768
 
     def _get_max_tokens(self, model_name: str) -> int:
         """Get max tokens for model."""
-        return self._lookup_model_info(model_name, MODEL_MAX_TOKENS, 512) or 512
+        return _lookup_model_info(model_name, MODEL_MAX_TOKENS) or 512
+
+    def _encode(self, inputs: str | list[str]) -> "NDArray[np.float32]":
+        """Encode inputs without autograd bookkeeping or a progress bar."""
+        import torch
 
-    def _lookup_model_info(
-        self, model_name: str, model_map: dict[str, int], default: int
-    ) -> int | None:
-        """Look up model information from known models."""
-        for known_model, value in model_map.items():
-            if known_model in model_name or model_name in known_model:
-                return value
-        return None
+        with torch.inference_mode():
+            return self._model.encode(inputs, convert_to_numpy=True, show_progress_bar=False)
 
     async def embed_text(self, text: str) -> list[float]:
         """Generate embedding for a single text.
 
+        Calls made within COALESCE_WINDOW of each other are encoded together
+        in one batch, up to MAX_COALESCED_TEXTS texts.
+
         Args:
             text: Input text to embed
 
@@ -109,13 +140,24 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         Raises:
             ProviderError: If embedding generation fails
         """
-        try:
-            import asyncio
+        loop = asyncio.get_running_loop()
+        if self._flush_loop is not loop:
+            # Requests left on a loop that stopped before its timer fired can
+            # never be flushed; drop them and start afresh on this loop
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush_handle = None
+            self._pending = []
+            self._flush_loop = loop
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= MAX_COALESCED_TEXTS:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(COALESCE_WINDOW, self._flush_pending)
 
-            # Run in thread to avoid blocking
-            embedding = await asyncio.to_thread(
-                self._model.encode, text, convert_to_numpy=True
-            )
+        try:
+            embedding = await future
             return embedding.tolist()
         except Exception as e:
             raise ProviderError(
@@ -124,26 +166,47 @@ class LocalEmbeddingProvider(EmbeddingProvider):
                 original_error=e,
             )
 
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    def _flush_pending(self) -> None:
+        """Encode every waiting embed_text request in one background call."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.create_task(self._encode_pending(pending))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _encode_pending(self, pending: "list[tuple[str, asyncio.Future[NDArray[np.float32]]]]") -> None:
+        """Encode coalesced texts in a thread and hand each caller its row."""
+        try:
+            embeddings = await asyncio.to_thread(self._encode, [text for text, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), embedding in zip(pending, embeddings):
+            # A caller that was cancelled no longer waits for its row
+            if not future.done():
+                future.set_result(embedding)
+
+    async def embed_batch(self, texts: list[str]) -> "NDArray[np.float32]":
         """Generate embeddings for multiple texts.
 
         Args:
             texts: List of input texts
 
         Returns:
-            List of embedding vectors
+            Float32 array with one embedding vector per row
 
         Raises:
             ProviderError: If embedding generation fails
         """
         try:
-            import asyncio
-
-            # Run in thread to avoid blocking
-            embeddings = await asyncio.to_thread(
-                self._model.encode, texts, convert_to_numpy=True, show_progress_bar=True
-            )
-            return embeddings.tolist()
+            # Run in thread to avoid blocking; the array is returned as is, for vector stores to take its rows
+            return await asyncio.to_thread(self._encode, texts)
         except Exception as e:
             raise ProviderError(
                 message=f"Failed to generate batch embeddings: {str(e)}",
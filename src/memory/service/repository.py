@@ -24,12 +24,13 @@ class RepositoryManager:
     metadata store and vector store for consistent operations.
     """
 
-    def __init__(self, metadata_store: MetadataStore, vector_store: VectorStore):
+    def __init__(self, metadata_store: MetadataStore, vector_store: VectorStore | None):
         """Initialize repository manager.
 
         Args:
             metadata_store: Storage for repository metadata
-            vector_store: Storage for embeddings (for cascade deletion)
+            vector_store: Storage for embeddings (for cascade deletion); may be None
+                when only repository metadata is read or created
         """
         self.metadata_store = metadata_store
         self.vector_store = vector_store
@@ -13,12 +13,14 @@ How to extend:
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from memory.entities import Chunk, Document, Embedding, Repository, SearchResult
+from memory.entities import Chunk, Document, DocumentSummary, Embedding, EmbeddingVectors, Repository, SearchResult
 
 
 class StorageConfig(BaseModel):
@@ -71,6 +73,25 @@ class VectorStore(ABC):
         """
         pass
 
+    async def add_vectors_batch(self, chunks: list[Chunk], vectors: EmbeddingVectors, model: str) -> None:
+        """Store raw vectors for chunks, without building Embedding objects.
+
+        ``chunks`` and ``vectors`` are parallel sequences. The default
+        implementation wraps each vector in an Embedding and calls
+        add_embeddings_batch; backends should override it to pass the vectors
+        straight through.
+
+        Args:
+            chunks: Chunks the vectors represent
+            vectors: One vector per chunk, as lists or a 2-D array
+            model: Embedding model that produced the vectors
+        """
+        embeddings = [
+            Embedding(chunk_id=chunk.id, vector=list(vector), model=model, dimension=len(vector))
+            for chunk, vector in zip(chunks, vectors)
+        ]
+        await self.add_embeddings_batch(embeddings, chunks)
+
     @abstractmethod
     async def search(
         self, query_vector: list[float], top_k: int = 10, repository_id: UUID | None = None, filters: dict | None = None
@@ -100,6 +121,23 @@ class VectorStore(ABC):
         """
         pass
 
+    async def delete_by_document_ids(self, document_ids: list[UUID]) -> int:
+        """Delete all embeddings for several documents.
+
+        The default implementation deletes one document at a time; backends
+        should override it with a single bulk delete.
+
+        Args:
+            document_ids: Document IDs to delete
+
+        Returns:
+            Number of embeddings deleted
+        """
+        total = 0
+        for document_id in document_ids:
+            total += await self.delete_by_document_id(document_id)
+        return total
+
     @abstractmethod
     async def delete_by_chunk_id(self, chunk_id: UUID) -> bool:
         """Delete embedding for a specific chunk.
@@ -182,6 +220,17 @@ class MetadataStore(ABC):
         """Initialize the metadata store (create tables, etc.)."""
         pass
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes so they are committed together, or not at all.
+
+        Writes made inside the block are committed when it exits normally and
+        discarded if it raises. Nested blocks join the outer transaction. The
+        default implementation provides no atomicity: each write takes effect
+        immediately. Backends with transactions should override it.
+        """
+        yield
+
     @abstractmethod
     async def add_document(self, document: Document) -> None:
         """Store a document.
@@ -203,6 +252,113 @@ class MetadataStore(ABC):
         """
         pass
 
+    async def get_documents(self, document_ids: list[UUID]) -> dict[UUID, Document]:
+        """Retrieve several documents by ID.
+
+        The default implementation fetches each document; backends should
+        override it with a single query.
+
+        Args:
+            document_ids: Document IDs (duplicates are allowed)
+
+        Returns:
+            Mapping of document ID to document (missing documents are omitted)
+        """
+        documents = {}
+        for document_id in dict.fromkeys(document_ids):
+            document = await self.get_document(document_id)
+            if document is not None:
+                documents[document_id] = document
+        return documents
+
+    async def get_document_by_source_path(self, repository_id: UUID, source_path: str) -> Document | None:
+        """Retrieve a repository's document by its source path.
+
+        The default implementation scans the repository's documents; backends
+        should override it with an indexed lookup.
+
+        Args:
+            repository_id: Repository ID
+            source_path: Original absolute path of the document
+
+        Returns:
+            Document if found, None otherwise
+        """
+        count = await self.count_documents(repository_id=repository_id)
+        for document in await self.list_documents(limit=count, repository_id=repository_id):
+            if document.source_path == source_path:
+                return document
+        return None
+
+    async def get_documents_by_source_paths(self, repository_id: UUID, source_paths: list[str]) -> dict[str, Document]:
+        """Retrieve a repository's documents for several source paths at once.
+
+        The default implementation scans the repository's documents once;
+        backends should override it with a single indexed query.
+
+        Args:
+            repository_id: Repository ID
+            source_paths: Original absolute paths of the documents
+
+        Returns:
+            Mapping of source path to document (paths without a document are omitted)
+        """
+        if not source_paths:
+            return {}
+        wanted = set(source_paths)
+        count = await self.count_documents(repository_id=repository_id)
+        return {
+            document.source_path: document
+            for document in await self.list_documents(limit=count, repository_id=repository_id)
+            if document.source_path in wanted
+        }
+
+    async def get_document_summary(
+        self, document_id: UUID, preview_chars: int | None = 500
+    ) -> DocumentSummary | None:
+        """Retrieve a document's fields with only a prefix of its content.
+
+        The default implementation loads the full document; backends should
+        override it to avoid reading the whole content.
+
+        Args:
+            document_id: Document ID
+            preview_chars: Number of leading characters to return, or None for all
+
+        Returns:
+            DocumentSummary if found, None otherwise
+        """
+        document = await self.get_document(document_id)
+        if document is None:
+            return None
+        return DocumentSummary.from_document(document, preview_chars)
+
+    async def get_documents_by_names(self, repository_id: UUID, names: list[str]) -> dict[str, list[Document]]:
+        """Find documents in a repository by display name.
+
+        A document's display name is its title, or its source path when it has
+        no title. The default implementation scans the repository once;
+        backends should override it with an indexed lookup.
+
+        Args:
+            repository_id: Repository to search in
+            names: Display names to resolve
+
+        Returns:
+            Mapping of name to the documents carrying it (names without matches are omitted)
+        """
+        wanted = set(names)
+        if not wanted:
+            return {}
+
+        total = await self.count_documents(repository_id=repository_id)
+        matches: dict[str, list[Document]] = {}
+        for document in await self.list_documents(limit=total, repository_id=repository_id):
+            name = document.display_name
+            if name in wanted:
+                matches.setdefault(name, []).append(document)
+        return matches
+
     @abstractmethod
     async def add_chunk(self, chunk: Chunk) -> None:
         """Store a chunk.
@@ -212,6 +368,18 @@ class MetadataStore(ABC):
         """
         pass
 
+    async def add_chunks(self, chunks: list[Chunk]) -> None:
+        """Store several chunks.
+
+        The default implementation stores them one at a time; backends should
+        override it with a bulk insert.
+
+        Args:
+            chunks: Chunks to store
+        """
+        for chunk in chunks:
+            await self.add_chunk(chunk)
+
     @abstractmethod
     async def get_chunk(self, chunk_id: UUID) -> Chunk | None:
         """Retrieve a chunk by ID.
@@ -236,6 +404,55 @@ class MetadataStore(ABC):
         """
         pass
 
+    async def get_chunk_sizes(self, document_id: UUID) -> list[int]:
+        """Get the content length of each chunk of a document.
+
+        The default implementation loads the chunks; backends should override
+        it to avoid reading chunk content.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Chunk content lengths in chunk order
+        """
+        return [len(chunk.content) for chunk in await self.get_chunks_by_document(document_id)]
+
+    async def get_chunk_counts(self, document_ids: list[UUID]) -> dict[UUID, int]:
+        """Count chunks for multiple documents.
+
+        The default implementation fetches each document's chunks; backends
+        should override it with a single aggregate query.
+
+        Args:
+            document_ids: Document IDs to count chunks for
+
+        Returns:
+            Mapping of document ID to chunk count (documents without chunks may be omitted)
+        """
+        return {document_id: len(await self.get_chunks_by_document(document_id)) for document_id in document_ids}
+
+    async def count_chunks(self, repository_id: UUID) -> int:
+        """Count the chunks, and so the embeddings, of a repository.
+
+        The default implementation pages through the repository's documents
+        and counts per document; backends should override it with a single
+        aggregate query.
+
+        Args:
+            repository_id: Repository ID
+
+        Returns:
+            Number of chunks in the repository
+        """
+        page_size = 100
+        document_count = await self.count_documents(repository_id=repository_id)
+        total = 0
+        for offset in range(0, document_count, page_size):
+            documents = await self.list_documents(limit=page_size, offset=offset, repository_id=repository_id)
+            total += sum((await self.get_chunk_counts([document.id for document in documents])).values())
+        return total
+
     @abstractmethod
     async def delete_document(self, document_id: UUID) -> bool:
         """Delete a document and its chunks.
@@ -248,20 +465,113 @@ class MetadataStore(ABC):
         """
         pass
 
+    async def delete_documents(self, document_ids: list[UUID]) -> set[UUID]:
+        """Delete several documents and their chunks.
+
+        The default implementation deletes one document at a time; backends
+        should override it with a single bulk delete.
+
+        Args:
+            document_ids: Document IDs to delete
+
+        Returns:
+            IDs of the documents that existed and were deleted
+        """
+        deleted = set()
+        for document_id in document_ids:
+            if await self.delete_document(document_id):
+                deleted.add(document_id)
+        return deleted
+
     @abstractmethod
-    async def list_documents(self, limit: int = 100, offset: int = 0, repository_id: UUID | None = None) -> list[Document]:
+    async def list_documents(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        repository_id: UUID | None = None,
+        search: str | None = None,
+        sort: str = "created_at",
+        descending: bool = True,
+    ) -> list[Document]:
         """List documents with pagination.
 
         Args:
             limit: Maximum number of documents to return
             offset: Number of documents to skip
             repository_id: Optional repository ID to filter documents
+            search: Optional case-insensitive substring to match against titles
+            sort: Sort field: created_at, updated_at or name (title, or source path when untitled)
+            descending: Sort in descending order
 
         Returns:
             List of documents
         """
         pass
 
+    async def list_document_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        repository_id: UUID | None = None,
+        search: str | None = None,
+        sort: str = "created_at",
+        descending: bool = True,
+        preview_chars: int | None = 0,
+    ) -> list[DocumentSummary]:
+        """List documents like list_documents, without their full content.
+
+        The default implementation summarizes list_documents results; backends
+        should override it to select only the summary columns.
+
+        Args:
+            limit: Maximum number of documents to return
+            offset: Number of documents to skip
+            repository_id: Optional repository ID to filter documents
+            search: Optional case-insensitive substring to match against titles
+            sort: Sort field: created_at, updated_at or name (title, or source path when untitled)
+            descending: Sort in descending order
+            preview_chars: Number of leading content characters to include, or None for all
+
+        Returns:
+            List of document summaries
+        """
+        documents = await self.list_documents(
+            limit=limit,
+            offset=offset,
+            repository_id=repository_id,
+            search=search,
+            sort=sort,
+            descending=descending,
+        )
+        return [DocumentSummary.from_document(document, preview_chars) for document in documents]
+
+    @abstractmethod
+    async def count_documents(self, repository_id: UUID | None = None, search: str | None = None) -> int:
+        """Count documents matching the same filters as list_documents.
+
+        Args:
+            repository_id: Optional repository ID to filter documents
+            search: Optional case-insensitive substring to match against titles
+
+        Returns:
+            Number of matching documents
+        """
+        pass
+
+    async def count_documents_by_repository(self) -> dict[UUID, int]:
+        """Count documents in every repository.
+
+        The default implementation counts each repository separately; backends
+        should override it with a single aggregate query.
+
+        Returns:
+            Mapping of repository ID to document count (empty repositories may be omitted)
+        """
+        return {
+            repository.id: await self.count_documents(repository_id=repository.id)
+            for repository in await self.list_repositories()
+        }
+
     @abstractmethod
     async def add_repository(self, repository: Repository) -> None:
         """Store a repository.
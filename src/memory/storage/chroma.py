@@ -20,12 +20,13 @@ BM25 Hybrid Search:
 - RRF (Reciprocal Rank Fusion) combines vector and BM25 results
 """
 
+import logging
 import re
 from uuid import UUID
 
 import structlog
 
-from memory.entities import Chunk, Embedding, SearchResult
+from memory.entities import Chunk, Embedding, EmbeddingVectors, SearchResult
 from memory.storage.base import StorageConfig, StorageError, VectorStore
 
 logger = structlog.get_logger(__name__)
@@ -217,12 +218,13 @@ class ChromaVectorStore(VectorStore):
                 documents=[chunk.content],
             )
 
-            logger.debug(
-                "embedding_added",
-                chunk_id=str(chunk.id),
-                document_id=str(chunk.document_id),
-                repository_id=str(chunk.repository_id),
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "embedding_added",
+                    chunk_id=str(chunk.id),
+                    document_id=str(chunk.document_id),
+                    repository_id=str(chunk.repository_id),
+                )
 
         except Exception as e:
             raise StorageError(
@@ -243,49 +245,59 @@ class ChromaVectorStore(VectorStore):
         Raises:
             StorageError: If batch storage fails
         """
-        if not embeddings:
+        await self.add_vectors_batch(chunks, [emb.vector for emb in embeddings], model="")
+
+    async def add_vectors_batch(self, chunks: list[Chunk], vectors: EmbeddingVectors, model: str) -> None:
+        """Store raw vectors for chunks, passing them to Chroma without Embedding objects.
+
+        Args:
+            chunks: Chunks the vectors represent
+            vectors: One vector per chunk, as lists or a 2-D array
+            model: Embedding model that produced the vectors (not stored by Chroma)
+
+        Raises:
+            StorageError: If batch storage fails
+        """
+        if not len(vectors):
             return
 
-        if len(embeddings) != len(chunks):
+        if len(vectors) != len(chunks):
             raise StorageError(
-                message=f"Embeddings and chunks length mismatch: {len(embeddings)} vs {len(chunks)}",
+                message=f"Embeddings and chunks length mismatch: {len(vectors)} vs {len(chunks)}",
                 storage_type="chroma",
             )
 
         try:
-            # Group by repository
-            by_repository: dict[UUID, tuple[list[Embedding], list[Chunk]]] = {}
-
-            for emb, chunk in zip(embeddings, chunks):
-                if chunk.repository_id not in by_repository:
-                    by_repository[chunk.repository_id] = ([], [])
-                by_repository[chunk.repository_id][0].append(emb)
-                by_repository[chunk.repository_id][1].append(chunk)
+            # Group row positions by repository
+            by_repository: dict[UUID, list[int]] = {}
+            for i, chunk in enumerate(chunks):
+                by_repository.setdefault(chunk.repository_id, []).append(i)
 
             # Add to each repository's collection
-            for repository_id, (repo_embeddings, repo_chunks) in by_repository.items():
+            for repository_id, positions in by_repository.items():
                 collection = self._get_collection(repository_id)
+                repo_chunks = [chunks[i] for i in positions]
 
                 # Prepare batch data
                 ids = [str(chunk.id) for chunk in repo_chunks]
-                vectors = [emb.vector for emb in repo_embeddings]
+                repo_vectors = vectors if len(positions) == len(chunks) else [vectors[i] for i in positions]
                 metadatas = [
                     {
-                        "chunk_id": str(chunk.id),
+                        "chunk_id": chunk_id,
                         "document_id": str(chunk.document_id),
                         "repository_id": str(chunk.repository_id),
                         "chunk_index": chunk.chunk_index,
                         "start_char": chunk.start_char,
                         "end_char": chunk.end_char,
                     }
-                    for chunk in repo_chunks
+                    for chunk_id, chunk in zip(ids, repo_chunks)
                 ]
                 documents = [chunk.content for chunk in repo_chunks]
 
                 # Add batch to collection
                 collection.add(
                     ids=ids,
-                    embeddings=vectors,
+                    embeddings=repo_vectors,
                     metadatas=metadatas,
                     documents=documents,
                 )
@@ -869,6 +881,50 @@ class ChromaVectorStore(VectorStore):
                 original_error=e,
             )
 
+    async def delete_by_document_ids(self, document_ids: list[UUID]) -> int:
+        """Delete all embeddings for several documents.
+
+        Uses one $in filter per collection instead of one query per document.
+
+        Args:
+            document_ids: Document IDs to delete
+
+        Returns:
+            Number of embeddings deleted
+
+        Raises:
+            StorageError: If deletion fails
+        """
+        if not document_ids:
+            return 0
+
+        try:
+            total_deleted = 0
+            where = {"document_id": {"$in": [str(document_id) for document_id in document_ids]}}
+
+            for coll_info in self._client.list_collections():
+                collection = self._client.get_collection(coll_info.name)
+
+                results = collection.get(where=where, include=[])
+                if results["ids"]:
+                    collection.delete(ids=results["ids"])
+                    total_deleted += len(results["ids"])
+
+            logger.info(
+                "documents_embeddings_deleted",
+                document_count=len(document_ids),
+                count=total_deleted,
+            )
+
+            return total_deleted
+
+        except Exception as e:
+            raise StorageError(
+                message=f"Failed to delete by document_ids: {str(e)}",
+                storage_type="chroma",
+                original_error=e,
+            )
+
     async def delete_by_chunk_id(self, chunk_id: UUID) -> bool:
         """Delete embedding for a specific chunk.
 
@@ -6,10 +6,20 @@ These implementations store all data in memory and are useful for:
 - Small-scale deployments
 """
 
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
 from uuid import UUID
 
 from memory.entities import Chunk, Document, Embedding, Repository, SearchResult
-from memory.storage.base import MetadataStore, StorageConfig, VectorStore
+from memory.storage.base import MetadataStore, StorageConfig, StorageError, VectorStore
+
+# Sort keys for the sort fields accepted by list_documents, matching the SQLite store
+_SORT_KEYS: dict[str, Callable[[Document], Any]] = {
+    "created_at": lambda doc: doc.created_at,
+    "updated_at": lambda doc: doc.updated_at,
+    "name": lambda doc: doc.display_name.lower(),
+}
 
 
 class InMemoryVectorStore(VectorStore):
@@ -107,6 +117,16 @@ class InMemoryVectorStore(VectorStore):
             count += original_len - len(self.collections[collection_name])
         return count
 
+    async def delete_by_document_ids(self, document_ids: list[UUID]) -> int:
+        """Delete all embeddings for several documents in one pass per collection."""
+        wanted = set(document_ids)
+        count = 0
+        for collection_name, entries in self.collections.items():
+            kept = [(emb, chunk) for emb, chunk in entries if chunk.document_id not in wanted]
+            count += len(entries) - len(kept)
+            self.collections[collection_name] = kept
+        return count
+
     async def delete_by_chunk_id(self, chunk_id: UUID) -> bool:
         """Delete embedding for a specific chunk."""
         for collection_name in self.collections:
@@ -167,10 +187,34 @@ class InMemoryMetadataStore(MetadataStore):
         """Retrieve a document by ID."""
         return self.documents.get(document_id)
 
+    async def get_documents(self, document_ids: list[UUID]) -> dict[UUID, Document]:
+        """Retrieve several documents by ID."""
+        return {document_id: self.documents[document_id] for document_id in document_ids if document_id in self.documents}
+
+    async def get_document_by_source_path(self, repository_id: UUID, source_path: str) -> Document | None:
+        """Retrieve a repository's document by its source path."""
+        return next(
+            (doc for doc in self.documents.values() if doc.repository_id == repository_id and doc.source_path == source_path),
+            None,
+        )
+
+    async def get_documents_by_source_paths(self, repository_id: UUID, source_paths: list[str]) -> dict[str, Document]:
+        """Retrieve a repository's documents for several source paths in a single pass."""
+        wanted = set(source_paths)
+        return {
+            doc.source_path: doc
+            for doc in self.documents.values()
+            if doc.repository_id == repository_id and doc.source_path in wanted
+        }
+
     async def add_chunk(self, chunk: Chunk) -> None:
         """Store a chunk."""
         self.chunks[chunk.id] = chunk
 
+    async def add_chunks(self, chunks: list[Chunk]) -> None:
+        """Store several chunks."""
+        self.chunks.update((chunk.id, chunk) for chunk in chunks)
+
     async def get_chunk(self, chunk_id: UUID) -> Chunk | None:
         """Retrieve a chunk by ID."""
         return self.chunks.get(chunk_id)
@@ -179,6 +223,19 @@ class InMemoryMetadataStore(MetadataStore):
         """Retrieve all chunks for a document."""
         return [chunk for chunk in self.chunks.values() if chunk.document_id == document_id]
 
+    async def get_chunk_counts(self, document_ids: list[UUID]) -> dict[UUID, int]:
+        """Count chunks for multiple documents in a single pass."""
+        wanted = set(document_ids)
+        return dict(Counter(chunk.document_id for chunk in self.chunks.values() if chunk.document_id in wanted))
+
+    async def count_chunks(self, repository_id: UUID) -> int:
+        """Count the chunks of a repository in a single pass."""
+        return sum(1 for chunk in self.chunks.values() if chunk.repository_id == repository_id)
+
+    async def count_documents_by_repository(self) -> dict[UUID, int]:
+        """Count documents in every repository in a single pass."""
+        return dict(Counter(document.repository_id for document in self.documents.values()))
+
     async def delete_document(self, document_id: UUID) -> bool:
         """Delete a document and its chunks."""
         if document_id not in self.documents:
@@ -196,18 +253,50 @@ class InMemoryMetadataStore(MetadataStore):
 
         return True
 
+    async def delete_documents(self, document_ids: list[UUID]) -> set[UUID]:
+        """Delete several documents and their chunks in one pass over the chunks."""
+        deleted = {document_id for document_id in document_ids if document_id in self.documents}
+        for document_id in deleted:
+            del self.documents[document_id]
+        self.chunks = {chunk_id: chunk for chunk_id, chunk in self.chunks.items() if chunk.document_id not in deleted}
+        return deleted
+
     async def list_documents(
-        self, limit: int = 100, offset: int = 0, repository_id: UUID | None = None
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        repository_id: UUID | None = None,
+        search: str | None = None,
+        sort: str = "created_at",
+        descending: bool = True,
     ) -> list[Document]:
-        """List documents with pagination."""
+        """List documents with filtering, sorting and pagination."""
+        if sort not in _SORT_KEYS:
+            raise StorageError(f"Invalid sort field: {sort}", storage_type="memory")
+
+        docs = self._filter_documents(repository_id, search)
+        docs.sort(key=_SORT_KEYS[sort], reverse=descending)
+
+        # Apply pagination
+        return docs[offset : offset + limit]
+
+    async def count_documents(self, repository_id: UUID | None = None, search: str | None = None) -> int:
+        """Count documents matching the same filters as list_documents."""
+        return len(self._filter_documents(repository_id, search))
+
+    def _filter_documents(self, repository_id: UUID | None, search: str | None) -> list[Document]:
+        """Return documents in the repository whose title contains search."""
         docs = list(self.documents.values())
 
         # Filter by repository if specified
         if repository_id is not None:
             docs = [doc for doc in docs if doc.repository_id == repository_id]
 
-        # Apply pagination
-        return docs[offset : offset + limit]
+        if search:
+            search_lower = search.lower()
+            docs = [doc for doc in docs if search_lower in (doc.title or "").lower()]
+
+        return docs
 
     async def add_repository(self, repository: Repository) -> None:
         """Store a repository."""
@@ -4,16 +4,118 @@ Provides persistent storage for documents, chunks, and repositories using SQLite
 Uses aiosqlite for async operations.
 """
 
+import asyncio
+import functools
 import json
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Concatenate, ParamSpec, TypeVar
 from uuid import UUID
 
 import aiosqlite
 
-from memory.entities import Chunk, Document, DocumentType, Repository
+from memory.entities import Chunk, Document, DocumentSummary, DocumentType, Repository
 from memory.storage.base import MetadataStore, StorageConfig, StorageError
 
+# Display name of a document: its title, or its source path when untitled
+_DOCUMENT_NAME_EXPR = "COALESCE(NULLIF(title, ''), source_path)"
+
+# SQL expressions for the sort fields accepted by list_documents
+_SORT_COLUMNS = {
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "name": f"LOWER({_DOCUMENT_NAME_EXPR})",
+}
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _serialized_write(
+    method: "Callable[Concatenate[SQLiteMetadataStore, P], Coroutine[Any, Any, R]]",
+) -> "Callable[Concatenate[SQLiteMetadataStore, P], Coroutine[Any, Any, R]]":
+    """Run a write method outside any other task's open transaction.
+
+    Writes from the task that owns the transaction join it; writes from other
+    tasks wait for it to finish, so they are never committed or rolled back with it.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "SQLiteMetadataStore", /, *args: P.args, **kwargs: P.kwargs) -> R:
+        if self._transaction_owner is asyncio.current_task():
+            return await method(self, *args, **kwargs)
+        async with self._transaction_lock:
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _row_to_document(row: aiosqlite.Row) -> Document:
+    """Build a Document from a documents table row."""
+    return Document(
+        id=UUID(row["id"]),
+        repository_id=UUID(row["repository_id"]),
+        source_path=row["source_path"],
+        relative_path=row["relative_path"],
+        doc_type=DocumentType(row["doc_type"]),
+        title=row["title"],
+        content=row["content"],
+        content_md5=row["content_md5"],
+        metadata=json.loads(row["metadata"]),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+    )
+
+
+_INSERT_CHUNK_SQL = """
+    INSERT INTO chunks (id, repository_id, document_id, content, content_length, chunk_index, start_char, end_char, metadata, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _chunk_params(chunk: Chunk) -> tuple[str, str, str, str, int, int, int, int, str, str]:
+    """Build the parameters of _INSERT_CHUNK_SQL for a chunk."""
+    return (
+        str(chunk.id),
+        str(chunk.repository_id),
+        str(chunk.document_id),
+        chunk.content,
+        len(chunk.content),
+        chunk.chunk_index,
+        chunk.start_char,
+        chunk.end_char,
+        json.dumps(chunk.metadata),
+        chunk.created_at.isoformat(),
+    )
+
+
+def _summary_columns(preview_chars: int | None) -> str:
+    """Build the column list for DocumentSummary rows, reading at most preview_chars of content."""
+    preview = "content" if preview_chars is None else f"substr(content, 1, {int(preview_chars)})"
+    return (
+        "id, repository_id, source_path, relative_path, doc_type, title, content_length, "
+        f"{preview} AS content_preview, created_at, updated_at"
+    )
+
+
+def _row_to_document_summary(row: aiosqlite.Row) -> DocumentSummary:
+    """Build a DocumentSummary from a row selected with _summary_columns."""
+    return DocumentSummary(
+        id=UUID(row["id"]),
+        repository_id=UUID(row["repository_id"]),
+        source_path=row["source_path"],
+        relative_path=row["relative_path"],
+        doc_type=DocumentType(row["doc_type"]),
+        title=row["title"],
+        content_length=row["content_length"],
+        content_preview=row["content_preview"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+    )
+
 
 class SQLiteMetadataStore(MetadataStore):
     """SQLite metadata store implementation.
@@ -42,6 +144,9 @@ class SQLiteMetadataStore(MetadataStore):
             self.db_path = os.path.expanduser(conn_str)
 
         self.connection: aiosqlite.Connection | None = None
+        # Transactions share the connection, so only one task may hold one at a time
+        self._transaction_lock = asyncio.Lock()
+        self._transaction_owner: asyncio.Task[Any] | None = None
 
     async def initialize(self) -> None:
         """Initialize the metadata store (create tables)."""
@@ -85,6 +190,7 @@ class SQLiteMetadataStore(MetadataStore):
                     doc_type TEXT NOT NULL,
                     title TEXT,
                     content TEXT NOT NULL,
+                    content_length INTEGER,
                     content_md5 TEXT,
                     metadata TEXT NOT NULL,
                     created_at TEXT NOT NULL,
@@ -104,6 +210,9 @@ class SQLiteMetadataStore(MetadataStore):
                 await self.connection.execute("""
                     ALTER TABLE documents ADD COLUMN relative_path TEXT NOT NULL DEFAULT ''
                 """)
+            if 'content_length' not in columns:
+                await self.connection.execute("ALTER TABLE documents ADD COLUMN content_length INTEGER")
+                await self.connection.execute("UPDATE documents SET content_length = LENGTH(content)")
 
             # Create chunks table with repository_id
             await self.connection.execute("""
@@ -112,6 +221,7 @@ class SQLiteMetadataStore(MetadataStore):
                     repository_id TEXT NOT NULL,
                     document_id TEXT NOT NULL,
                     content TEXT NOT NULL,
+                    content_length INTEGER,
                     chunk_index INTEGER NOT NULL,
                     start_char INTEGER NOT NULL,
                     end_char INTEGER NOT NULL,
@@ -122,6 +232,13 @@ class SQLiteMetadataStore(MetadataStore):
                 )
             """)
 
+            # Migration: Store chunk lengths so size statistics need not read content
+            cursor = await self.connection.execute("PRAGMA table_info(chunks)")
+            columns = [row[1] for row in await cursor.fetchall()]
+            if 'content_length' not in columns:
+                await self.connection.execute("ALTER TABLE chunks ADD COLUMN content_length INTEGER")
+                await self.connection.execute("UPDATE chunks SET content_length = LENGTH(content)")
+
             # Enable foreign key constraints for CASCADE DELETE to work
             await self.connection.execute("PRAGMA foreign_keys = ON")
 
@@ -129,6 +246,12 @@ class SQLiteMetadataStore(MetadataStore):
             await self.connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_documents_repository ON documents(repository_id)"
             )
+            await self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_documents_repository_name ON documents(repository_id, {_DOCUMENT_NAME_EXPR})"
+            )
+            await self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_documents_repository_source ON documents(repository_id, source_path)"
+            )
             await self.connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_chunks_repository ON chunks(repository_id)"
             )
@@ -148,6 +271,44 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Commit the writes made inside the block once, or roll them all back."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        task = asyncio.current_task()
+        if self._transaction_owner is task:
+            yield
+            return
+
+        async with self._transaction_lock:
+            self._transaction_owner = task
+            try:
+                yield
+            except BaseException:
+                await self.connection.rollback()
+                raise
+            else:
+                await self.connection.commit()
+            finally:
+                self._transaction_owner = None
+
+    async def _commit(self) -> None:
+        """Commit, unless the write belongs to the current task's open transaction."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+        if self._transaction_owner is not asyncio.current_task():
+            await self.connection.commit()
+
+    async def _rollback(self) -> None:
+        """Roll back, unless the write belongs to the current task's open transaction."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+        if self._transaction_owner is not asyncio.current_task():
+            await self.connection.rollback()
+
+    @_serialized_write
     async def add_repository(self, repository: Repository) -> None:
         """Store a repository."""
         if not self.connection:
@@ -170,7 +331,7 @@ class SQLiteMetadataStore(MetadataStore):
                     json.dumps(repository.metadata),
                 ),
             )
-            await self.connection.commit()
+            await self._commit()
         except Exception as e:
             raise StorageError(
                 f"Failed to add repository: {e}",
@@ -271,6 +432,7 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    @_serialized_write
     async def delete_repository(self, repository_id: UUID) -> bool:
         """Delete a repository."""
         if not self.connection:
@@ -281,7 +443,7 @@ class SQLiteMetadataStore(MetadataStore):
                 "DELETE FROM repositories WHERE id = ?",
                 (str(repository_id),),
             )
-            await self.connection.commit()
+            await self._commit()
             return cursor.rowcount > 0
         except Exception as e:
             raise StorageError(
@@ -290,6 +452,7 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    @_serialized_write
     async def delete_by_repository(self, repository_id: UUID) -> int:
         """Delete all documents, chunks, and embeddings for a repository.
 
@@ -315,7 +478,7 @@ class SQLiteMetadataStore(MetadataStore):
                 "DELETE FROM documents WHERE repository_id = ?",
                 (str(repository_id),),
             )
-            await self.connection.commit()
+            await self._commit()
             doc_count = cursor.rowcount
             return doc_count
         except Exception as e:
@@ -325,6 +488,7 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    @_serialized_write
     async def add_document(self, document: Document) -> None:
         """Store a document."""
         if not self.connection:
@@ -333,8 +497,8 @@ class SQLiteMetadataStore(MetadataStore):
         try:
             await self.connection.execute(
                 """
-                INSERT INTO documents (id, repository_id, source_path, relative_path, doc_type, title, content, content_md5, metadata, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO documents (id, repository_id, source_path, relative_path, doc_type, title, content, content_length, content_md5, metadata, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     str(document.id),
@@ -344,13 +508,14 @@ class SQLiteMetadataStore(MetadataStore):
                     document.doc_type.value,
                     document.title,
                     document.content,
+                    len(document.content),
                     document.content_md5,
                     json.dumps(document.metadata),
                     document.created_at.isoformat(),
                     document.updated_at.isoformat(),
                 ),
             )
-            await self.connection.commit()
+            await self._commit()
         except Exception as e:
             raise StorageError(
                 f"Failed to add document: {e}",
@@ -373,19 +538,7 @@ class SQLiteMetadataStore(MetadataStore):
             if not row:
                 return None
 
-            return Document(
-                id=UUID(row["id"]),
-                repository_id=UUID(row["repository_id"]),
-                source_path=row["source_path"],
-                relative_path=row["relative_path"],
-                doc_type=DocumentType(row["doc_type"]),
-                title=row["title"],
-                content=row["content"],
-                content_md5=row["content_md5"],
-                metadata=json.loads(row["metadata"]),
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
+            return _row_to_document(row)
         except Exception as e:
             raise StorageError(
                 f"Failed to get document: {e}",
@@ -393,30 +546,138 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    async def get_documents(self, document_ids: list[UUID]) -> dict[UUID, Document]:
+        """Retrieve several documents by ID in a single query."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        ids = list(dict.fromkeys(str(document_id) for document_id in document_ids))
+        if not ids:
+            return {}
+
+        try:
+            placeholders = ",".join("?" * len(ids))
+            cursor = await self.connection.execute(f"SELECT * FROM documents WHERE id IN ({placeholders})", ids)
+            rows = await cursor.fetchall()
+
+            documents = (_row_to_document(row) for row in rows)
+            return {document.id: document for document in documents}
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get documents: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def get_document_by_source_path(self, repository_id: UUID, source_path: str) -> Document | None:
+        """Retrieve a repository's document by its source path using the (repository_id, source_path) index."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        try:
+            cursor = await self.connection.execute(
+                "SELECT * FROM documents WHERE repository_id = ? AND source_path = ? LIMIT 1",
+                (str(repository_id), source_path),
+            )
+            row = await cursor.fetchone()
+
+            if not row:
+                return None
+
+            return _row_to_document(row)
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get document by source path: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def get_documents_by_source_paths(self, repository_id: UUID, source_paths: list[str]) -> dict[str, Document]:
+        """Retrieve a repository's documents for several source paths in a single query."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        if not source_paths:
+            return {}
+
+        try:
+            placeholders = ",".join("?" * len(source_paths))
+            cursor = await self.connection.execute(
+                f"SELECT * FROM documents WHERE repository_id = ? AND source_path IN ({placeholders})",
+                [str(repository_id), *source_paths],
+            )
+            rows = await cursor.fetchall()
+
+            return {row["source_path"]: _row_to_document(row) for row in rows}
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get documents by source path: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def get_document_summary(
+        self, document_id: UUID, preview_chars: int | None = 500
+    ) -> DocumentSummary | None:
+        """Retrieve a document summary, reading only the previewed part of its content."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        try:
+            cursor = await self.connection.execute(
+                f"SELECT {_summary_columns(preview_chars)} FROM documents WHERE id = ?",
+                (str(document_id),),
+            )
+            row = await cursor.fetchone()
+
+            if not row:
+                return None
+
+            return _row_to_document_summary(row)
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get document summary: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def get_documents_by_names(self, repository_id: UUID, names: list[str]) -> dict[str, list[Document]]:
+        """Find documents by display name with a single indexed query."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        if not names:
+            return {}
+
+        try:
+            placeholders = ",".join("?" * len(names))
+            cursor = await self.connection.execute(
+                f"SELECT * FROM documents WHERE repository_id = ? AND {_DOCUMENT_NAME_EXPR} IN ({placeholders})",
+                (str(repository_id), *names),
+            )
+            rows = await cursor.fetchall()
+
+            matches: dict[str, list[Document]] = {}
+            for row in rows:
+                document = _row_to_document(row)
+                matches.setdefault(document.display_name, []).append(document)
+            return matches
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get documents by names: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    @_serialized_write
     async def add_chunk(self, chunk: Chunk) -> None:
         """Store a chunk."""
         if not self.connection:
             raise StorageError("Database not initialized", storage_type="sqlite")
 
         try:
-            await self.connection.execute(
-                """
-                INSERT INTO chunks (id, repository_id, document_id, content, chunk_index, start_char, end_char, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(chunk.id),
-                    str(chunk.repository_id),
-                    str(chunk.document_id),
-                    chunk.content,
-                    chunk.chunk_index,
-                    chunk.start_char,
-                    chunk.end_char,
-                    json.dumps(chunk.metadata),
-                    chunk.created_at.isoformat(),
-                ),
-            )
-            await self.connection.commit()
+            await self.connection.execute(_INSERT_CHUNK_SQL, _chunk_params(chunk))
+            await self._commit()
         except Exception as e:
             raise StorageError(
                 f"Failed to add chunk: {e}",
@@ -424,6 +685,25 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    @_serialized_write
+    async def add_chunks(self, chunks: list[Chunk]) -> None:
+        """Store several chunks with one executemany and a single commit."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+        if not chunks:
+            return
+
+        try:
+            await self.connection.executemany(_INSERT_CHUNK_SQL, [_chunk_params(chunk) for chunk in chunks])
+            await self._commit()
+        except Exception as e:
+            await self._rollback()
+            raise StorageError(
+                f"Failed to add chunks: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
     async def get_chunk(self, chunk_id: UUID) -> Chunk | None:
         """Retrieve a chunk by ID."""
         if not self.connection:
@@ -490,6 +770,65 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    async def get_chunk_sizes(self, document_id: UUID) -> list[int]:
+        """Get chunk content lengths from the stored length column."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        try:
+            cursor = await self.connection.execute(
+                "SELECT content_length FROM chunks WHERE document_id = ? ORDER BY chunk_index",
+                (str(document_id),),
+            )
+            return [row["content_length"] for row in await cursor.fetchall()]
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get chunk sizes: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def get_chunk_counts(self, document_ids: list[UUID]) -> dict[UUID, int]:
+        """Count chunks for multiple documents in a single query."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        if not document_ids:
+            return {}
+
+        try:
+            placeholders = ",".join("?" * len(document_ids))
+            cursor = await self.connection.execute(
+                f"SELECT document_id, COUNT(*) AS chunk_count FROM chunks WHERE document_id IN ({placeholders}) GROUP BY document_id",
+                [str(document_id) for document_id in document_ids],
+            )
+            rows = await cursor.fetchall()
+
+            return {UUID(row["document_id"]): row["chunk_count"] for row in rows}
+        except Exception as e:
+            raise StorageError(
+                f"Failed to get chunk counts: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def count_chunks(self, repository_id: UUID) -> int:
+        """Count the chunks of a repository in a single query."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        try:
+            cursor = await self.connection.execute("SELECT COUNT(*) FROM chunks WHERE repository_id = ?", (str(repository_id),))
+            row = await cursor.fetchone()
+            return int(row[0]) if row else 0
+        except Exception as e:
+            raise StorageError(
+                f"Failed to count chunks: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    @_serialized_write
     async def delete_document(self, document_id: UUID) -> bool:
         """Delete a document and its chunks."""
         if not self.connection:
@@ -507,7 +846,7 @@ class SQLiteMetadataStore(MetadataStore):
                 "DELETE FROM documents WHERE id = ?",
                 (str(document_id),),
             )
-            await self.connection.commit()
+            await self._commit()
             return cursor.rowcount > 0
         except Exception as e:
             raise StorageError(
@@ -516,43 +855,63 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    @_serialized_write
+    async def delete_documents(self, document_ids: list[UUID]) -> set[UUID]:
+        """Delete several documents and their chunks in one transaction."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        if not document_ids:
+            return set()
+
+        try:
+            placeholders = ",".join("?" * len(document_ids))
+            params = [str(document_id) for document_id in document_ids]
+            cursor = await self.connection.execute(
+                f"SELECT id FROM documents WHERE id IN ({placeholders})",
+                params,
+            )
+            deleted = {UUID(row["id"]) for row in await cursor.fetchall()}
+
+            await self.connection.execute(f"DELETE FROM chunks WHERE document_id IN ({placeholders})", params)
+            await self.connection.execute(f"DELETE FROM documents WHERE id IN ({placeholders})", params)
+            await self._commit()
+            return deleted
+        except Exception as e:
+            await self._rollback()
+            raise StorageError(
+                f"Failed to delete documents: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
     async def list_documents(
-        self, limit: int = 100, offset: int = 0, repository_id: UUID | None = None
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        repository_id: UUID | None = None,
+        search: str | None = None,
+        sort: str = "created_at",
+        descending: bool = True,
     ) -> list[Document]:
-        """List documents with pagination."""
+        """List documents with filtering, sorting and pagination done in SQL."""
         if not self.connection:
             raise StorageError("Database not initialized", storage_type="sqlite")
 
+        if sort not in _SORT_COLUMNS:
+            raise StorageError(f"Invalid sort field: {sort}", storage_type="sqlite")
+
         try:
-            if repository_id is not None:
-                cursor = await self.connection.execute(
-                    "SELECT * FROM documents WHERE repository_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                    (str(repository_id), limit, offset),
-                )
-            else:
-                cursor = await self.connection.execute(
-                    "SELECT * FROM documents ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                    (limit, offset),
-                )
+            where, params = self._document_filters(repository_id, search)
+            direction = "DESC" if descending else "ASC"
+            cursor = await self.connection.execute(
+                f"SELECT * FROM documents{where} ORDER BY {_SORT_COLUMNS[sort]} {direction} LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            )
 
             rows = await cursor.fetchall()
 
-            return [
-                Document(
-                    id=UUID(row["id"]),
-                    repository_id=UUID(row["repository_id"]),
-                    source_path=row["source_path"],
-                    relative_path=row["relative_path"],
-                    doc_type=DocumentType(row["doc_type"]),
-                    title=row["title"],
-                    content=row["content"],
-                    content_md5=row["content_md5"],
-                    metadata=json.loads(row["metadata"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                )
-                for row in rows
-            ]
+            return [_row_to_document(row) for row in rows]
         except Exception as e:
             raise StorageError(
                 f"Failed to list documents: {e}",
@@ -560,6 +919,91 @@ class SQLiteMetadataStore(MetadataStore):
                 original_error=e,
             )
 
+    async def list_document_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        repository_id: UUID | None = None,
+        search: str | None = None,
+        sort: str = "created_at",
+        descending: bool = True,
+        preview_chars: int | None = 0,
+    ) -> list[DocumentSummary]:
+        """List document summaries, selecting only the summary columns."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        if sort not in _SORT_COLUMNS:
+            raise StorageError(f"Invalid sort field: {sort}", storage_type="sqlite")
+
+        try:
+            where, params = self._document_filters(repository_id, search)
+            direction = "DESC" if descending else "ASC"
+            cursor = await self.connection.execute(
+                f"SELECT {_summary_columns(preview_chars)} FROM documents{where} "
+                f"ORDER BY {_SORT_COLUMNS[sort]} {direction} LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            )
+
+            return [_row_to_document_summary(row) for row in await cursor.fetchall()]
+        except Exception as e:
+            raise StorageError(
+                f"Failed to list document summaries: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def count_documents(self, repository_id: UUID | None = None, search: str | None = None) -> int:
+        """Count documents matching the same filters as list_documents."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        try:
+            where, params = self._document_filters(repository_id, search)
+            cursor = await self.connection.execute(f"SELECT COUNT(*) FROM documents{where}", params)
+            row = await cursor.fetchone()
+            return int(row[0]) if row else 0
+        except Exception as e:
+            raise StorageError(
+                f"Failed to count documents: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    async def count_documents_by_repository(self) -> dict[UUID, int]:
+        """Count documents in every repository in a single query."""
+        if not self.connection:
+            raise StorageError("Database not initialized", storage_type="sqlite")
+
+        try:
+            cursor = await self.connection.execute(
+                "SELECT repository_id, COUNT(*) AS document_count FROM documents GROUP BY repository_id"
+            )
+            rows = await cursor.fetchall()
+
+            return {UUID(row["repository_id"]): row["document_count"] for row in rows}
+        except Exception as e:
+            raise StorageError(
+                f"Failed to count documents by repository: {e}",
+                storage_type="sqlite",
+                original_error=e,
+            )
+
+    @staticmethod
+    def _document_filters(repository_id: UUID | None, search: str | None) -> tuple[str, tuple[str, ...]]:
+        """Build the WHERE clause shared by list_documents and count_documents."""
+        clauses = []
+        params: list[str] = []
+        if repository_id is not None:
+            clauses.append("repository_id = ?")
+            params.append(str(repository_id))
+        if search:
+            escaped = search.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("LOWER(COALESCE(title, '')) LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
     async def close(self) -> None:
         """Close connections and cleanup resources."""
         if self.connection:
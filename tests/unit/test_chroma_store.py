@@ -597,3 +597,28 @@ class TestChromaVectorStore:
         )
 
         assert len(results) == 10
+
+    @pytest.mark.asyncio
+    async def test_add_vectors_batch(self, store):
+        """Test adding raw vectors for chunks in two repositories."""
+        from memory.entities import Chunk
+
+        repository_ids = [uuid4(), uuid4()]
+        chunks = [
+            Chunk(
+                repository_id=repository_ids[i % 2],
+                document_id=uuid4(),
+                content=f"Chunk {i} content",
+                chunk_index=0,
+                start_char=0,
+                end_char=15,
+            )
+            for i in range(4)
+        ]
+        vectors = [[0.1 * i, 0.2 * i, 0.3 * i] for i in range(1, 5)]
+
+        await store.add_vectors_batch(chunks, vectors, model="test-model")
+
+        assert await store.count() == 4
+        results = await store.search([0.2, 0.4, 0.6], top_k=4, repository_id=repository_ids[1])
+        assert {result.chunk.id for result in results} == {chunks[1].id, chunks[3].id}
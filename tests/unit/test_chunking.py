@@ -5,7 +5,7 @@ from uuid import uuid4
 import pytest
 
 from memory.config.schema import ChunkingConfig
-from memory.core.chunking import chunk_text, create_chunks
+from memory.core.chunking import chunk_text, create_chunks, iter_chunks
 from memory.entities import Document, DocumentType
 
 
@@ -408,3 +408,16 @@ class TestCreateChunks:
         # Chunks should have whitespace stripped
         for chunk in chunks:
             assert chunk.content == chunk.content.strip()
+
+    def test_iter_chunks_is_lazy(self, sample_document):
+        """Test that iter_chunks yields the same chunks as create_chunks, one at a time."""
+        config = ChunkingConfig(chunk_size=100, chunk_overlap=0, min_chunk_size=10)
+
+        chunk_iter = iter_chunks(sample_document, config)
+        first = next(chunk_iter)
+        rest = list(chunk_iter)
+        expected = create_chunks(sample_document, config)
+
+        assert [(c.content, c.chunk_index, c.start_char) for c in [first, *rest]] == [
+            (c.content, c.chunk_index, c.start_char) for c in expected
+        ]
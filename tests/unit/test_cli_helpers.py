@@ -0,0 +1,440 @@
+"""Unit tests for CLI helper functions."""
+
+import asyncio
+import datetime as dt
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from memory.config.schema import AppConfig, MetadataStoreType, VectorStoreType
+from memory.entities import Chunk, DocumentType, Repository
+from memory.interfaces import cli
+from memory.interfaces.cli import (
+    _chunk_size_stats,
+    _default_config_path,
+    _default_or_named_repository,
+    _fmt_local,
+    _get_stores,
+    _is_probably_text,
+    _iter_files,
+    _load_config,
+    _load_config_file,
+    _prepare_ingest_content,
+    _preview,
+    _print_table,
+    _read_ingest_file,
+    _shutdown_runner,
+    _store_cache,
+    _sum_min_max,
+    _write_json,
+    close_cached_stores,
+    run_async,
+)
+
+
+class TestPrepareIngestContent:
+    """Test _prepare_ingest_content helper."""
+
+    def test_markdown_file(self):
+        """Test that markdown files get a filename heading and markdown type."""
+        content, doc_type, content_md5 = _prepare_ingest_content(Path("/notes/todo.md"), "- item")
+
+        assert content == "# todo\n\n- item"
+        assert doc_type == DocumentType.MARKDOWN
+        assert content_md5 == hashlib.md5(content.encode("utf-8")).hexdigest()
+
+    def test_markdown_extension_is_case_insensitive(self):
+        """Test that upper-case markdown extensions are detected."""
+        _, doc_type, _ = _prepare_ingest_content(Path("README.MARKDOWN"), "text")
+
+        assert doc_type == DocumentType.MARKDOWN
+
+    def test_other_files_are_text(self):
+        """Test that non-markdown files are treated as text."""
+        content, doc_type, _ = _prepare_ingest_content(Path("notes.txt"), "plain")
+
+        assert content == "# notes\n\nplain"
+        assert doc_type == DocumentType.TEXT
+
+    def test_md5_changes_with_content(self):
+        """Test that different content yields a different hash."""
+        _, _, first = _prepare_ingest_content(Path("a.md"), "one")
+        _, _, second = _prepare_ingest_content(Path("a.md"), "two")
+
+        assert first != second
+
+
+class TestReadIngestFile:
+    """Test _read_ingest_file helper."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"plain text",
+            b"line one\r\nline two\rline three\n",
+            ("é漢字🙂" * 50).encode("utf-8"),
+            b"",
+        ],
+        ids=["plain", "newlines", "multibyte", "empty"],
+    )
+    def test_matches_prepare_ingest_content(self, tmp_path, data):
+        """Test that block-wise reading gives the same content and hash as read_text."""
+        path = tmp_path / "note.md"
+        path.write_bytes(data)
+
+        # A tiny block size splits multi-byte characters and CRLF pairs across blocks
+        assert _read_ingest_file(path, block_size=3) == _prepare_ingest_content(path, path.read_text(encoding="utf-8"))
+
+    def test_invalid_utf8(self, tmp_path):
+        """Test that binary content raises UnicodeDecodeError like read_text."""
+        path = tmp_path / "image.md"
+        path.write_bytes(b"\x89PNG\r\n\xff\xfe")
+
+        with pytest.raises(UnicodeDecodeError):
+            _read_ingest_file(path)
+
+    def test_binary_content_rejected_before_decoding(self, tmp_path):
+        """Test that valid UTF-8 with binary markers is rejected from its first block."""
+        path = tmp_path / "data.md"
+        path.write_bytes(b"header\x00\x01\x02" + b"text " * 100)
+
+        with pytest.raises(UnicodeDecodeError, match="binary content"):
+            _read_ingest_file(path)
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"", True),
+            (b"# Title\n\n\tindented\r\n\x1b[1mbold\x1b[0m", True),
+            ("中文内容".encode(), True),
+            (b"abc\x00def", False),
+            (bytes(range(1, 32)) * 4 + b"text", False),
+        ],
+        ids=["empty", "text-controls", "multibyte", "nul", "control-heavy"],
+    )
+    def test_is_probably_text(self, data, expected):
+        """Test the text/binary heuristic."""
+        assert _is_probably_text(data) is expected
+
+
+class TestIterFiles:
+    """Test _iter_files helper."""
+
+    def test_walks_nested_directories(self, tmp_path):
+        """Test that files at every depth are found and directories are not."""
+        (tmp_path / "a.md").write_text("a", encoding="utf-8")
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "sub" / "b.md").write_text("b", encoding="utf-8")
+        (tmp_path / "sub" / "deeper" / "c.txt").write_text("c", encoding="utf-8")
+
+        found = sorted(Path(entry.path).relative_to(tmp_path).as_posix() for entry in _iter_files(tmp_path))
+
+        assert found == ["a.md", "sub/b.md", "sub/deeper/c.txt"]
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test that a symlink back to the root does not cause a loop."""
+        (tmp_path / "a.md").write_text("a", encoding="utf-8")
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        assert [entry.name for entry in _iter_files(tmp_path)] == ["a.md"]
+
+
+@pytest.mark.asyncio
+class TestGetStores:
+    """Test _get_stores caching."""
+
+    @staticmethod
+    def make_config() -> AppConfig:
+        config = AppConfig()
+        config.metadata_store.store_type = MetadataStoreType.MEMORY
+        config.vector_store.store_type = VectorStoreType.MEMORY
+        return config
+
+    async def test_stores_are_reused_until_closed(self):
+        """Test that stores are opened once per storage configuration."""
+        first = await _get_stores(self.make_config())
+        second = await _get_stores(self.make_config())
+        assert first is second
+
+        assert first.metadata_store is first[0]
+
+        await close_cached_stores()
+        assert not _store_cache
+        assert await _get_stores(self.make_config()) is not first
+        await close_cached_stores()
+
+    async def test_vector_store_opened_only_when_needed(self):
+        """Test that metadata-only callers skip the vector store until one needs it."""
+        metadata_only = await _get_stores(self.make_config(), need_vector=False)
+        assert metadata_only.vector_store is None
+
+        full = await _get_stores(self.make_config())
+        assert full.metadata_store is metadata_only.metadata_store
+        assert full.vector_store is not None
+        assert await _get_stores(self.make_config(), need_vector=False) is full
+
+        await close_cached_stores()
+
+    async def test_close_errors_are_not_raised(self):
+        """Test that a failing close does not stop the other store from closing."""
+        metadata_store, vector_store = await _get_stores(self.make_config())
+        metadata_store.close = AsyncMock(side_effect=RuntimeError("boom"))
+        vector_store.close = AsyncMock()
+
+        await close_cached_stores()
+
+        metadata_store.close.assert_awaited_once()
+        vector_store.close.assert_awaited_once()
+
+    async def test_failed_initialize_closes_opened_store(self):
+        """Test that if one store fails to initialize, the other is closed and nothing is cached."""
+        config = self.make_config()
+        failing = AsyncMock()
+        failing.initialize.side_effect = RuntimeError("vector store down")
+        opened = AsyncMock()
+
+        with (
+            patch("memory.storage.create_metadata_store", return_value=opened),
+            patch("memory.storage.create_vector_store", return_value=failing),
+            pytest.raises(RuntimeError, match="vector store down"),
+        ):
+            await _get_stores(config)
+
+        opened.initialize.assert_awaited_once()
+        opened.close.assert_awaited_once()
+        failing.close.assert_not_awaited()
+        assert not _store_cache
+
+
+class TestRunAsync:
+    """Test the shared event loop used by run_async."""
+
+    def test_loop_is_shared_until_shutdown(self):
+        """Test that commands and store cleanup run on one loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_async(current_loop())
+        assert run_async(current_loop()) is first
+
+        run_async(_get_stores(TestGetStores.make_config()))
+        _shutdown_runner()
+
+        assert not _store_cache
+        assert cli._runner is None
+        assert first.is_closed()
+
+    def test_shutdown_without_loop(self):
+        """Test that shutting down before any command ran is a no-op."""
+        _shutdown_runner()
+
+        assert cli._runner is None
+
+
+class TestWriteJson:
+    """Test _write_json output."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def encoder(self, request, monkeypatch):
+        """Run each test with orjson and with the stdlib fallback."""
+        if request.param == "stdlib":
+            monkeypatch.setattr(cli, "orjson", None)
+        elif cli.orjson is None:
+            pytest.skip("orjson not installed")
+
+    def test_plain_object(self, encoder, capsysbinary):
+        """Test that an object without a streamed key is written as-is."""
+        _write_json({"name": "café", "count": 2})
+
+        assert json.loads(capsysbinary.readouterr().out) == {"name": "café", "count": 2}
+
+    def test_streamed_items(self, encoder, capsysbinary):
+        """Test that streamed items are appended as the last field."""
+        items = ({"index": i, "tags": ["a", "b"]} for i in range(3))
+        _write_json({"page": 1}, "documents", items)
+
+        output = capsysbinary.readouterr().out
+        assert json.loads(output) == {"page": 1, "documents": [{"index": i, "tags": ["a", "b"]} for i in range(3)]}
+        assert output == json.dumps(json.loads(output), indent=2).encode() + b"\n"
+
+    def test_streamed_empty(self, encoder, capsysbinary):
+        """Test empty data and an empty stream."""
+        _write_json({}, "documents", [])
+
+        assert json.loads(capsysbinary.readouterr().out) == {"documents": []}
+
+
+class TestChunkSizeStats:
+    """Test _chunk_size_stats helper."""
+
+    @staticmethod
+    def make_chunks(*contents: str) -> list[Chunk]:
+        document_id = uuid4()
+        return [
+            Chunk(
+                repository_id=document_id,
+                document_id=document_id,
+                content=content,
+                chunk_index=i,
+                start_char=0,
+                end_char=len(content),
+            )
+            for i, content in enumerate(contents)
+        ]
+
+    def test_sizes(self):
+        """Test total, minimum and maximum sizes."""
+        assert _chunk_size_stats(self.make_chunks("abc", "a", "abcdef")) == (10, 1, 6)
+
+    def test_sizes_without_numpy(self, monkeypatch):
+        """Test the pure Python fallback."""
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        assert _chunk_size_stats(self.make_chunks("abc", "a", "abcdef")) == (10, 1, 6)
+
+    def test_empty(self):
+        """Test that no chunks yields zeros."""
+        assert _chunk_size_stats([]) == (0, 0, 0)
+
+    def test_sum_min_max(self):
+        """Test the single-pass reduction used without NumPy."""
+        assert _sum_min_max(iter([3, 1, 6, 2])) == (12, 1, 6)
+        assert _sum_min_max([4]) == (4, 4, 4)
+
+
+class TestDefaultOrNamedRepository:
+    """Test _default_or_named_repository helper."""
+
+    def test_reuses_default_repository(self):
+        """Test that the fetched default repository is returned when requested by name."""
+        default_repo = Repository(name="default")
+
+        assert _default_or_named_repository(default_repo, AppConfig(default_repository="default"), "default") is default_repo
+
+    def test_other_or_missing_repository_needs_lookup(self):
+        """Test that other names, or a missing default, fall through to a lookup."""
+        config = AppConfig(default_repository="default")
+
+        assert _default_or_named_repository(Repository(name="default"), config, "notes") is None
+        assert _default_or_named_repository(None, config, "default") is None
+
+
+class TestFmtLocal:
+    """Test _fmt_local helper."""
+
+    def test_formats_utc_as_local_time(self):
+        """Test that naive UTC timestamps are shown in local time."""
+        ts = dt.datetime(2024, 1, 2, 3, 4, 5)
+        expected = ts.replace(tzinfo=dt.UTC).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+
+        assert _fmt_local(ts) == expected
+
+    def test_missing_timestamp(self):
+        """Test that a missing timestamp is shown as a dash."""
+        assert _fmt_local(None) == "-"
+
+
+class TestPreview:
+    """Test _preview helper."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within the limit is returned as-is."""
+        assert _preview("abc", 3) == "abc"
+
+    def test_long_text_truncated(self):
+        """Test that longer text is cut and marked."""
+        assert _preview("abcdef", 3) == "abc..."
+
+
+class TestPrintTable:
+    """Test _print_table output modes."""
+
+    COLUMNS = [{"header": "Name"}, {"header": "Size"}]
+
+    def test_small_tables_use_rich_table(self, capsys):
+        """Test that few rows are rendered as a Rich table."""
+        _print_table("Items", self.COLUMNS, [("a", "1")], 1)
+
+        output = capsys.readouterr().out
+        assert "Items" in output
+        assert " | " not in output
+
+    def test_large_tables_are_streamed(self, capsys, monkeypatch):
+        """Test that rows above the threshold are printed one line each."""
+        monkeypatch.setattr(cli, "STREAM_TABLE_ROWS", 1)
+
+        _print_table("Items", self.COLUMNS, [("a", "1"), ("b [x]", "2\n3")], 2)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1:] == ["Name | Size", "a | 1", "b [x] | 2 3"]
+
+
+class TestLoadConfig:
+    """Test _load_config memoization."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self, monkeypatch):
+        """Start each test with an empty config cache and no logging installed."""
+        _load_config_file.cache_clear()
+        _default_config_path.cache_clear()
+        monkeypatch.setattr(cli, "_logging_key", None)
+        yield
+        _load_config_file.cache_clear()
+        _default_config_path.cache_clear()
+
+    def test_config_is_parsed_once_per_path(self, tmp_path):
+        """Test that the same file is parsed and logging configured only once."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('default_repository = "notes"\n', encoding="utf-8")
+
+        with patch("memory.core.logging.configure_from_config") as configure:
+            first = _load_config(config_file)
+            second = _load_config(tmp_path / "." / "config.toml")
+
+        assert first is second
+        assert first.default_repository == "notes"
+        configure.assert_called_once_with(first.logging)
+
+    def test_logging_reconfigured_when_it_changes(self, tmp_path):
+        """Test that a config with different logging settings reconfigures logging."""
+        quiet = tmp_path / "quiet.toml"
+        quiet.write_text('[logging]\nlevel = "ERROR"\n', encoding="utf-8")
+        verbose = tmp_path / "verbose.toml"
+        verbose.write_text('[logging]\nlevel = "DEBUG"\n', encoding="utf-8")
+
+        with patch("memory.core.logging.configure_from_config") as configure:
+            _load_config(quiet)
+            _load_config(verbose)
+            _load_config(verbose)
+
+        assert configure.call_count == 2
+
+    def test_default_path_is_looked_up_once(self, tmp_path):
+        """Test that the default config search runs once per process."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("", encoding="utf-8")
+
+        with (
+            patch("memory.config.loader.get_default_config_path", return_value=config_file) as default_path,
+            patch("memory.core.logging.configure_from_config"),
+        ):
+            first = _load_config(None)
+            second = _load_config(None)
+
+        assert first is second
+        default_path.assert_called_once()
+
+
+def test_import_does_not_load_config_or_logging_stack():
+    """Test that importing the CLI leaves pydantic and structlog for the commands."""
+    code = "import sys, memory.interfaces.cli; print(sorted(m for m in ('pydantic', 'structlog') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
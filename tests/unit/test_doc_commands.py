@@ -6,7 +6,7 @@ from uuid import uuid4
 import pytest
 import typer
 
-from memory.entities import Document, DocumentType
+from memory.entities import Document, DocumentSummary, DocumentType
 from memory.interfaces.cli import _doc_delete_async, _doc_info_async, _doc_query_async
 
 
@@ -47,16 +47,12 @@ class TestDocQueryCommand:
             doc_type=DocumentType.TEXT,
             repository_id=repository.id,
         )
-        doc3 = Document(
-            id=uuid4(),
-            title="doc3.md",
-            content="Content 3",
-            source_path="./doc3.md",
-            doc_type=DocumentType.TEXT,
-            repository_id=repository.id,
-        )
 
-        metadata_store.list_documents.return_value = [doc1, doc2, doc3]
+        # The store returns only the requested page plus the total count
+        metadata_store.get_repository_by_name.return_value = repository
+        metadata_store.list_document_summaries.return_value = [DocumentSummary.from_document(doc, 0) for doc in (doc1, doc2)]
+        metadata_store.count_documents.return_value = 3
+        metadata_store.get_chunk_counts.return_value = {doc1.id: 2, doc2.id: 1}
 
         # Run command
         await _doc_query_async(
@@ -71,9 +67,13 @@ class TestDocQueryCommand:
         )
 
         # Verify
-        metadata_store.list_documents.assert_called()
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.list_document_summaries.assert_called_once_with(
+            limit=2, offset=0, repository_id=repository.id, search=None, sort="created_at", descending=False
+        )
+        metadata_store.get_chunk_counts.assert_called_once_with([doc1.id, doc2.id])
+        metadata_store.get_chunks_by_document.assert_not_called()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -100,16 +100,11 @@ class TestDocQueryCommand:
             doc_type=DocumentType.TEXT,
             repository_id=repository.id,
         )
-        doc2 = Document(
-            id=uuid4(),
-            title="test.md",
-            content="Test content",
-            source_path="./test.md",
-            doc_type=DocumentType.TEXT,
-            repository_id=repository.id,
-        )
 
-        metadata_store.list_documents.return_value = [doc1, doc2]
+        metadata_store.get_repository_by_name.return_value = repository
+        metadata_store.list_document_summaries.return_value = [DocumentSummary.from_document(doc1, 0)]
+        metadata_store.count_documents.return_value = 1
+        metadata_store.get_chunk_counts.return_value = {}
 
         # Run command with search
         await _doc_query_async(
@@ -123,13 +118,13 @@ class TestDocQueryCommand:
             config_file=None,
         )
 
-        # Verify search filter applied
-        called_docs = metadata_store.list_documents.return_value
-        # Only doc1 should match "read" search
-        assert len(called_docs) == 2
+        # Verify search filter and sort are pushed down to the store
+        assert metadata_store.list_document_summaries.call_args.kwargs["search"] == "read"
+        assert metadata_store.list_document_summaries.call_args.kwargs["sort"] == "name"
+        metadata_store.count_documents.assert_called_once_with(repository_id=repository.id, search="read")
 
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -197,8 +192,8 @@ class TestDocInfoCommand:
             repository_id=repository.id,
         )
 
-        metadata_store.get_document.return_value = test_doc
-        metadata_store.get_chunks_by_document.return_value = []
+        metadata_store.get_document_summary.return_value = DocumentSummary.from_document(test_doc)
+        metadata_store.get_chunk_sizes.return_value = [4, 8]
 
         # Run command
         await _doc_info_async(
@@ -209,10 +204,13 @@ class TestDocInfoCommand:
             config_file=None,
         )
 
-        # Verify
-        metadata_store.get_document.assert_called_once_with(test_doc.id)
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        # Verify the summary is fetched instead of the full document and chunks
+        metadata_store.get_document_summary.assert_called_once_with(test_doc.id, 500)
+        metadata_store.get_chunk_sizes.assert_called_once_with(test_doc.id)
+        metadata_store.get_document.assert_not_called()
+        metadata_store.get_chunks_by_document.assert_not_called()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -241,8 +239,9 @@ class TestDocInfoCommand:
         )
 
         metadata_store.get_document.return_value = None
-        metadata_store.list_documents.return_value = [test_doc]
-        metadata_store.get_chunks_by_document.return_value = []
+        metadata_store.get_repository_by_name.return_value = repository
+        metadata_store.get_documents_by_names.return_value = {"test.md": [test_doc]}
+        metadata_store.get_chunk_sizes.return_value = []
 
         # Run command with name
         await _doc_info_async(
@@ -254,7 +253,8 @@ class TestDocInfoCommand:
         )
 
         # Verify
-        metadata_store.list_documents.assert_called_once()
+        metadata_store.get_documents_by_names.assert_called_once_with(repository.id, ["test.md"])
+        metadata_store.list_documents.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -273,7 +273,7 @@ class TestDocInfoCommand:
         mock_ensure.return_value = (metadata_store, vector_store, repository)
 
         metadata_store.get_document.return_value = None
-        metadata_store.list_documents.return_value = []
+        metadata_store.get_documents_by_names.return_value = {}
 
         # Run command and expect error
         with pytest.raises(typer.Exit):
@@ -316,9 +316,9 @@ class TestDocDeleteCommand:
             repository_id=repository.id,
         )
 
-        metadata_store.get_document.return_value = test_doc
-        metadata_store.get_chunks_by_document.return_value = []
-        metadata_store.delete_document.return_value = True
+        metadata_store.get_documents.return_value = {test_doc.id: test_doc}
+        metadata_store.get_chunk_counts.return_value = {test_doc.id: 3}
+        metadata_store.delete_documents.return_value = {test_doc.id}
 
         # Run command with force
         await _doc_delete_async(
@@ -330,10 +330,12 @@ class TestDocDeleteCommand:
         )
 
         # Verify
-        metadata_store.delete_document.assert_called_once_with(test_doc.id)
-        vector_store.delete_by_document_id.assert_called_once_with(test_doc.id)
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.get_chunk_counts.assert_called_once_with([test_doc.id])
+        metadata_store.get_chunks_by_document.assert_not_called()
+        metadata_store.delete_documents.assert_called_once_with([test_doc.id])
+        vector_store.delete_by_document_ids.assert_called_once_with([test_doc.id])
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -370,9 +372,10 @@ class TestDocDeleteCommand:
         )
 
         metadata_store.get_document.return_value = None
-        metadata_store.list_documents.return_value = [doc1, doc2]
-        metadata_store.get_chunks_by_document.return_value = []
-        metadata_store.delete_document.return_value = True
+        metadata_store.get_repository_by_name.return_value = repository
+        metadata_store.get_documents_by_names.return_value = {"doc1.md": [doc1], "doc2.md": [doc2]}
+        metadata_store.get_chunk_counts.return_value = {doc1.id: 1}
+        metadata_store.delete_documents.return_value = {doc1.id, doc2.id}
 
         # Run command with force
         await _doc_delete_async(
@@ -383,12 +386,16 @@ class TestDocDeleteCommand:
             config_file=None,
         )
 
-        # Verify both documents deleted
-        assert metadata_store.delete_document.call_count == 2
+        # Verify both names resolved in one lookup and both documents deleted
+        metadata_store.get_documents_by_names.assert_called_once_with(repository.id, ["doc1.md", "doc2.md"])
+        metadata_store.get_chunk_counts.assert_called_once_with([doc1.id, doc2.id])
+        metadata_store.delete_documents.assert_called_once_with([doc1.id, doc2.id])
+        # doc2 has no chunks, so there are no embeddings to delete for it
+        vector_store.delete_by_document_ids.assert_called_once_with([doc1.id])
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
-    async def test_delete_dry_run(self, mock_ensure, mock_load_config):
+    async def test_delete_dry_run(self, mock_ensure, mock_load_config, capsys):
         """Test delete command with dry-run mode."""
         # Setup mocks
         config = MagicMock()
@@ -412,9 +419,8 @@ class TestDocDeleteCommand:
             repository_id=repository.id,
         )
 
-        metadata_store.get_document.return_value = test_doc
-        metadata_store.get_chunks_by_document.return_value = []
-        metadata_store.delete_document.return_value = True
+        metadata_store.get_documents.return_value = {test_doc.id: test_doc}
+        metadata_store.get_chunk_counts.return_value = {test_doc.id: 2}
 
         # Run command with dry-run
         await _doc_delete_async(
@@ -425,9 +431,14 @@ class TestDocDeleteCommand:
             config_file=None,
         )
 
+        output = capsys.readouterr().out
+        assert "Dry run mode - would delete" in output
+        assert "test.md" in output
+
         # Verify delete not called in dry-run mode
-        metadata_store.delete_document.assert_not_called()
-        vector_store.delete_by_document_id.assert_not_called()
+        metadata_store.get_chunks_by_document.assert_not_called()
+        metadata_store.delete_documents.assert_not_called()
+        vector_store.delete_by_document_ids.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -444,6 +455,7 @@ class TestDocDeleteCommand:
         repository.id = uuid4()
         repository.name = "wrong-repo"
         mock_ensure.return_value = (metadata_store, vector_store, repository)
+        metadata_store.get_documents_by_names.return_value = {}
 
         # Run command and expect error
         with pytest.raises(typer.Exit):
@@ -454,3 +466,126 @@ class TestDocDeleteCommand:
                 dry_run=False,
                 config_file=None,
             )
+
+    @patch("memory.interfaces.cli._load_config")
+    @patch("memory.interfaces.cli._ensure_default_repository")
+    async def test_delete_reports_partial_failures(self, mock_ensure, mock_load_config, capsys):
+        """Test that documents missing from the batch result are reported individually."""
+        config = MagicMock()
+        config.default_repository = "test-repo"
+        mock_load_config.return_value = config
+
+        metadata_store = AsyncMock()
+        vector_store = AsyncMock()
+        repository = MagicMock()
+        repository.id = uuid4()
+        mock_ensure.return_value = (metadata_store, vector_store, repository)
+
+        docs = [
+            Document(
+                id=uuid4(),
+                title=f"doc{i}.md",
+                content=f"Content {i}",
+                source_path=f"./doc{i}.md",
+                doc_type=DocumentType.TEXT,
+                repository_id=repository.id,
+            )
+            for i in range(3)
+        ]
+        metadata_store.get_repository_by_name.return_value = repository
+        metadata_store.get_documents_by_names.return_value = {doc.title: [doc] for doc in docs}
+        metadata_store.get_chunk_counts.return_value = {}
+        metadata_store.delete_documents.return_value = {docs[0].id, docs[2].id}
+
+        await _doc_delete_async(
+            document_ids=[doc.title for doc in docs],
+            repository=None,
+            force=True,
+            dry_run=False,
+            config_file=None,
+        )
+
+        output = capsys.readouterr().out
+        metadata_store.delete_documents.assert_called_once_with([doc.id for doc in docs])
+        vector_store.delete_by_document_ids.assert_not_called()
+        assert "Failed to delete document 'doc1.md'" in output
+        assert "Successfully deleted 2 document(s)" in output
+
+    @patch("memory.interfaces.cli._load_config")
+    @patch("memory.interfaces.cli._ensure_default_repository")
+    async def test_delete_cancelled_at_confirmation(self, mock_ensure, mock_load_config, capsys):
+        """Test that declining the prompt deletes nothing."""
+        config = MagicMock()
+        config.default_repository = "test-repo"
+        mock_load_config.return_value = config
+
+        metadata_store = AsyncMock()
+        vector_store = AsyncMock()
+        repository = MagicMock()
+        repository.id = uuid4()
+        mock_ensure.return_value = (metadata_store, vector_store, repository)
+
+        test_doc = Document(
+            id=uuid4(),
+            title="test.md",
+            content="Test content",
+            source_path="./test.md",
+            doc_type=DocumentType.TEXT,
+            repository_id=repository.id,
+        )
+        metadata_store.get_documents.return_value = {test_doc.id: test_doc}
+        metadata_store.get_chunk_counts.return_value = {test_doc.id: 1}
+
+        with patch("memory.interfaces.cli.typer.confirm", side_effect=typer.Abort()):
+            with pytest.raises(typer.Exit):
+                await _doc_delete_async(
+                    document_ids=[str(test_doc.id)],
+                    repository=None,
+                    force=False,
+                    dry_run=False,
+                    config_file=None,
+                )
+
+        assert "Operation cancelled" in capsys.readouterr().out
+        metadata_store.delete_documents.assert_not_called()
+        vector_store.delete_by_document_ids.assert_not_called()
+
+    @patch("memory.interfaces.cli._load_config")
+    @patch("memory.interfaces.cli._ensure_default_repository")
+    async def test_delete_reports_lookup_errors_per_argument(self, mock_ensure, mock_load_config, capsys):
+        """Test that a failed name lookup is reported per name while UUID arguments are still deleted."""
+        config = MagicMock()
+        config.default_repository = "test-repo"
+        mock_load_config.return_value = config
+
+        metadata_store = AsyncMock()
+        vector_store = AsyncMock()
+        repository = MagicMock()
+        repository.id = uuid4()
+        mock_ensure.return_value = (metadata_store, vector_store, repository)
+
+        test_doc = Document(
+            id=uuid4(),
+            title="test.md",
+            content="Test content",
+            source_path="./test.md",
+            doc_type=DocumentType.TEXT,
+            repository_id=repository.id,
+        )
+        metadata_store.get_documents.return_value = {test_doc.id: test_doc}
+        metadata_store.get_documents_by_names.side_effect = RuntimeError("database is locked")
+        metadata_store.get_chunk_counts.return_value = {test_doc.id: 1}
+        metadata_store.delete_documents.return_value = {test_doc.id}
+
+        await _doc_delete_async(
+            document_ids=[str(test_doc.id), "other.md"],
+            repository=None,
+            force=True,
+            dry_run=False,
+            config_file=None,
+        )
+
+        output = capsys.readouterr().out
+        assert "Error resolving document 'other.md': database is locked" in output
+        metadata_store.get_documents.assert_called_once_with([test_doc.id])
+        metadata_store.delete_documents.assert_called_once_with([test_doc.id])
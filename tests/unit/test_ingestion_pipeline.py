@@ -0,0 +1,363 @@
+"""Unit tests for IngestionPipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from memory.config.schema import AppConfig
+from memory.entities import Document, DocumentType, Repository
+from memory.pipelines.ingestion import IngestionError, IngestionPipeline
+from memory.providers.base import EmbeddingProvider, ProviderConfig
+from memory.storage.base import StorageConfig
+from memory.storage.memory import InMemoryMetadataStore, InMemoryVectorStore
+from memory.storage.sqlite import SQLiteMetadataStore
+
+
+class FakeEmbeddingProvider(EmbeddingProvider):
+    """Deterministic embedding provider for pipeline tests."""
+
+    def __init__(self) -> None:
+        super().__init__(ProviderConfig(provider_type="fake", model_name="fake-model"))
+        self.batches: list[list[str]] = []
+
+    async def embed_text(self, text: str) -> list[float]:
+        return [float(len(text)), 1.0, 0.0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+    def get_dimension(self) -> int:
+        return 3
+
+    def get_max_tokens(self) -> int:
+        return 512
+
+
+def make_document(repository_id, name: str, paragraphs: int = 1) -> Document:
+    """Create a markdown document with the given number of paragraphs."""
+    body = "\n\n".join(f"Paragraph {i} of {name}. " * 20 for i in range(paragraphs))
+    return Document(
+        repository_id=repository_id,
+        source_path=f"/docs/{name}.md",
+        doc_type=DocumentType.MARKDOWN,
+        title=name,
+        content=f"# {name}\n\n{body}",
+    )
+
+
+@pytest.mark.asyncio
+class TestIngestionPipeline:
+    """Test IngestionPipeline behaviour."""
+
+    @pytest.fixture
+    async def stores(self):
+        """Create in-memory metadata and vector stores."""
+        config = StorageConfig(storage_type="memory", collection_name="test")
+        metadata_store = InMemoryMetadataStore(config)
+        vector_store = InMemoryVectorStore(config)
+        await metadata_store.initialize()
+        await vector_store.initialize()
+        yield metadata_store, vector_store
+        await metadata_store.close()
+        await vector_store.close()
+
+    @pytest.fixture
+    async def repository(self, stores):
+        """Create a repository in the metadata store."""
+        metadata_store, _ = stores
+        repository = Repository(name="test-repo")
+        await metadata_store.add_repository(repository)
+        return repository
+
+    def make_pipeline(self, stores, repository, **kwargs) -> IngestionPipeline:
+        metadata_store, vector_store = stores
+        return IngestionPipeline(
+            config=AppConfig(),
+            embedding_provider=FakeEmbeddingProvider(),
+            vector_store=vector_store,
+            metadata_store=metadata_store,
+            repository_id=repository.id,
+            **kwargs,
+        )
+
+    async def test_ingest_document_stores_chunks_and_embeddings(self, stores, repository):
+        """Test that ingestion writes chunks and embeddings."""
+        metadata_store, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+
+        result = await pipeline.ingest_document(make_document(repository.id, "doc"))
+
+        assert result.chunk_count > 0
+        assert result.reason == "new_document"
+        assert len(await metadata_store.get_chunks_by_document(result.document_id)) == result.chunk_count
+        assert await vector_store.count() == result.chunk_count
+
+    async def test_buffered_embeddings_written_before_ingest_returns(self, stores, repository):
+        """Test that buffered embeddings of a call are written in one go before it returns."""
+        _, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository, buffer_embeddings=True)
+        pipeline.config.embedding.batch_size = 1
+        vector_store.add_vectors_batch = AsyncMock(wraps=vector_store.add_vectors_batch)
+
+        results = await pipeline.ingest_documents([make_document(repository.id, "one"), make_document(repository.id, "two")])
+
+        assert len(pipeline.embedding_provider.batches) > 1
+        vector_store.add_vectors_batch.assert_awaited_once()
+        assert await vector_store.count() == sum(result.chunk_count for result in results)
+
+    async def test_buffer_flushes_at_insert_batch_size(self, stores, repository):
+        """Test that the buffer is written each time it reaches insert_batch_size."""
+        _, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository, buffer_embeddings=True)
+        pipeline.config.embedding.batch_size = 1
+        pipeline.config.vector_store.insert_batch_size = 2
+        vector_store.add_vectors_batch = AsyncMock(wraps=vector_store.add_vectors_batch)
+
+        results = await pipeline.ingest_documents([make_document(repository.id, f"doc{i}") for i in range(5)])
+
+        chunk_count = sum(result.chunk_count for result in results)
+        assert vector_store.add_vectors_batch.await_count == (chunk_count + 1) // 2
+        assert await vector_store.count() == chunk_count
+
+    async def test_failed_buffered_write_rolls_back_only_its_call(self, stores, repository):
+        """Test that a failed vector write fails its own call and leaves earlier documents embedded."""
+        metadata_store, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository, buffer_embeddings=True)
+        first = await pipeline.ingest_document(make_document(repository.id, "one"))
+
+        add_vectors_batch = vector_store.add_vectors_batch
+        vector_store.add_vectors_batch = AsyncMock(side_effect=RuntimeError("vector store down"))
+        with pytest.raises(IngestionError, match="vector store down"):
+            await pipeline.ingest_document(make_document(repository.id, "two"))
+        vector_store.add_vectors_batch = add_vectors_batch
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert [doc.id for doc in documents] == [first.document_id]
+        assert await vector_store.count() == first.chunk_count
+
+    async def test_ingest_documents_shares_embedding_batches(self, stores, repository):
+        """Test that chunks from several documents are embedded together."""
+        metadata_store, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+
+        results = await pipeline.ingest_documents([make_document(repository.id, "one"), make_document(repository.id, "two")])
+
+        assert [result.reason for result in results] == ["new_document", "new_document"]
+        assert len(pipeline.embedding_provider.batches) == 1
+        assert await vector_store.count() == sum(result.chunk_count for result in results)
+        assert len(await metadata_store.list_documents(repository_id=repository.id)) == 2
+
+    async def test_ingest_documents_rolls_back_on_failure(self, stores, repository):
+        """Test that a failed batch removes new documents and restores replaced ones."""
+        metadata_store, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+        original = await pipeline.ingest_document(make_document(repository.id, "one"))
+
+        pipeline.embedding_provider.embed_batch = AsyncMock(side_effect=RuntimeError("provider down"))
+        changed = make_document(repository.id, "one", paragraphs=2)
+        with pytest.raises(IngestionError):
+            await pipeline.ingest_documents([changed, make_document(repository.id, "two")])
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert [doc.id for doc in documents] == [original.document_id]
+        assert len(await metadata_store.get_chunks_by_document(original.document_id)) == original.chunk_count
+        assert await vector_store.count() == original.chunk_count
+
+    async def test_embedding_batches_run_concurrently(self, stores, repository):
+        """Test that several embedding batches are in flight at once, up to the configured limit."""
+        _, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+        pipeline.config.embedding.batch_size = 1
+        pipeline.config.embedding.max_concurrent_batches = 2
+        embed_batch = pipeline.embedding_provider.embed_batch
+        active = peak = 0
+
+        async def slow_embed_batch(texts):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return await embed_batch(texts)
+
+        pipeline.embedding_provider.embed_batch = slow_embed_batch
+        results = await pipeline.ingest_documents([make_document(repository.id, f"doc{i}") for i in range(4)])
+
+        assert peak == 2
+        assert await vector_store.count() == sum(result.chunk_count for result in results) == 4
+
+    async def test_embedding_failure_is_reported_unwrapped(self, stores, repository):
+        """Test that a failed batch surfaces its own error, not a task group wrapper."""
+        pipeline = self.make_pipeline(stores, repository)
+        pipeline.config.embedding.batch_size = 1
+        pipeline.embedding_provider.embed_batch = AsyncMock(side_effect=RuntimeError("provider down"))
+
+        with pytest.raises(IngestionError, match="provider down") as exc_info:
+            await pipeline.ingest_documents([make_document(repository.id, f"doc{i}") for i in range(2)])
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    async def test_ingest_documents_looks_up_existing_documents_once(self, stores, repository):
+        """Test that a batch fetches its existing documents in one lookup and replaces changed ones."""
+        metadata_store, _ = stores
+        pipeline = self.make_pipeline(stores, repository)
+        original = await pipeline.ingest_document(make_document(repository.id, "one"))
+
+        lookup = AsyncMock(wraps=metadata_store.get_documents_by_source_paths)
+        metadata_store.get_documents_by_source_paths = lookup
+        results = await pipeline.ingest_documents(
+            [make_document(repository.id, "one", paragraphs=2), make_document(repository.id, "two")]
+        )
+
+        lookup.assert_awaited_once()
+        assert [result.reason for result in results] == ["content_changed", "new_document"]
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert len(documents) == 2
+        assert original.document_id not in {doc.id for doc in documents}
+
+    async def test_ingest_file_reads_content_and_size(self, stores, repository, tmp_path):
+        """Test that ingest_file stores the file's content, type and size."""
+        metadata_store, _ = stores
+        pipeline = self.make_pipeline(stores, repository)
+        path = tmp_path / "note.md"
+        path.write_text("# Note\n\nSome content", encoding="utf-8")
+
+        document_id = await pipeline.ingest_file(path)
+
+        document = await metadata_store.get_document(document_id)
+        assert document.content == "# Note\n\nSome content"
+        assert document.doc_type == DocumentType.MARKDOWN
+        assert document.metadata["file_size"] == path.stat().st_size
+
+    async def test_rollback_with_transactional_store(self, stores, repository, tmp_path):
+        """Test that a failed batch restores replaced documents on a store with transactions."""
+        _, vector_store = stores
+        metadata_store = SQLiteMetadataStore(StorageConfig(storage_type="sqlite", connection_string=str(tmp_path / "meta.db")))
+        await metadata_store.initialize()
+        await metadata_store.add_repository(repository)
+        pipeline = self.make_pipeline((metadata_store, vector_store), repository)
+        original = await pipeline.ingest_document(make_document(repository.id, "one"))
+
+        pipeline.embedding_provider.embed_batch = AsyncMock(side_effect=RuntimeError("provider down"))
+        with pytest.raises(IngestionError):
+            await pipeline.ingest_documents([make_document(repository.id, "one", paragraphs=2)])
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert [doc.id for doc in documents] == [original.document_id]
+        assert len(await metadata_store.get_chunks_by_document(original.document_id)) == original.chunk_count
+        assert await vector_store.count() == original.chunk_count
+        await metadata_store.close()
+
+    async def test_embedding_batches_group_chunks_by_length(self, stores, repository):
+        """Test that chunks are embedded in order of length, whatever document they came from."""
+        _, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+        pipeline.config.embedding.batch_size = 2
+
+        results = await pipeline.ingest_documents(
+            [make_document(repository.id, "long", paragraphs=3), make_document(repository.id, "s")]
+        )
+
+        lengths = [len(text) for batch in pipeline.embedding_provider.batches for text in batch]
+        assert lengths == sorted(lengths)
+        assert await vector_store.count() == sum(result.chunk_count for result in results)
+
+    async def test_ingest_accepts_array_vectors(self, stores, repository):
+        """Test that vectors returned as a 2-D array are stored without conversion by the provider."""
+        np = pytest.importorskip("numpy")
+        _, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository, buffer_embeddings=True)
+        embed_batch = pipeline.embedding_provider.embed_batch
+
+        async def array_embed_batch(texts):
+            return np.asarray(await embed_batch(texts), dtype=np.float32)
+
+        pipeline.embedding_provider.embed_batch = array_embed_batch
+        result = await pipeline.ingest_document(make_document(repository.id, "doc"))
+
+        assert await vector_store.count() == result.chunk_count
+
+    async def test_ingest_files_ingests_each_file(self, stores, repository, tmp_path):
+        """Test that ingest_files returns one document per file, in input order."""
+        metadata_store, _ = stores
+        pipeline = self.make_pipeline(stores, repository)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"note{i}.md"
+            path.write_text(f"# Note {i}\n\nContent {i}", encoding="utf-8")
+            paths.append(path)
+
+        document_ids = await pipeline.ingest_files(paths)
+
+        documents = [await metadata_store.get_document(document_id) for document_id in document_ids]
+        assert [document.title for document in documents] == ["note0", "note1", "note2"]
+
+    async def test_ingest_file_missing_file(self, stores, repository, tmp_path):
+        """Test that a missing file is reported as such."""
+        pipeline = self.make_pipeline(stores, repository)
+
+        with pytest.raises(IngestionError, match="File not found"):
+            await pipeline.ingest_file(tmp_path / "missing.md")
+
+    async def test_ingest_file_translates_newlines(self, stores, repository, tmp_path):
+        """Test that CRLF and CR line endings are stored as LF, as read_text would."""
+        metadata_store, _ = stores
+        pipeline = self.make_pipeline(stores, repository)
+        path = tmp_path / "note.md"
+        path.write_bytes(b"# Note\r\n\r\nFirst line\rSecond line\r\n")
+
+        document_id = await pipeline.ingest_file(path)
+
+        document = await metadata_store.get_document(document_id)
+        assert document.content == path.read_text(encoding="utf-8") == "# Note\n\nFirst line\nSecond line\n"
+
+    async def test_ingest_files_failure_cancels_and_rolls_back_siblings(self, stores, repository, tmp_path):
+        """Test that the first failed file cancels the others and leaves nothing half-ingested."""
+        metadata_store, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+        (tmp_path / "slow.md").write_text("Slow content", encoding="utf-8")
+        (tmp_path / "bad.md").write_bytes(b"\xff\xfe not utf-8")
+        embed_batch = pipeline.embedding_provider.embed_batch
+
+        async def slow_embed_batch(texts):
+            await asyncio.sleep(0.05)
+            return await embed_batch(texts)
+
+        pipeline.embedding_provider.embed_batch = slow_embed_batch
+        with pytest.raises(IngestionError, match="Failed to read file"):
+            await pipeline.ingest_files([tmp_path / "slow.md", tmp_path / "bad.md"])
+        await asyncio.sleep(0.1)
+
+        assert await metadata_store.list_documents(repository_id=repository.id) == []
+        assert await vector_store.count() == 0
+
+    async def test_replacing_document_swaps_its_embeddings(self, stores, repository):
+        """Test that re-ingesting a changed document leaves only the new document's embeddings."""
+        _, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+        await pipeline.ingest_document(make_document(repository.id, "one"))
+
+        changed = await pipeline.ingest_document(make_document(repository.id, "one", paragraphs=3))
+
+        assert changed.reason == "content_changed"
+        assert await vector_store.count() == changed.chunk_count
+
+    async def test_failed_reingest_under_same_id_keeps_embeddings(self, stores, repository):
+        """Test that a document re-ingested under its own ID keeps its embeddings if embedding fails."""
+        metadata_store, vector_store = stores
+        pipeline = self.make_pipeline(stores, repository)
+        document = make_document(repository.id, "one")
+        original = await pipeline.ingest_document(document)
+        original_chunks = await metadata_store.get_chunks_by_document(document.id)
+
+        pipeline.embedding_provider.embed_batch = AsyncMock(side_effect=RuntimeError("provider down"))
+        with pytest.raises(IngestionError):
+            await pipeline.ingest_document(document, force=True)
+
+        assert await metadata_store.get_chunks_by_document(document.id) == original_chunks
+        assert await vector_store.count() == original.chunk_count
+
+        pipeline.embedding_provider = FakeEmbeddingProvider()
+        forced = await pipeline.ingest_document(document, force=True)
+        assert await vector_store.count() == forced.chunk_count
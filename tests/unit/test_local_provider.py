@@ -0,0 +1,100 @@
+"""Unit tests for LocalEmbeddingProvider."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memory.providers.base import ProviderConfig, ProviderError
+from memory.providers.local import LocalEmbeddingProvider
+
+
+@pytest.fixture
+def sentence_transformer():
+    """Stand in for the sentence-transformers package, which is an optional dependency."""
+    model_class = MagicMock()
+    model_class.return_value.get_sentence_embedding_dimension.return_value = 640
+    with patch.dict(sys.modules, {"sentence_transformers": SimpleNamespace(SentenceTransformer=model_class)}):
+        yield model_class
+
+
+@pytest.fixture
+def np():
+    """Import numpy before sentence_transformer patches sys.modules, so it is not unloaded afterwards."""
+    return pytest.importorskip("numpy")
+
+
+class TestLocalEmbeddingProvider:
+    """Test LocalEmbeddingProvider model metadata."""
+
+    def make_provider(self, model_name: str) -> LocalEmbeddingProvider:
+        return LocalEmbeddingProvider(ProviderConfig(provider_type="local", model_name=model_name))
+
+    @pytest.mark.parametrize(
+        ("model_name", "dimension", "max_tokens"),
+        [
+            ("bge-m3", 1024, 8192),
+            ("BAAI/bge-small-zh-v1.5", 512, 512),
+            ("sentence-transformers/all-MiniLM-L6-v2", 384, 256),
+        ],
+    )
+    def test_known_models(self, sentence_transformer, model_name, dimension, max_tokens):
+        """Test that known models are found by exact name or without their organization prefix."""
+        provider = self.make_provider(model_name)
+
+        assert provider.get_dimension() == dimension
+        assert provider.get_max_tokens() == max_tokens
+        sentence_transformer.return_value.eval.assert_called_once()
+
+    def test_unknown_model_uses_model_dimension(self, sentence_transformer):
+        """Test that a name merely containing a known one is not mistaken for it."""
+        provider = self.make_provider("bge-m3-custom")
+
+        assert provider.get_dimension() == 640
+        assert provider.get_max_tokens() == 512
+
+    def test_embed_text_works_across_event_loops(self, sentence_transformer):
+        """Test that a request left pending on a closed loop does not stall the next loop."""
+        provider = self.make_provider("bge-m3")
+        provider._encode = MagicMock(side_effect=lambda texts: [SimpleNamespace(tolist=lambda: [2.0, 1.0]) for _ in texts])
+
+        with patch("memory.providers.local.COALESCE_WINDOW", 60), pytest.raises(TimeoutError):
+            asyncio.run(asyncio.wait_for(provider.embed_text("a"), timeout=0.01))
+
+        assert asyncio.run(asyncio.wait_for(provider.embed_text("bb"), timeout=5)) == [2.0, 1.0]
+        provider._encode.assert_called_once_with(["bb"])
+
+
+@pytest.mark.asyncio
+class TestLocalEmbeddingProviderCoalescing:
+    """Test that concurrent embed_text calls share encode calls."""
+
+    @pytest.fixture
+    def provider(self, np, sentence_transformer):
+        provider = LocalEmbeddingProvider(ProviderConfig(provider_type="local", model_name="bge-m3"))
+        provider._encode = MagicMock(side_effect=lambda texts: np.array([[float(len(text)), 1.0] for text in texts]))
+        return provider
+
+    async def test_concurrent_calls_are_encoded_together(self, provider):
+        """Test that concurrent calls are answered from one encode call, each with its own row."""
+        vectors = await asyncio.gather(*(provider.embed_text("x" * n) for n in range(1, 4)))
+
+        assert vectors == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        provider._encode.assert_called_once_with(["x", "xx", "xxx"])
+
+    async def test_full_batch_is_encoded_without_waiting(self, provider):
+        """Test that reaching MAX_COALESCED_TEXTS starts an encode call straight away."""
+        with patch("memory.providers.local.MAX_COALESCED_TEXTS", 2), patch("memory.providers.local.COALESCE_WINDOW", 60):
+            vectors = await asyncio.wait_for(asyncio.gather(provider.embed_text("a"), provider.embed_text("bb")), timeout=5)
+
+        assert vectors == [[1.0, 1.0], [2.0, 1.0]]
+
+    async def test_encode_failure_reaches_every_caller(self, provider):
+        """Test that a failed encode call fails each coalesced request."""
+        provider._encode.side_effect = RuntimeError("out of memory")
+
+        results = await asyncio.gather(provider.embed_text("a"), provider.embed_text("b"), return_exceptions=True)
+
+        assert all(isinstance(result, ProviderError) for result in results)
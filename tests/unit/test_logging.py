@@ -0,0 +1,203 @@
+"""Unit tests for logging configuration."""
+
+import json
+import logging
+import logging.handlers
+import os
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from memory.core import logging as memory_logging
+from memory.core.logging import AuditLogger, FileLoggerFactory, TimedRotatingFileHandler, configure_logging, get_logger
+
+
+@pytest.fixture(autouse=True)
+def reset_logging(monkeypatch):
+    """Start each test unconfigured and restore structlog defaults afterwards."""
+    monkeypatch.setattr(memory_logging, "_CONFIGURED_KEY", None)
+    yield
+    structlog.contextvars.clear_contextvars()
+    structlog.reset_defaults()
+
+
+class TestConfigureLogging:
+    """Test configure_logging behaviour."""
+
+    def test_identical_configuration_is_applied_once(self):
+        """Test that repeating the same settings does not rebuild the chain."""
+        with patch("structlog.configure", wraps=structlog.configure) as configure:
+            configure_logging(level="info", enable_file=False)
+            configure_logging(level="INFO", enable_file=False)
+
+        configure.assert_called_once()
+
+    def test_changed_configuration_is_applied(self):
+        """Test that different settings reconfigure structlog."""
+        with patch("structlog.configure", wraps=structlog.configure) as configure:
+            configure_logging(level="INFO", enable_file=False)
+            configure_logging(level="DEBUG", enable_file=False)
+
+        assert configure.call_count == 2
+
+    def test_app_context_is_bound_once(self, capsys):
+        """Test that the app name reaches events through the context variables."""
+        configure_logging(level="INFO", json_logs=True, enable_file=False)
+        structlog.get_logger("test").info("hello")
+
+        assert structlog.contextvars.get_contextvars() == {"app": "memory"}
+        assert '"app": "memory"' in capsys.readouterr().out
+
+    def test_file_logs_are_written_by_background_listener(self, tmp_path):
+        """Test that file logging goes through a queue and is flushed when the listener stops."""
+        root_logger = logging.getLogger()
+        root_level, root_handlers = root_logger.level, root_logger.handlers[:]
+        try:
+            configure_logging(level="INFO", json_logs=True, log_dir=tmp_path)
+            queue_handlers = [h for h in root_logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+            assert len(queue_handlers) == 1
+            assert not any(isinstance(h, logging.FileHandler) for h in root_logger.handlers)
+
+            structlog.get_logger("test").info("queued_event")
+            memory_logging._stop_file_listener()
+
+            assert "queued_event" in (tmp_path / "system.log").read_text(encoding="utf-8")
+        finally:
+            memory_logging._stop_file_listener()
+            root_logger.handlers[:] = root_handlers
+            root_logger.setLevel(root_level)
+
+    def test_invalid_level_raises(self):
+        """Test that an unknown level name is rejected instead of ignored."""
+        with pytest.raises(ValueError, match="Invalid log level: verbose"):
+            configure_logging(level="verbose", enable_file=False)
+        assert memory_logging._CONFIGURED_KEY is None
+
+
+class TestGetLogger:
+    """Test get_logger caching."""
+
+    def test_logger_is_cached_per_name(self):
+        """Test that the same name returns the same logger instance."""
+        assert get_logger("memory.test") is get_logger("memory.test")
+        assert get_logger("memory.test") is not get_logger("memory.other")
+
+
+class TestTimedRotatingFileHandler:
+    """Test rotated log cleanup."""
+
+    def test_cleanup_removes_only_expired_rotations(self, tmp_path):
+        """Test that old rotated files are removed while recent and unrelated files stay."""
+        handler = TimedRotatingFileHandler(str(tmp_path / "system.log"), max_days=1, encoding="utf-8")
+        try:
+            expired = tmp_path / "system.log.2020-01-01"
+            recent = tmp_path / "system.log.2099-01-01"
+            unrelated = tmp_path / "other.log.2020-01-01"
+            for path in (expired, recent, unrelated):
+                path.write_text("old", encoding="utf-8")
+            two_days_ago = time.time() - 2 * 86400
+            os.utime(expired, (two_days_ago, two_days_ago))
+            os.utime(unrelated, (two_days_ago, two_days_ago))
+
+            handler._cleanup_old_files()
+
+            assert not expired.exists()
+            assert recent.exists()
+            assert unrelated.exists()
+        finally:
+            handler.close()
+
+    def test_cleanup_runs_at_most_once_per_interval(self, tmp_path):
+        """Test that emitting records does not rescan the directory every time."""
+        handler = TimedRotatingFileHandler(str(tmp_path / "system.log"), max_days=1, encoding="utf-8")
+        record = logging.makeLogRecord({"msg": "line", "levelno": logging.INFO})
+        try:
+            with patch.object(handler, "_cleanup_old_files") as cleanup:
+                handler.emit(record)
+                handler.emit(record)
+                assert cleanup.call_count == 1
+
+                handler._next_cleanup = 0.0
+                handler.emit(record)
+                assert cleanup.call_count == 2
+        finally:
+            handler.close()
+
+
+class TestAuditLogger:
+    """Test audit log entries."""
+
+    def test_user_is_resolved_once(self, tmp_path):
+        """Test that the current user is looked up when the logger is created, not per record."""
+        with patch("getpass.getuser", return_value="alice") as getuser:
+            audit = AuditLogger(tmp_path / "cli-audit.log")
+            audit.record(command="memory sync", args=["notes"])
+            audit.record(command="memory sync", args=["notes"], exit_code=0, duration_ms=5, user="bob")
+        memory_logging._stop_file_listener()
+
+        entries = [json.loads(line) for line in (tmp_path / "cli-audit.log").read_text(encoding="utf-8").splitlines()]
+        assert [entry["user"] for entry in entries] == ["alice", "bob"]
+        getuser.assert_called_once()
+
+    def test_entries_are_compact_json(self, tmp_path):
+        """Test that entries use compact separators, keep non-ASCII text and stringify unknown values."""
+        audit = AuditLogger(tmp_path / "cli-audit.log")
+        audit.record(command="memory sync", args=["笔记", tmp_path], user="alice")
+        memory_logging._stop_file_listener()
+
+        line = (tmp_path / "cli-audit.log").read_text(encoding="utf-8").strip()
+        assert '"args":["笔记",' in line
+        assert json.loads(line)["args"] == ["笔记", str(tmp_path)]
+
+    def test_timestamp_has_millisecond_precision(self, tmp_path):
+        """Test that entries carry an ISO timestamp truncated to milliseconds."""
+        audit = AuditLogger(tmp_path / "cli-audit.log")
+        audit.record(command="memory info", args=[], user="alice")
+        memory_logging._stop_file_listener()
+
+        timestamp = json.loads((tmp_path / "cli-audit.log").read_text(encoding="utf-8"))["timestamp"]
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}\+00:00", timestamp)
+
+    def test_shares_listener_with_system_log(self, tmp_path):
+        """Test that audit and system logs are written by one listener, each to its own file."""
+        root_logger = logging.getLogger()
+        root_level, root_handlers = root_logger.level, root_logger.handlers[:]
+        try:
+            configure_logging(level="INFO", json_logs=True, log_dir=tmp_path)
+            audit = AuditLogger(tmp_path / "cli-audit.log")
+
+            assert memory_logging._file_listener.handlers == (memory_logging._file_handlers["system"], audit._handler)
+
+            structlog.get_logger("test").info("system_event")
+            audit.record(command="memory sync", args=["notes"], user="alice")
+            memory_logging._stop_file_listener()
+
+            system_log = (tmp_path / "system.log").read_text(encoding="utf-8")
+            audit_log = (tmp_path / "cli-audit.log").read_text(encoding="utf-8")
+            assert "system_event" in system_log and "memory sync" not in system_log
+            assert "memory sync" in audit_log and "system_event" not in audit_log
+        finally:
+            memory_logging._stop_file_listener()
+            root_logger.handlers[:] = root_handlers
+            root_logger.setLevel(root_level)
+
+
+class TestFileLoggerFactory:
+    """Test FileLoggerFactory."""
+
+    def test_handler_attached_once_per_logger(self, tmp_path):
+        """Test that repeated calls for one name do not duplicate the file handler."""
+        factory = FileLoggerFactory(tmp_path / "app.log")
+        try:
+            factory("memory.test.factory")
+            logger = factory("memory.test.factory")
+            logger.info("once")
+
+            assert logger.handlers.count(factory._handler) == 1
+            assert (tmp_path / "app.log").read_text(encoding="utf-8") == "once\n"
+        finally:
+            logger.removeHandler(factory._handler)
+            factory._handler.close()
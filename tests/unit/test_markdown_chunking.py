@@ -9,6 +9,7 @@ from memory.core.markdown_chunking import (
     chunk_markdown_document,
     parse_markdown_sections,
     smart_merge_chunks,
+    starts_with_h1,
 )
 from memory.entities import Document, DocumentType
 
@@ -347,5 +348,44 @@ class TestMarkdownChunking:
         assert chunks[0].document_id == document.id
 
 
+class TestStartsWithH1:
+    """Test detection of a leading level-1 heading."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "# Title\n\nBody",
+            "\n\n  # Title",
+            "\ufeff# Title",
+            "---\ntags: [a]\n---\n# Title",
+            "\ufeff---\r\ntitle: x\r\n---\r\n\n# Title",
+        ],
+    )
+    def test_detects_h1(self, content):
+        """Test that H1 headings are detected after BOM, front-matter and whitespace."""
+        assert starts_with_h1(content)
+
+    @pytest.mark.parametrize("content", ["", "Body", "## Subtitle", "#Title", "---\ntitle: x\n---\nBody"])
+    def test_rejects_non_h1(self, content):
+        """Test that content without a leading H1 is rejected."""
+        assert not starts_with_h1(content)
+
+    def test_front_matter_document_not_double_titled(self):
+        """Test that a titled document with front-matter keeps its own H1."""
+        document = Document(
+            id=uuid4(),
+            repository_id=uuid4(),
+            source_path="test.md",
+            doc_type=DocumentType.MARKDOWN,
+            title="Other",
+            content="---\ntags: [a]\n---\n# Real Title\n\n" + "Paragraph text. " * 30,
+        )
+
+        chunks = chunk_markdown_document(document, ChunkingConfig())
+
+        assert chunks
+        assert "# Other" not in chunks[0].content
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
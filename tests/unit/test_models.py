@@ -5,7 +5,7 @@ from uuid import UUID
 
 import pytest
 
-from memory.entities import Chunk, Document, DocumentType, Embedding, SearchResult
+from memory.entities import Chunk, Document, DocumentSummary, DocumentType, Embedding, SearchResult
 
 
 def test_document_creation():
@@ -41,6 +41,44 @@ def test_document_empty_content_fails():
         )
 
 
+def test_document_display_name():
+    """Test that the display name falls back to the source path."""
+    repository_id = UUID("12345678-1234-5678-1234-567812345678")
+    doc = Document(repository_id=repository_id, source_path="/path/to/doc.md", content="Text")
+
+    assert doc.display_name == "/path/to/doc.md"
+    doc.title = "Doc"
+    assert doc.display_name == "Doc"
+
+
+def test_document_from_trusted():
+    """Test building a document without validation still fills defaults and rejects empty content."""
+    repository_id = UUID("12345678-1234-5678-1234-567812345678")
+    doc = Document.from_trusted(repository_id=repository_id, source_path="/path/to/doc.md", doc_type=DocumentType.TEXT, content="Text")
+
+    assert isinstance(doc.id, UUID)
+    assert doc.metadata == {}
+    assert isinstance(doc.created_at, datetime)
+    assert doc == Document(**doc.model_dump())
+
+    with pytest.raises(ValueError, match="Document content cannot be empty"):
+        Document.from_trusted(repository_id=repository_id, source_path="/path/to/doc.md", content="  ")
+
+
+def test_document_summary_from_document():
+    """Test summarizing a document with a content preview."""
+    repository_id = UUID("12345678-1234-5678-1234-567812345678")
+    doc = Document(repository_id=repository_id, source_path="/path/to/doc.md", title="Doc", content="0123456789")
+
+    summary = DocumentSummary.from_document(doc, preview_chars=4)
+
+    assert summary.id == doc.id
+    assert summary.display_name == "Doc"
+    assert summary.content_length == 10
+    assert summary.content_preview == "0123"
+    assert DocumentSummary.from_document(doc, preview_chars=None).content_preview == doc.content
+
+
 def test_chunk_creation():
     """Test creating a valid chunk."""
     doc_id = UUID("12345678-1234-5678-1234-567812345678")
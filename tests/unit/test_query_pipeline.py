@@ -0,0 +1,67 @@
+"""Unit tests for QueryPipeline."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from memory.config.schema import AppConfig
+from memory.entities import Chunk, Document, DocumentType, Repository
+from memory.pipelines.query import QueryPipeline
+from memory.storage.base import StorageConfig
+from memory.storage.memory import InMemoryMetadataStore, InMemoryVectorStore
+from tests.unit.test_ingestion_pipeline import FakeEmbeddingProvider
+
+
+@pytest.mark.asyncio
+class TestQueryPipeline:
+    """Test QueryPipeline behaviour."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a query pipeline over empty in-memory stores."""
+        config = StorageConfig(storage_type="memory", collection_name="test")
+        provider = FakeEmbeddingProvider()
+        provider.embed_text = AsyncMock(wraps=provider.embed_text)
+        return QueryPipeline(
+            config=AppConfig(),
+            embedding_provider=provider,
+            llm_provider=MagicMock(),
+            vector_store=InMemoryVectorStore(config),
+            metadata_store=InMemoryMetadataStore(config),
+        )
+
+    async def test_repeated_query_reuses_embedding(self, pipeline):
+        """Test that a repeated query is embedded only once."""
+        await pipeline.search("what is memory?", use_hybrid=False)
+        await pipeline.search("  what is memory?\n", use_hybrid=False)
+
+        pipeline.embedding_provider.embed_text.assert_awaited_once_with("what is memory?")
+
+    async def test_least_recently_used_query_is_evicted(self, pipeline):
+        """Test that the cache drops the least recently used query once full."""
+        with patch("memory.pipelines.query.QUERY_CACHE_SIZE", 2):
+            await pipeline.search("first", use_hybrid=False)
+            await pipeline.search("second", use_hybrid=False)
+            await pipeline.search("first", use_hybrid=False)
+            await pipeline.search("third", use_hybrid=False)
+
+        assert [text for _, text in pipeline._query_vectors] == ["first", "third"]
+        assert pipeline.embedding_provider.embed_text.await_count == 3
+
+    async def test_search_fetches_documents_in_one_call(self, pipeline):
+        """Test that results are enriched with a single batch document lookup."""
+        repository = Repository(name="repo")
+        document = Document(repository_id=repository.id, source_path="/doc.md", doc_type=DocumentType.MARKDOWN, content="Alpha beta")
+        chunks = [
+            Chunk(repository_id=repository.id, document_id=document.id, content=text, chunk_index=i, start_char=0, end_char=5)
+            for i, text in enumerate(["Alpha", "beta"])
+        ]
+        await pipeline.metadata_store.add_document(document)
+        await pipeline.vector_store.add_vectors_batch(chunks, [[1.0, 0.0, 1.0], [0.0, 1.0, 1.0]], "fake-model")
+        pipeline.metadata_store.get_documents = AsyncMock(wraps=pipeline.metadata_store.get_documents)
+
+        results = await pipeline.search("Alpha", use_hybrid=False)
+
+        assert len(results) == 2
+        assert all(result.document.id == document.id for result in results)
+        pipeline.metadata_store.get_documents.assert_awaited_once()
@@ -65,8 +65,8 @@ class TestRepoClearCommand:
         )
 
         # Verify the command executed successfully
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -105,8 +105,8 @@ class TestRepoClearCommand:
 
         # Verify dry-run doesn't call clear_repository
         # The command should exit early without calling clear
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -137,8 +137,8 @@ class TestRepoClearCommand:
             )
 
         assert exc_info.value.exit_code == 1
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -168,8 +168,8 @@ class TestRepoClearCommand:
         )
 
         # Verify the command executed successfully
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
     @patch("memory.interfaces.cli._load_config")
     @patch("memory.interfaces.cli._ensure_default_repository")
@@ -197,8 +197,8 @@ class TestRepoClearCommand:
             )
 
         # Verify cleanup still happens
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -231,8 +231,8 @@ class TestRepoCreateCommand:
         )
 
         # Verify
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -267,15 +267,17 @@ class TestRepoListCommand:
             description="Repository 2",
         )
         metadata_store.list_repositories.return_value = [repo1, repo2]
-        metadata_store.list_documents.return_value = []
+        metadata_store.count_documents_by_repository.return_value = {repo1.id: 3}
 
         # Run command
         await _repo_list_async(config_file=None)
 
         # Verify
         metadata_store.list_repositories.assert_called_once()
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.count_documents_by_repository.assert_awaited_once()
+        metadata_store.list_documents.assert_not_called()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -305,16 +307,18 @@ class TestRepoInfoCommand:
             description="Test repository",
         )
         metadata_store.get_repository_by_name.return_value = repository
-        metadata_store.list_documents.return_value = []
-        vector_store.count.return_value = 0
+        metadata_store.count_documents.return_value = 2
+        metadata_store.count_chunks.return_value = 5
 
         # Run command
         await _repo_info_async(name="test-repo", config_file=None)
 
         # Verify
         metadata_store.get_repository_by_name.assert_called_once_with("test-repo")
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.count_chunks.assert_awaited_once_with(repository.id)
+        vector_store.count.assert_not_called()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -354,5 +358,5 @@ class TestRepoDeleteCommand:
 
         # Verify
         metadata_store.get_repository_by_name.assert_called_once_with("repo-to-delete")
-        metadata_store.close.assert_called_once()
-        vector_store.close.assert_called_once()
+        metadata_store.close.assert_not_called()
+        vector_store.close.assert_not_called()
@@ -1,5 +1,6 @@
 """Unit tests for SQLite storage implementations."""
 
+import asyncio
 import os
 import tempfile
 from uuid import uuid4
@@ -7,7 +8,7 @@ from uuid import uuid4
 import pytest
 
 from memory.entities import Chunk, Document, DocumentType, Repository
-from memory.storage.base import StorageConfig
+from memory.storage.base import StorageConfig, StorageError
 from memory.storage.sqlite import SQLiteMetadataStore
 
 
@@ -219,3 +220,470 @@ class TestSQLiteMetadataStore:
         # Verify document is deleted
         retrieved_doc = await store.get_document(doc.id)
         assert retrieved_doc is None
+
+    @pytest.mark.asyncio
+    async def test_get_chunk_counts(self, store):
+        """Test counting chunks for several documents at once."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+
+        docs = [
+            Document(
+                repository_id=repository.id,
+                source_path=f"/path/to/doc{i}.txt",
+                doc_type=DocumentType.TEXT,
+                title=f"Document {i}",
+                content=f"Content of document {i}",
+            )
+            for i in range(3)
+        ]
+        for doc in docs:
+            await store.add_document(doc)
+
+        for doc, chunk_count in zip(docs, [2, 1, 0]):
+            for i in range(chunk_count):
+                await store.add_chunk(
+                    Chunk(
+                        repository_id=repository.id,
+                        document_id=doc.id,
+                        content=f"Chunk {i} content",
+                        chunk_index=i,
+                        start_char=0,
+                        end_char=15,
+                    )
+                )
+
+        counts = await store.get_chunk_counts([doc.id for doc in docs])
+
+        assert counts == {docs[0].id: 2, docs[1].id: 1}
+        assert await store.get_chunk_counts([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_list_documents_search_sort_and_count(self, store):
+        """Test filtering, sorting and paginating documents in the store."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+
+        for title in ["beta notes", "Alpha Notes", "gamma", "100%_done"]:
+            await store.add_document(
+                Document(
+                    repository_id=repository.id,
+                    source_path=f"/path/to/{title}.md",
+                    doc_type=DocumentType.MARKDOWN,
+                    title=title,
+                    content=f"Content of {title}",
+                )
+            )
+
+        docs = await store.list_documents(repository_id=repository.id, sort="name", descending=False)
+        assert [doc.title for doc in docs] == ["100%_done", "Alpha Notes", "beta notes", "gamma"]
+
+        docs = await store.list_documents(repository_id=repository.id, search="NOTES", sort="name", descending=True)
+        assert [doc.title for doc in docs] == ["beta notes", "Alpha Notes"]
+
+        page = await store.list_documents(repository_id=repository.id, sort="name", descending=False, limit=2, offset=2)
+        assert [doc.title for doc in page] == ["beta notes", "gamma"]
+
+        assert await store.count_documents(repository_id=repository.id) == 4
+        assert await store.count_documents(repository_id=repository.id, search="notes") == 2
+        assert await store.count_documents(repository_id=repository.id, search="%_") == 1
+        assert await store.count_documents(repository_id=uuid4()) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_documents_by_names(self, store):
+        """Test resolving display names to documents in one call."""
+        repository = Repository(name="test-repo")
+        other = Repository(name="other-repo")
+        await store.add_repository(repository)
+        await store.add_repository(other)
+
+        titled = Document(repository_id=repository.id, source_path="/a.md", doc_type=DocumentType.MARKDOWN, title="a.md", content="A")
+        untitled = Document(repository_id=repository.id, source_path="/b.md", doc_type=DocumentType.MARKDOWN, content="B")
+        duplicate = Document(repository_id=repository.id, source_path="/x/a.md", doc_type=DocumentType.MARKDOWN, title="a.md", content="A2")
+        elsewhere = Document(repository_id=other.id, source_path="/a.md", doc_type=DocumentType.MARKDOWN, title="a.md", content="A3")
+        for doc in [titled, untitled, duplicate, elsewhere]:
+            await store.add_document(doc)
+
+        matches = await store.get_documents_by_names(repository.id, ["a.md", "/b.md", "missing"])
+
+        assert {doc.id for doc in matches["a.md"]} == {titled.id, duplicate.id}
+        assert [doc.id for doc in matches["/b.md"]] == [untitled.id]
+        assert "missing" not in matches
+        assert await store.get_documents_by_names(repository.id, []) == {}
+
+    @pytest.mark.asyncio
+    async def test_get_document_summary_and_chunk_sizes(self, store):
+        """Test reading a content preview and chunk sizes without full content."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+        doc = Document(
+            repository_id=repository.id,
+            source_path="/path/to/doc.txt",
+            doc_type=DocumentType.TEXT,
+            title="Document",
+            content="0123456789" * 3,
+        )
+        await store.add_document(doc)
+        for i, content in enumerate(["short", "a longer chunk"]):
+            await store.add_chunk(
+                Chunk(
+                    repository_id=repository.id,
+                    document_id=doc.id,
+                    content=content,
+                    chunk_index=i,
+                    start_char=0,
+                    end_char=len(content),
+                )
+            )
+
+        summary = await store.get_document_summary(doc.id, preview_chars=4)
+        assert summary.id == doc.id
+        assert summary.title == "Document"
+        assert summary.content_length == 30
+        assert summary.content_preview == "0123"
+
+        full = await store.get_document_summary(doc.id, preview_chars=None)
+        assert full.content_preview == doc.content
+
+        assert await store.get_document_summary(uuid4()) is None
+        assert await store.get_chunk_sizes(doc.id) == [5, 14]
+        assert await store.get_chunk_sizes(uuid4()) == []
+
+    @pytest.mark.asyncio
+    async def test_content_length_migration(self, temp_db):
+        """Test that content_length is added and backfilled on existing databases."""
+        import sqlite3
+
+        conn = sqlite3.connect(temp_db)
+        conn.executescript("""
+            CREATE TABLE documents (
+                id TEXT PRIMARY KEY, repository_id TEXT NOT NULL, source_path TEXT NOT NULL,
+                relative_path TEXT NOT NULL DEFAULT '', doc_type TEXT NOT NULL, title TEXT,
+                content TEXT NOT NULL, content_md5 TEXT, metadata TEXT NOT NULL,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+            );
+            CREATE TABLE chunks (
+                id TEXT PRIMARY KEY, repository_id TEXT NOT NULL, document_id TEXT NOT NULL,
+                content TEXT NOT NULL, chunk_index INTEGER NOT NULL, start_char INTEGER NOT NULL,
+                end_char INTEGER NOT NULL, metadata TEXT NOT NULL, created_at TEXT NOT NULL
+            );
+            INSERT INTO documents VALUES ('d1', 'r1', '/a.md', 'a.md', 'text', 'A', 'héllo', NULL, '{}',
+                '2024-01-01T00:00:00', '2024-01-01T00:00:00');
+            INSERT INTO chunks VALUES ('c1', 'r1', 'd1', 'héllo', 0, 0, 5, '{}', '2024-01-01T00:00:00');
+        """)
+        conn.close()
+
+        store = SQLiteMetadataStore(
+            StorageConfig(storage_type="sqlite", connection_string=temp_db, collection_name="test")
+        )
+        await store.initialize()
+        try:
+            cursor = await store.connection.execute("SELECT content_length FROM documents")
+            assert (await cursor.fetchone())[0] == 5
+            cursor = await store.connection.execute("SELECT content_length FROM chunks")
+            assert (await cursor.fetchone())[0] == 5
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_list_document_summaries(self, store):
+        """Test listing summaries with the same filters as list_documents."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+        for title in ["Beta", "alpha", "Gamma"]:
+            await store.add_document(
+                Document(
+                    repository_id=repository.id,
+                    source_path=f"/path/to/{title}.txt",
+                    doc_type=DocumentType.TEXT,
+                    title=title,
+                    content=f"Content of {title}",
+                )
+            )
+
+        summaries = await store.list_document_summaries(
+            limit=2, repository_id=repository.id, sort="name", descending=False
+        )
+
+        assert [summary.title for summary in summaries] == ["alpha", "Beta"]
+        assert summaries[0].content_length == len("Content of alpha")
+        assert summaries[0].content_preview == ""
+
+        searched = await store.list_document_summaries(repository_id=repository.id, search="amm", preview_chars=7)
+        assert [(summary.title, summary.content_preview) for summary in searched] == [("Gamma", "Content")]
+
+    @pytest.mark.asyncio
+    async def test_delete_documents(self, store):
+        """Test deleting several documents and their chunks at once."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+
+        docs = [
+            Document(
+                repository_id=repository.id,
+                source_path=f"/path/to/doc{i}.txt",
+                doc_type=DocumentType.TEXT,
+                title=f"Document {i}",
+                content=f"Content of document {i}",
+            )
+            for i in range(3)
+        ]
+        for doc in docs:
+            await store.add_document(doc)
+            await store.add_chunk(
+                Chunk(
+                    repository_id=repository.id,
+                    document_id=doc.id,
+                    content="Chunk content",
+                    chunk_index=0,
+                    start_char=0,
+                    end_char=13,
+                )
+            )
+
+        missing_id = uuid4()
+        deleted = await store.delete_documents([docs[0].id, docs[2].id, missing_id])
+
+        assert deleted == {docs[0].id, docs[2].id}
+        assert await store.get_document(docs[0].id) is None
+        assert await store.get_document(docs[1].id) is not None
+        assert await store.get_chunk_counts([doc.id for doc in docs]) == {docs[1].id: 1}
+        assert await store.delete_documents([]) == set()
+
+    async def test_count_documents_by_repository(self, store):
+        """Test counting documents for every repository at once."""
+        repositories = [Repository(name=f"repo-{i}") for i in range(3)]
+        for repository in repositories:
+            await store.add_repository(repository)
+
+        for repository, document_count in zip(repositories, [2, 1, 0]):
+            for i in range(document_count):
+                await store.add_document(
+                    Document(
+                        repository_id=repository.id,
+                        source_path=f"/path/to/{repository.name}/doc{i}.txt",
+                        doc_type=DocumentType.TEXT,
+                        title=f"Document {i}",
+                        content=f"Content of document {i}",
+                    )
+                )
+
+        counts = await store.count_documents_by_repository()
+
+        assert counts == {repositories[0].id: 2, repositories[1].id: 1}
+
+    async def test_count_chunks(self, store):
+        """Test counting the chunks of one repository."""
+        repositories = [Repository(name=f"repo-{i}") for i in range(2)]
+        for repository in repositories:
+            await store.add_repository(repository)
+
+        for repository, chunk_count in zip(repositories, [3, 1]):
+            doc = Document(
+                repository_id=repository.id,
+                source_path=f"/path/to/{repository.name}.txt",
+                doc_type=DocumentType.TEXT,
+                title=repository.name,
+                content="Content",
+            )
+            await store.add_document(doc)
+            for i in range(chunk_count):
+                await store.add_chunk(
+                    Chunk(
+                        repository_id=repository.id,
+                        document_id=doc.id,
+                        content=f"Chunk {i} content",
+                        chunk_index=i,
+                        start_char=0,
+                        end_char=10,
+                    )
+                )
+
+        assert await store.count_chunks(repositories[0].id) == 3
+        assert await store.count_chunks(repositories[1].id) == 1
+
+    async def test_get_document_by_source_path(self, store):
+        """Test looking up a document by repository and source path."""
+        repositories = [Repository(name=f"repo-{i}") for i in range(2)]
+        for repository in repositories:
+            await store.add_repository(repository)
+
+        docs = [
+            Document(
+                repository_id=repository.id,
+                source_path="/path/to/doc.txt",
+                doc_type=DocumentType.TEXT,
+                title=repository.name,
+                content=f"Content in {repository.name}",
+            )
+            for repository in repositories
+        ]
+        for doc in docs:
+            await store.add_document(doc)
+
+        found = await store.get_document_by_source_path(repositories[1].id, "/path/to/doc.txt")
+
+        assert found is not None
+        assert found.id == docs[1].id
+        assert await store.get_document_by_source_path(repositories[0].id, "/path/to/other.txt") is None
+
+    async def test_add_chunks(self, store):
+        """Test storing several chunks at once."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+        doc = Document(
+            repository_id=repository.id,
+            source_path="/path/to/doc.txt",
+            doc_type=DocumentType.TEXT,
+            title="Document",
+            content="Content",
+        )
+        await store.add_document(doc)
+
+        chunks = [
+            Chunk(
+                repository_id=repository.id,
+                document_id=doc.id,
+                content=f"Chunk {i} content",
+                chunk_index=i,
+                start_char=0,
+                end_char=10,
+            )
+            for i in range(3)
+        ]
+        await store.add_chunks(chunks)
+        await store.add_chunks([])
+
+        stored = await store.get_chunks_by_document(doc.id)
+        assert [chunk.id for chunk in stored] == [chunk.id for chunk in chunks]
+
+    async def test_get_documents_by_source_paths(self, store):
+        """Test looking up several documents of a repository by source path."""
+        repositories = [Repository(name=f"repo-{i}") for i in range(2)]
+        for repository in repositories:
+            await store.add_repository(repository)
+
+        docs = [
+            Document(
+                repository_id=repository.id,
+                source_path=path,
+                doc_type=DocumentType.TEXT,
+                title=path,
+                content=f"Content of {path}",
+            )
+            for repository in repositories
+            for path in ("/path/a.txt", "/path/b.txt")
+        ]
+        for doc in docs:
+            await store.add_document(doc)
+
+        found = await store.get_documents_by_source_paths(repositories[1].id, ["/path/a.txt", "/path/missing.txt"])
+
+        assert {path: doc.id for path, doc in found.items()} == {"/path/a.txt": docs[2].id}
+        assert await store.get_documents_by_source_paths(repositories[0].id, []) == {}
+
+    async def test_transaction_commits_writes_together(self, store):
+        """Test that writes inside a transaction are kept when it completes."""
+        repository = Repository(name="repo")
+        await store.add_repository(repository)
+        doc = Document(
+            repository_id=repository.id,
+            source_path="/path/to/doc.txt",
+            doc_type=DocumentType.TEXT,
+            content="Content",
+        )
+        chunk = Chunk(
+            repository_id=repository.id,
+            document_id=doc.id,
+            content="Content",
+            chunk_index=0,
+            start_char=0,
+            end_char=7,
+        )
+
+        async with store.transaction():
+            await store.add_document(doc)
+            async with store.transaction():
+                await store.add_chunks([chunk])
+
+        assert await store.get_document(doc.id) is not None
+        assert await store.count_chunks(repository.id) == 1
+
+    async def test_transaction_rolls_back_on_error(self, store):
+        """Test that a failed transaction discards every write made inside it."""
+        repository = Repository(name="repo")
+        await store.add_repository(repository)
+        kept = Document(repository_id=repository.id, source_path="/kept.txt", doc_type=DocumentType.TEXT, content="Kept")
+        await store.add_document(kept)
+        added = Document(repository_id=repository.id, source_path="/added.txt", doc_type=DocumentType.TEXT, content="Added")
+
+        with pytest.raises(RuntimeError):
+            async with store.transaction():
+                await store.delete_document(kept.id)
+                await store.add_document(added)
+                raise RuntimeError("ingestion failed")
+
+        assert await store.get_document(kept.id) is not None
+        assert await store.get_document(added.id) is None
+
+    async def test_get_documents(self, store):
+        """Test retrieving several documents by ID at once."""
+        repository = Repository(name="repo")
+        await store.add_repository(repository)
+        docs = [
+            Document(repository_id=repository.id, source_path=f"/doc{i}.txt", doc_type=DocumentType.TEXT, content=f"Content {i}")
+            for i in range(3)
+        ]
+        for doc in docs:
+            await store.add_document(doc)
+
+        found = await store.get_documents([docs[0].id, docs[2].id, docs[0].id, uuid4()])
+
+        assert {document_id: doc.content for document_id, doc in found.items()} == {
+            docs[0].id: "Content 0",
+            docs[2].id: "Content 2",
+        }
+        assert await store.get_documents([]) == {}
+
+    async def test_other_task_write_waits_for_transaction(self, store):
+        """Test that another task's write is not swept into a transaction that rolls back."""
+        repository = Repository(name="repo")
+        await store.add_repository(repository)
+        inside = Document(repository_id=repository.id, source_path="/inside.txt", doc_type=DocumentType.TEXT, content="Inside")
+        outside = Document(repository_id=repository.id, source_path="/outside.txt", doc_type=DocumentType.TEXT, content="Outside")
+
+        async def failing_transaction():
+            async with store.transaction():
+                await store.add_document(inside)
+                # Let the other task try to write while the transaction is open
+                await asyncio.sleep(0.01)
+                raise RuntimeError("ingestion failed")
+
+        results = await asyncio.gather(failing_transaction(), store.add_document(outside), return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert await store.get_document(inside.id) is None
+        assert await store.get_document(outside.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_list_documents_sorts_untitled_by_source_path(self, store):
+        """Test that sorting by name uses the display name, and unknown sort fields are rejected."""
+        repository = Repository(name="test-repo")
+        await store.add_repository(repository)
+
+        for title, source_path in [("zeta", "/z.md"), (None, "notes/Delta.md"), ("alpha", "/a.md")]:
+            await store.add_document(
+                Document(
+                    repository_id=repository.id,
+                    source_path=source_path,
+                    doc_type=DocumentType.MARKDOWN,
+                    title=title,
+                    content="Content",
+                )
+            )
+
+        docs = await store.list_documents(repository_id=repository.id, sort="name", descending=False)
+        assert [doc.display_name for doc in docs] == ["alpha", "notes/Delta.md", "zeta"]
+
+        with pytest.raises(StorageError, match="Invalid sort field"):
+            await store.list_documents(repository_id=repository.id, sort="title")
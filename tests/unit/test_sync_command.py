@@ -0,0 +1,167 @@
+"""Unit tests for the sync CLI command."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from memory.config.schema import AppConfig
+from memory.entities import Repository
+from memory.interfaces.cli import _sync_async
+from memory.storage.base import StorageConfig
+from memory.storage.memory import InMemoryMetadataStore, InMemoryVectorStore
+from tests.unit.test_ingestion_pipeline import FakeEmbeddingProvider
+
+
+@pytest.mark.asyncio
+class TestSyncCommand:
+    """Test sync command against in-memory stores."""
+
+    @pytest.fixture
+    async def stores(self):
+        """Create initialized in-memory stores that survive sync closing them."""
+        config = StorageConfig(storage_type="memory", collection_name="test")
+        metadata_store = InMemoryMetadataStore(config)
+        vector_store = InMemoryVectorStore(config)
+        await metadata_store.initialize()
+        await vector_store.initialize()
+        # In-memory stores drop their data on close, which sync calls when it finishes
+        metadata_store.close = AsyncMock()
+        vector_store.close = AsyncMock()
+        return metadata_store, vector_store
+
+    @pytest.fixture
+    async def repository(self, stores, tmp_path):
+        """Create a repository rooted at a temporary directory."""
+        metadata_store, _ = stores
+        repository = Repository(name="notes", root_path=tmp_path, document_types=["md"])
+        await metadata_store.add_repository(repository)
+        return repository
+
+    async def run_sync(self, stores, force: bool = False, provider: FakeEmbeddingProvider | None = None, config: AppConfig | None = None):
+        metadata_store, vector_store = stores
+        with (
+            patch("memory.interfaces.cli._load_config", return_value=config or AppConfig()),
+            patch("memory.interfaces.cli._ensure_default_repository", return_value=(metadata_store, vector_store, None)),
+            patch("memory.providers.create_embedding_provider", return_value=provider or FakeEmbeddingProvider()),
+        ):
+            await _sync_async("notes", None, force, quiet=True)
+
+    async def test_sync_adds_updates_and_deletes(self, stores, repository, tmp_path):
+        """Test that sync tracks added, changed and removed files."""
+        metadata_store, vector_store = stores
+        (tmp_path / "a.md").write_text("Alpha content", encoding="utf-8")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.md").write_text("Beta content", encoding="utf-8")
+        (tmp_path / "image.png").write_bytes(b"\x89PNG\r\n")
+
+        await self.run_sync(stores)
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert sorted(doc.relative_path for doc in documents) == ["a.md", "sub/b.md"]
+        assert await vector_store.count() > 0
+
+        (tmp_path / "a.md").write_text("Alpha content changed", encoding="utf-8")
+        (tmp_path / "sub" / "b.md").unlink()
+        await self.run_sync(stores)
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert [doc.relative_path for doc in documents] == ["a.md"]
+        assert "Alpha content changed" in documents[0].content
+
+    async def test_sync_skips_unchanged_files(self, stores, repository, tmp_path):
+        """Test that unchanged files keep their stored document."""
+        metadata_store, _ = stores
+        (tmp_path / "a.md").write_text("Alpha content", encoding="utf-8")
+
+        await self.run_sync(stores)
+        first = await metadata_store.list_documents(repository_id=repository.id)
+        await self.run_sync(stores)
+        second = await metadata_store.list_documents(repository_id=repository.id)
+
+        assert len(first) == 1
+        assert [doc.id for doc in first] == [doc.id for doc in second]
+
+    async def test_sync_isolates_failed_file_in_batch(self, stores, repository, tmp_path):
+        """Test that a file that fails to embed does not fail the rest of its batch."""
+        metadata_store, _ = stores
+        (tmp_path / "good.md").write_text("Good content", encoding="utf-8")
+        (tmp_path / "bad.md").write_text("Bad content", encoding="utf-8")
+
+        provider = FakeEmbeddingProvider()
+        embed_batch = provider.embed_batch
+
+        async def failing_embed_batch(texts):
+            if any("Bad content" in text for text in texts):
+                raise RuntimeError("provider rejected input")
+            return await embed_batch(texts)
+
+        provider.embed_batch = failing_embed_batch
+        await self.run_sync(stores, provider=provider)
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert [doc.relative_path for doc in documents] == ["good.md"]
+
+    async def test_sync_ingests_batches_concurrently(self, stores, repository, tmp_path):
+        """Test that several ingest workers embed batches at the same time."""
+        metadata_store, _ = stores
+        for i in range(6):
+            (tmp_path / f"note{i}.md").write_text(f"Note {i} content", encoding="utf-8")
+
+        provider = FakeEmbeddingProvider()
+        embed_batch = provider.embed_batch
+        active = peak = 0
+
+        async def slow_embed_batch(texts):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return await embed_batch(texts)
+
+        provider.embed_batch = slow_embed_batch
+        config = AppConfig(ingest_batch_size=1, ingest_concurrency=3)
+        await self.run_sync(stores, provider=provider, config=config)
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert len(documents) == 6
+        assert peak > 1
+
+    async def test_sync_failed_vector_write_keeps_file_for_next_sync(self, stores, repository, tmp_path):
+        """Test that a file whose vectors fail to store keeps its old version and is retried next sync."""
+        metadata_store, vector_store = stores
+        (tmp_path / "a.md").write_text("Alpha content", encoding="utf-8")
+        await self.run_sync(stores)
+        original = await metadata_store.list_documents(repository_id=repository.id)
+        vector_count = await vector_store.count()
+
+        (tmp_path / "a.md").write_text("Alpha content changed", encoding="utf-8")
+        add_vectors_batch = vector_store.add_vectors_batch
+        vector_store.add_vectors_batch = AsyncMock(side_effect=RuntimeError("vector store down"))
+        await self.run_sync(stores)
+        vector_store.add_vectors_batch = add_vectors_batch
+
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert [doc.id for doc in documents] == [doc.id for doc in original]
+        assert await vector_store.count() == vector_count
+
+        await self.run_sync(stores)
+        documents = await metadata_store.list_documents(repository_id=repository.id)
+        assert len(documents) == 1
+        assert "Alpha content changed" in documents[0].content
+        assert await vector_store.count() == vector_count
+
+    async def test_sync_honors_configured_types_outside_text_extensions(self, stores, repository, tmp_path):
+        """Test that configured types missing from TEXT_EXTS are synced and kept on re-sync."""
+        metadata_store, _ = stores
+        repository.document_types = ["md", "mdx"]
+        (tmp_path / "a.md").write_text("Alpha content", encoding="utf-8")
+        (tmp_path / "page.mdx").write_text("Page content", encoding="utf-8")
+
+        await self.run_sync(stores)
+        first = await metadata_store.list_documents(repository_id=repository.id)
+        await self.run_sync(stores)
+        second = await metadata_store.list_documents(repository_id=repository.id)
+
+        assert sorted(doc.relative_path for doc in first) == ["a.md", "page.mdx"]
+        assert sorted(doc.id for doc in second) == sorted(doc.id for doc in first)